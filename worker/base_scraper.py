@@ -5,6 +5,9 @@ from playwright_stealth import Stealth  # type: ignore
 from playwright.async_api import Browser, BrowserContext, Page, Route, Request
 from typing import Optional, List, Tuple, Dict, Any
 from worker.constants import PROXIES, MEDIA_EXTENSIONS, BLOCKED_ADS, USER_AGENTS
+from worker.core.page_processing.constants import READINESS_INIT_SCRIPT
+from worker.core.storage_state_cache.storage_state_cache import StorageStateCache
+from worker.core.script_allowlist.script_allowlist import ScriptAllowlist
 
 class BaseScraper:
     """Common functionality shared by all scrapers."""
@@ -20,6 +23,13 @@ class BaseScraper:
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
+        # Sites whose saved cookies / localStorage new contexts start from (consent walls)
+        self.storage_state_urls: List[str] = []
+        self.storage_state_cache = StorageStateCache(session_logger)
+
+        # Third-party scripts blocked per site, inactive unless a scraper starts it
+        self.script_allowlist = ScriptAllowlist(session_logger)
+
     async def create_page(self) -> Page:
         """Create and return a new page within the current browser context."""
         assert self.context is not None, "Context not initialized"
@@ -59,7 +69,7 @@ class BaseScraper:
         route: Route,
         request: Request,
     ):
-        """Intercept and block unwanted requests (media + ads)."""
+        """Intercept and block unwanted requests (media + ads + third-party scripts not needed)."""
         url = request.url
         hostname = ""
 
@@ -78,6 +88,11 @@ class BaseScraper:
             self.session_logger.debug(f"🛑 Blocked ad/tracker: {hostname}")
             return route.abort()
 
+        # Block third-party scripts outside the learned allowlist of the site
+        if request.resource_type == "script" and self.script_allowlist.should_block(request):
+            self.session_logger.debug(f"Blocked third-party script: {url}")
+            return route.abort()
+
         return route.continue_()
 
     async def create_context_with_proxy(self) -> BrowserContext:
@@ -93,9 +108,16 @@ class BaseScraper:
         if proxy:
             context_options["proxy"] = proxy
 
+        storage_state = await self.storage_state_cache.load(self.storage_state_urls)
+        if storage_state:
+            context_options["storage_state"] = storage_state
+
         context = await self.browser.new_context(**context_options)
         stealth = Stealth()
         await stealth.apply_stealth_async(context)
+
+        # Lets wait_for_page_ready see DOM mutations and requests from the first script on
+        await context.add_init_script(READINESS_INIT_SCRIPT)
     
         await context.route(
             "**/*",
@@ -2,5 +2,24 @@ from worker.constants.proxies import PROXIES
 from worker.constants.media_extensions import MEDIA_EXTENSIONS
 from worker.constants.blocked_ads import BLOCKED_ADS
 from worker.constants.user_agents import USER_AGENTS
+from worker.constants.url_params import (
+    TRACKING_PARAM_PREFIXES,
+    TRACKING_PARAMS,
+    SESSION_PARAMS,
+    HOST_KEEP_PARAMS,
+    AMBIGUOUS_PARAMS,
+)
+from worker.constants.domain_suffixes import MULTI_PART_SUFFIXES
 
-__all__ = ["PROXIES", "MEDIA_EXTENSIONS", "BLOCKED_ADS", "USER_AGENTS"]
\ No newline at end of file
+__all__ = [
+    "PROXIES",
+    "MEDIA_EXTENSIONS",
+    "BLOCKED_ADS",
+    "USER_AGENTS",
+    "TRACKING_PARAM_PREFIXES",
+    "TRACKING_PARAMS",
+    "SESSION_PARAMS",
+    "HOST_KEEP_PARAMS",
+    "AMBIGUOUS_PARAMS",
+    "MULTI_PART_SUFFIXES",
+]
\ No newline at end of file
@@ -0,0 +1,11 @@
+# Public suffixes of more than one label (registrable domain = one label more)
+MULTI_PART_SUFFIXES = {
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "ltd.uk", "plc.uk", "me.uk",
+    "com.au", "net.au", "org.au", "edu.au", "gov.au",
+    "co.nz", "org.nz", "co.za", "org.za",
+    "co.jp", "ne.jp", "or.jp", "co.kr", "or.kr",
+    "com.br", "com.mx", "com.ar", "com.co", "com.tr", "com.cn", "com.hk",
+    "com.sg", "com.tw", "com.my", "co.in", "co.il", "co.id", "co.th",
+    "gv.at", "or.at", "ac.at", "co.at",
+    "asso.fr", "gouv.fr",
+}
@@ -0,0 +1,52 @@
+# Query parameters dropped by canonicalize_url (compared lowercased)
+TRACKING_PARAM_PREFIXES = ["utm_", "pk_", "mtm_", "hsa_", "_hs"]
+
+TRACKING_PARAMS = [
+    "gclid",
+    "gclsrc",
+    "dclid",
+    "gbraid",
+    "wbraid",
+    "fbclid",
+    "msclkid",
+    "yclid",
+    "twclid",
+    "ttclid",
+    "li_fat_id",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "mkt_tok",
+    "_ga",
+    "_gl",
+    "trk",
+    "trkinfo",
+    "ref",
+    "referrer",
+    "source",
+    "src",
+    "gh_src",
+    "lever-source",
+    "lever-origin",
+]
+
+SESSION_PARAMS = [
+    "jsessionid",
+    "phpsessid",
+    "aspsessionid",
+    "sessionid",
+    "session_id",
+    "sid",
+    "cfid",
+    "cftoken",
+]
+
+# Tracking on most sites, but may identify the posting on a job board
+# (e.g. view?ref=123): kept in job URLs (see canonicalize_job_url)
+AMBIGUOUS_PARAMS = ["ref", "referrer", "source", "src", "trk", "trkinfo"]
+
+# Hosts (or parent domains) where some of the parameters above identify the page
+HOST_KEEP_PARAMS = {
+    "github.com": ["ref"],  # Branch / tag
+    "gitlab.com": ["ref"],
+}
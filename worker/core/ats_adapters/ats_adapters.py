@@ -0,0 +1,711 @@
+import asyncio
+import aiohttp
+
+from abc import ABC, abstractmethod
+from lxml import etree
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+from worker.types.worker_types import AtsBoard, Job
+from worker.utils.http_utils import create_http_session
+from worker.utils.job_utils import (
+    normalize_contract_type,
+    split_location,
+    country_name_from_code,
+)
+from worker.core.crawl_frontier.constants import LANG_PATTERN
+from worker.core.cpu_executor.cpu_executor import cpu_executor
+from worker.core.cpu_executor.cpu_tasks import extract_embed_srcs, html_fragments_to_text
+from worker.core.ats_adapters.constants import (
+    GREENHOUSE_HOST_PATTERN,
+    GREENHOUSE_CONTRACT_FIELD_PATTERN,
+    LEVER_HOST_PATTERN,
+    WORKABLE_HOST_PATTERN,
+    SMARTRECRUITERS_HOST_PATTERN,
+    PERSONIO_HOST_PATTERN,
+    RECRUITEE_HOST_PATTERN,
+    WORKDAY_HOST_PATTERN,
+    BOARD_TOKEN_PATTERN,
+    RESERVED_SUBDOMAINS,
+    GREENHOUSE_JOBS_API,
+    LEVER_POSTINGS_API,
+    WORKABLE_JOBS_API,
+    SMARTRECRUITERS_POSTINGS_API,
+    SMARTRECRUITERS_POSTING_API,
+    SMARTRECRUITERS_JOB_URL,
+    PERSONIO_FEED,
+    PERSONIO_JOB_URL,
+    RECRUITEE_OFFERS_API,
+    WORKDAY_JOBS_API,
+    WORKDAY_JOB_API,
+    WORKDAY_JOB_URL,
+    LEVER_PAGE_SIZE,
+    SMARTRECRUITERS_PAGE_SIZE,
+    WORKDAY_PAGE_SIZE,
+    MAX_JOBS_PER_BOARD,
+    MAX_CONCURRENT_DETAILS,
+    MAX_RESPONSE_BYTES,
+    REQUEST_TIMEOUT,
+)
+
+
+def first_path_segment(path: str) -> Optional[str]:
+    """Return the first non-empty path segment if it looks like a board token."""
+    for part in path.strip("/").split("/"):
+        if part:
+            return part if BOARD_TOKEN_PATTERN.fullmatch(part) else None
+    return None
+
+
+def make_job(
+    job_title: Optional[str],
+    job_url: Optional[str],
+    job_description: Optional[str] = None,
+    location_country: Optional[str] = None,
+    location_region: Optional[str] = None,
+    contract_type: Optional[str] = None,
+) -> Optional[Job]:
+    """Build a Job from ATS fields, or None when the title or URL is missing."""
+    if not job_title or not job_url:
+        return None
+
+    return {
+        "job_title": job_title.strip(),
+        "job_url": job_url,
+        "job_description": job_description,
+        "location_country": location_country,
+        "location_region": location_region,
+        "contract_type": contract_type,
+        "hash_job_description_page": None,
+    }
+
+
+class AtsAdapter(ABC):
+    """
+    Base class of an ATS adapter: recognises the ATS board from a URL and
+    reads its public feed into Job records.
+    """
+
+    name = ""
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+
+    @abstractmethod
+    def detect(self, url: str) -> Optional[AtsBoard]:
+        """Return the board hosted at this URL, or None if it is not this ATS."""
+
+    @abstractmethod
+    async def fetch_jobs(
+        self, session: aiohttp.ClientSession, board: AtsBoard
+    ) -> List[Job]:
+        """Return every job published on the board."""
+
+    @staticmethod
+    async def get_json(
+        session: aiohttp.ClientSession,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """GET (or POST when a payload is given) a JSON endpoint, raising on HTTP errors."""
+        method = session.post if payload is not None else session.get
+        async with method(
+            url, json=payload, headers={"Accept": "application/json"}
+        ) as response:
+            response.raise_for_status()
+            if response.content_length and response.content_length > MAX_RESPONSE_BYTES:
+                raise ValueError(f"Response too large ({response.content_length} bytes)")
+            return await response.json(content_type=None)
+
+    @staticmethod
+    async def html_to_texts(fragments: List[Optional[str]]) -> List[Optional[str]]:
+        """Plain text of HTML descriptions, converted together off the event loop."""
+        if not any(fragments):
+            return [None] * len(fragments)
+
+        return await cpu_executor.run_in_process(html_fragments_to_text, fragments)
+
+    async def gather_details(self, coroutines: List[Any]) -> List[Any]:
+        """Run detail requests with bounded concurrency, None for the failed ones."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DETAILS)
+
+        async def run(coroutine: Any) -> Any:
+            async with semaphore:
+                try:
+                    return await coroutine
+                except Exception as e:
+                    self.session_logger.info(f"[ATS] {self.name} detail request failed: {e}")
+                    return None
+
+        return await asyncio.gather(*(run(c) for c in coroutines))
+
+
+class GreenhouseAdapter(AtsAdapter):
+    """boards.greenhouse.io/{token} (hosted or embedded board)."""
+
+    name = "greenhouse"
+
+    def detect(self, url: str) -> Optional[AtsBoard]:
+        parsed = urlparse(url)
+        if not GREENHOUSE_HOST_PATTERN.fullmatch(parsed.netloc.lower()):
+            return None
+
+        # Embedded boards: /embed/job_board?for={token} or /embed/job_board/js?for={token}
+        token = parse_qs(parsed.query).get("for", [None])[0]
+        if not token and not parsed.path.startswith("/embed"):
+            token = first_path_segment(parsed.path)
+
+        if not token or not BOARD_TOKEN_PATTERN.fullmatch(token):
+            return None
+
+        return {"ats": self.name, "token": token, "host": parsed.netloc.lower()}
+
+    async def fetch_jobs(
+        self, session: aiohttp.ClientSession, board: AtsBoard
+    ) -> List[Job]:
+        data = await self.get_json(session, GREENHOUSE_JOBS_API.format(token=board["token"]))
+
+        postings = data.get("jobs") or []
+        descriptions = await self.html_to_texts([posting.get("content") for posting in postings])
+
+        jobs: List[Job] = []
+        for posting, description in zip(postings, descriptions):
+            location = (posting.get("location") or {}).get("name")
+            country, region = split_location(location)
+
+            # Greenhouse has no employment type field, it is often a custom metadata entry
+            contract_type = None
+            for metadata in posting.get("metadata") or []:
+                name = metadata.get("name")
+                if not isinstance(name, str) or not GREENHOUSE_CONTRACT_FIELD_PATTERN.search(name):
+                    continue
+
+                value = metadata.get("value")
+                if isinstance(value, list):  # Multi-select fields
+                    value = " ".join(v for v in value if isinstance(v, str))
+
+                if isinstance(value, str) and (contract_type := normalize_contract_type(value)):
+                    break
+
+            job = make_job(
+                job_title=posting.get("title"),
+                job_url=posting.get("absolute_url"),
+                job_description=description,
+                location_country=country,
+                location_region=region,
+                contract_type=contract_type,
+            )
+            if job:
+                jobs.append(job)
+
+        return jobs
+
+
+class LeverAdapter(AtsAdapter):
+    """jobs.lever.co/{token} (or jobs.eu.lever.co for EU hosted accounts)."""
+
+    name = "lever"
+
+    def detect(self, url: str) -> Optional[AtsBoard]:
+        parsed = urlparse(url)
+        if not LEVER_HOST_PATTERN.fullmatch(parsed.netloc.lower()):
+            return None
+
+        token = first_path_segment(parsed.path)
+        if not token:
+            return None
+
+        return {"ats": self.name, "token": token, "host": parsed.netloc.lower()}
+
+    async def fetch_jobs(
+        self, session: aiohttp.ClientSession, board: AtsBoard
+    ) -> List[Job]:
+        match = LEVER_HOST_PATTERN.fullmatch(board["host"])
+        region = match.group(1) if match and match.group(1) else ""
+
+        jobs: List[Job] = []
+        skip = 0
+
+        while len(jobs) < MAX_JOBS_PER_BOARD:
+            postings = await self.get_json(
+                session,
+                LEVER_POSTINGS_API.format(
+                    region=region, token=board["token"], skip=skip, limit=LEVER_PAGE_SIZE
+                ),
+            )
+            if not isinstance(postings, list) or not postings:
+                break
+
+            # Every HTML fragment of the page at once: descriptions first, then list contents
+            texts = await self.html_to_texts(
+                [None if p.get("descriptionPlain") else p.get("description") for p in postings]
+                + [item.get("content") for p in postings for item in p.get("lists") or []]
+            )
+            list_texts = iter(texts[len(postings) :])
+
+            for posting, description in zip(postings, texts):
+                categories = posting.get("categories") or {}
+
+                sections = [posting.get("descriptionPlain") or description]
+                for item in posting.get("lists") or []:
+                    sections.append(item.get("text"))
+                    sections.append(next(list_texts))
+                sections.append(posting.get("additionalPlain"))
+
+                country = country_name_from_code(posting.get("country"))
+                if not country:
+                    country, _ = split_location(categories.get("location"))
+
+                job = make_job(
+                    job_title=posting.get("text"),
+                    job_url=posting.get("hostedUrl"),
+                    job_description="\n".join(s for s in sections if s) or None,
+                    location_country=country,
+                    contract_type=normalize_contract_type(categories.get("commitment"))
+                    or ("remote" if posting.get("workplaceType") == "remote" else None),
+                )
+                if job:
+                    jobs.append(job)
+
+            if len(postings) < LEVER_PAGE_SIZE:
+                break
+            skip += LEVER_PAGE_SIZE
+
+        return jobs
+
+
+class WorkableAdapter(AtsAdapter):
+    """apply.workable.com/{token} (or the legacy {token}.workable.com)."""
+
+    name = "workable"
+
+    def detect(self, url: str) -> Optional[AtsBoard]:
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        match = WORKABLE_HOST_PATTERN.fullmatch(host)
+        if not match:
+            return None
+
+        token = match.group(1) if match.group(1) not in (None, *RESERVED_SUBDOMAINS) else None
+        if host == "apply.workable.com":
+            token = first_path_segment(parsed.path)
+            if token in ("api", "j"):
+                return None
+
+        if not token:
+            return None
+
+        return {"ats": self.name, "token": token, "host": host}
+
+    async def fetch_jobs(
+        self, session: aiohttp.ClientSession, board: AtsBoard
+    ) -> List[Job]:
+        data = await self.get_json(session, WORKABLE_JOBS_API.format(token=board["token"]))
+
+        postings = data.get("jobs") or []
+        descriptions = await self.html_to_texts([posting.get("description") for posting in postings])
+
+        jobs: List[Job] = []
+        for posting, description in zip(postings, descriptions):
+            locations = posting.get("locations") or []
+            location = locations[0] if locations else {}
+
+            country = (
+                country_name_from_code(location.get("countryCode"))
+                or location.get("country")
+                or posting.get("country")
+            )
+
+            job = make_job(
+                job_title=posting.get("title"),
+                job_url=posting.get("url") or posting.get("shortlink"),
+                job_description=description,
+                location_country=country,
+                location_region=location.get("region") or posting.get("state"),
+                contract_type=normalize_contract_type(posting.get("employment_type"))
+                or ("remote" if posting.get("telecommuting") else None),
+            )
+            if job:
+                jobs.append(job)
+
+        return jobs
+
+
+class SmartRecruitersAdapter(AtsAdapter):
+    """careers.smartrecruiters.com/{token} or jobs.smartrecruiters.com/{token}."""
+
+    name = "smartrecruiters"
+
+    def detect(self, url: str) -> Optional[AtsBoard]:
+        parsed = urlparse(url)
+        if not SMARTRECRUITERS_HOST_PATTERN.fullmatch(parsed.netloc.lower()):
+            return None
+
+        token = first_path_segment(parsed.path)
+        if not token:
+            return None
+
+        return {"ats": self.name, "token": token, "host": parsed.netloc.lower()}
+
+    async def fetch_description(
+        self, session: aiohttp.ClientSession, token: str, posting_id: str
+    ) -> Optional[str]:
+        """Return the job ad sections of a posting as text."""
+        detail = await self.get_json(
+            session, SMARTRECRUITERS_POSTING_API.format(token=token, posting_id=posting_id)
+        )
+        sections = ((detail.get("jobAd") or {}).get("sections")) or {}
+        ad_sections = [
+            sections.get(key) or {}
+            for key in ("companyDescription", "jobDescription", "qualifications", "additionalInformation")
+        ]
+        section_texts = await self.html_to_texts([section.get("text") for section in ad_sections])
+
+        texts: List[str] = []
+        for section, section_text in zip(ad_sections, section_texts):
+            if section.get("title"):
+                texts.append(section["title"])
+            if section_text:
+                texts.append(section_text)
+
+        return "\n".join(texts) or None
+
+    async def fetch_jobs(
+        self, session: aiohttp.ClientSession, board: AtsBoard
+    ) -> List[Job]:
+        token = board["token"]
+        postings: List[Dict[str, Any]] = []
+        offset = 0
+
+        while len(postings) < MAX_JOBS_PER_BOARD:
+            data = await self.get_json(
+                session,
+                SMARTRECRUITERS_POSTINGS_API.format(
+                    token=token, offset=offset, limit=SMARTRECRUITERS_PAGE_SIZE
+                ),
+            )
+            content = data.get("content") or []
+            postings.extend(content)
+
+            offset += SMARTRECRUITERS_PAGE_SIZE
+            if not content or offset >= (data.get("totalFound") or 0):
+                break
+
+        descriptions = await self.gather_details(
+            [self.fetch_description(session, token, p["id"]) for p in postings if p.get("id")]
+        )
+
+        jobs: List[Job] = []
+        for posting, description in zip(
+            [p for p in postings if p.get("id")], descriptions
+        ):
+            location = posting.get("location") or {}
+
+            job = make_job(
+                job_title=posting.get("name"),
+                job_url=SMARTRECRUITERS_JOB_URL.format(token=token, posting_id=posting["id"]),
+                job_description=description,
+                location_country=country_name_from_code(location.get("country")),
+                location_region=location.get("region"),
+                contract_type=normalize_contract_type(
+                    (posting.get("typeOfEmployment") or {}).get("label")
+                )
+                or ("remote" if location.get("remote") else None),
+            )
+            if job:
+                jobs.append(job)
+
+        return jobs
+
+
+class PersonioAdapter(AtsAdapter):
+    """{token}.jobs.personio.de, read from its public XML feed (Personio has no public JSON feed with descriptions)."""
+
+    name = "personio"
+
+    def detect(self, url: str) -> Optional[AtsBoard]:
+        host = urlparse(url).netloc.lower()
+        match = PERSONIO_HOST_PATTERN.fullmatch(host)
+        if not match:
+            return None
+
+        return {"ats": self.name, "token": match.group(1), "host": host}
+
+    async def fetch_jobs(
+        self, session: aiohttp.ClientSession, board: AtsBoard
+    ) -> List[Job]:
+        async with session.get(PERSONIO_FEED.format(host=board["host"])) as response:
+            response.raise_for_status()
+            raw = await response.content.read(MAX_RESPONSE_BYTES)
+
+        parser = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+        root = etree.fromstring(raw, parser=parser)
+        if root is None:
+            return []
+
+        positions = list(root.iter("position"))
+        value_texts = iter(
+            await self.html_to_texts(
+                [
+                    description.findtext("value")
+                    for position in positions
+                    for description in position.iter("jobDescription")
+                ]
+            )
+        )
+
+        jobs: List[Job] = []
+        for position in positions:
+            sections: List[str] = []
+            for description in position.iter("jobDescription"):
+                if name := (description.findtext("name") or "").strip():
+                    sections.append(name)
+                if text := next(value_texts):
+                    sections.append(text)
+
+            # employmentType is permanent/intern/trainee/freelance, schedule is full-time/part-time
+            contract_type = normalize_contract_type(
+                position.findtext("employmentType")
+            )
+            if contract_type in (None, "full_time"):
+                contract_type = normalize_contract_type(position.findtext("schedule")) or contract_type
+
+            job_id = (position.findtext("id") or "").strip()
+
+            job = make_job(
+                job_title=position.findtext("name"),
+                job_url=PERSONIO_JOB_URL.format(host=board["host"], job_id=job_id)
+                if job_id
+                else None,
+                job_description="\n".join(sections) or None,
+                contract_type=contract_type,
+            )
+            if job:
+                jobs.append(job)
+
+        return jobs
+
+
+class RecruiteeAdapter(AtsAdapter):
+    """{token}.recruitee.com."""
+
+    name = "recruitee"
+
+    def detect(self, url: str) -> Optional[AtsBoard]:
+        host = urlparse(url).netloc.lower()
+        match = RECRUITEE_HOST_PATTERN.fullmatch(host)
+        if not match or match.group(1) in RESERVED_SUBDOMAINS:
+            return None
+
+        return {"ats": self.name, "token": match.group(1), "host": host}
+
+    async def fetch_jobs(
+        self, session: aiohttp.ClientSession, board: AtsBoard
+    ) -> List[Job]:
+        data = await self.get_json(session, RECRUITEE_OFFERS_API.format(host=board["host"]))
+
+        offers = data.get("offers") or []
+        texts = iter(
+            await self.html_to_texts(
+                [offer.get(key) for offer in offers for key in ("description", "requirements")]
+            )
+        )
+
+        jobs: List[Job] = []
+        for offer in offers:
+            sections = [next(texts), next(texts)]
+
+            job = make_job(
+                job_title=offer.get("title"),
+                job_url=offer.get("careers_url") or offer.get("url"),
+                job_description="\n".join(s for s in sections if s) or None,
+                location_country=country_name_from_code(offer.get("country_code"))
+                or offer.get("country"),
+                location_region=offer.get("state_name"),
+                contract_type=normalize_contract_type(offer.get("employment_type_code"))
+                or ("remote" if offer.get("remote") else None),
+            )
+            if job:
+                jobs.append(job)
+
+        return jobs
+
+
+class WorkdayAdapter(AtsAdapter):
+    """{tenant}.wd{N}.myworkdayjobs.com/{lang}/{site}."""
+
+    name = "workday"
+
+    def detect(self, url: str) -> Optional[AtsBoard]:
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        match = WORKDAY_HOST_PATTERN.fullmatch(host)
+        if not match:
+            return None
+
+        parts = [p for p in parsed.path.strip("/").split("/") if p]
+        if parts and LANG_PATTERN.match(parts[0]):
+            parts = parts[1:]
+
+        # /wday/cxs/{tenant}/{site}/... is the JSON API itself
+        if parts[:2] == ["wday", "cxs"] and len(parts) >= 4:
+            parts = parts[3:]
+
+        if not parts or not BOARD_TOKEN_PATTERN.fullmatch(parts[0]):
+            return None
+
+        return {"ats": self.name, "token": match.group(1), "host": host, "site": parts[0]}
+
+    async def fetch_posting(
+        self, session: aiohttp.ClientSession, board: AtsBoard, external_path: str
+    ) -> Dict[str, Any]:
+        """Return the jobPostingInfo of one posting."""
+        detail = await self.get_json(
+            session,
+            WORKDAY_JOB_API.format(
+                host=board["host"],
+                tenant=board["token"],
+                site=board.get("site"),
+                external_path=external_path,
+            ),
+        )
+        return detail.get("jobPostingInfo") or {}
+
+    async def fetch_jobs(
+        self, session: aiohttp.ClientSession, board: AtsBoard
+    ) -> List[Job]:
+        postings: List[Dict[str, Any]] = []
+        offset = 0
+        total: Optional[int] = None
+
+        while len(postings) < MAX_JOBS_PER_BOARD:
+            data = await self.get_json(
+                session,
+                WORKDAY_JOBS_API.format(
+                    host=board["host"], tenant=board["token"], site=board.get("site")
+                ),
+                payload={
+                    "appliedFacets": {},
+                    "limit": WORKDAY_PAGE_SIZE,
+                    "offset": offset,
+                    "searchText": "",
+                },
+            )
+            page_postings = data.get("jobPostings") or []
+            postings.extend(page_postings)
+
+            # Workday only reports the total on the first page
+            if total is None:
+                total = data.get("total") or 0
+
+            offset += WORKDAY_PAGE_SIZE
+            if not page_postings or offset >= total:
+                break
+
+        postings = [p for p in postings if p.get("externalPath")]
+        details = await self.gather_details(
+            [self.fetch_posting(session, board, p["externalPath"]) for p in postings]
+        )
+
+        descriptions = await self.html_to_texts(
+            [(detail or {}).get("jobDescription") for detail in details]
+        )
+
+        jobs: List[Job] = []
+        for posting, detail, description in zip(postings, details, descriptions):
+            detail = detail or {}
+            country = (detail.get("country") or {}).get("descriptor")
+
+            job = make_job(
+                job_title=detail.get("title") or posting.get("title"),
+                job_url=detail.get("externalUrl")
+                or WORKDAY_JOB_URL.format(
+                    host=board["host"],
+                    site=board.get("site"),
+                    external_path=posting["externalPath"],
+                ),
+                job_description=description,
+                location_country=country or split_location(posting.get("locationsText"))[0],
+                contract_type=normalize_contract_type(
+                    detail.get("timeType") or posting.get("timeType")
+                ),
+            )
+            if job:
+                jobs.append(job)
+
+        return jobs
+
+
+class AtsAdapterRegistry:
+    """
+    Recognises hosted ATS boards (from the job listing URL or an embedded
+    iframe/script) and reads their jobs natively, without browser nor LLM.
+    """
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+        self.adapters: List[AtsAdapter] = [
+            GreenhouseAdapter(session_logger),
+            LeverAdapter(session_logger),
+            WorkableAdapter(session_logger),
+            SmartRecruitersAdapter(session_logger),
+            PersonioAdapter(session_logger),
+            RecruiteeAdapter(session_logger),
+            WorkdayAdapter(session_logger),
+        ]
+        self.adapters_by_name = {adapter.name: adapter for adapter in self.adapters}
+
+    def detect_from_url(self, url: str) -> Optional[AtsBoard]:
+        """Return the ATS board hosted at this URL, if any."""
+        for adapter in self.adapters:
+            try:
+                if board := adapter.detect(url):
+                    return board
+            except Exception as e:
+                self.session_logger.info(f"[ATS] {adapter.name} detection failed on {url}: {e}")
+        return None
+
+    async def detect_from_html(self, html_content: str) -> Optional[AtsBoard]:
+        """Return the ATS board embedded in a page through an iframe or a script."""
+        srcs = await cpu_executor.run_in_process(extract_embed_srcs, html_content.encode())
+
+        for src in srcs:
+            if src.startswith("//"):
+                src = "https:" + src
+            if board := self.detect_from_url(src):
+                return board
+
+        return None
+
+    async def detect(self, url: str, html_content: Optional[str] = None) -> Optional[AtsBoard]:
+        """Detect the ATS board from the URL, else from the HTML the browser loaded for it."""
+        if board := self.detect_from_url(url):
+            return board
+
+        return await self.detect_from_html(html_content) if html_content else None
+
+    async def fetch_jobs(self, url: str, html_content: Optional[str] = None) -> Optional[List[Job]]:
+        """
+        Read the jobs of the ATS board behind a job listing page, recognised
+        from its URL or from its HTML when already loaded (embedded boards).
+
+        Returns:
+            Optional[List[Job]]: The jobs, or None when no ATS was recognised or
+            its feed could not be read (the caller falls back to the browser).
+        """
+        board = await self.detect(url, html_content)
+        if not board:
+            return None
+
+        try:
+            async with create_http_session(REQUEST_TIMEOUT) as session:
+                self.session_logger.info(f"[ATS] {board['ats']} board '{board['token']}' detected for {url}")
+
+                jobs = await self.adapters_by_name[board["ats"]].fetch_jobs(session, board)
+
+        except Exception as e:
+            self.session_logger.warning(f"[ATS] Native extraction failed for {url}: {e}")
+            return None
+
+        self.session_logger.info(f"[ATS] {len(jobs)} jobs read natively from {url}")
+
+        return jobs[:MAX_JOBS_PER_BOARD]
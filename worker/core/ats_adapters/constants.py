@@ -0,0 +1,45 @@
+import re
+
+# === Hosted board URLs ===
+GREENHOUSE_HOST_PATTERN = re.compile(r"(?:boards|job-boards)(?:\.eu)?\.greenhouse\.io")
+LEVER_HOST_PATTERN = re.compile(r"jobs(\.eu)?\.lever\.co")
+WORKABLE_HOST_PATTERN = re.compile(r"(?:apply\.workable\.com|([a-z0-9-]+)\.workable\.com)")
+SMARTRECRUITERS_HOST_PATTERN = re.compile(r"(?:careers|jobs)\.smartrecruiters\.com")
+PERSONIO_HOST_PATTERN = re.compile(r"([a-z0-9-]+)\.jobs\.personio\.(?:de|com)")
+RECRUITEE_HOST_PATTERN = re.compile(r"([a-z0-9-]+)\.recruitee\.com")
+WORKDAY_HOST_PATTERN = re.compile(r"([a-z0-9-]+)\.wd\d+\.myworkdayjobs\.com")
+
+BOARD_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_.-]+")
+
+# Names of Greenhouse custom metadata fields holding the employment / contract type
+GREENHOUSE_CONTRACT_FIELD_PATTERN = re.compile(
+    r"employment|contract|job type|position type|work type|time type|schedule|commitment"
+    r"|anstellung|vertrag|arbeitszeit|beschäftigung|type de contrat|type d'emploi|contrato|jornada",
+    re.IGNORECASE,
+)
+
+# Subdomains of the ATS vendors that are not company boards
+RESERVED_SUBDOMAINS = {"www", "apply", "api", "app", "jobs", "careers", "help", "support"}
+
+# === Public endpoints ===
+GREENHOUSE_JOBS_API = "https://boards-api.greenhouse.io/v1/boards/{token}/jobs?content=true"
+LEVER_POSTINGS_API = "https://api{region}.lever.co/v0/postings/{token}?mode=json&skip={skip}&limit={limit}"
+WORKABLE_JOBS_API = "https://apply.workable.com/api/v1/widget/accounts/{token}?details=true"
+SMARTRECRUITERS_POSTINGS_API = "https://api.smartrecruiters.com/v1/companies/{token}/postings?offset={offset}&limit={limit}"
+SMARTRECRUITERS_POSTING_API = "https://api.smartrecruiters.com/v1/companies/{token}/postings/{posting_id}"
+SMARTRECRUITERS_JOB_URL = "https://jobs.smartrecruiters.com/{token}/{posting_id}"
+PERSONIO_FEED = "https://{host}/xml"
+PERSONIO_JOB_URL = "https://{host}/job/{job_id}"
+RECRUITEE_OFFERS_API = "https://{host}/api/offers/"
+WORKDAY_JOBS_API = "https://{host}/wday/cxs/{tenant}/{site}/jobs"
+WORKDAY_JOB_API = "https://{host}/wday/cxs/{tenant}/{site}{external_path}"
+WORKDAY_JOB_URL = "https://{host}/{site}{external_path}"
+
+# === Limits ===
+LEVER_PAGE_SIZE = 100
+SMARTRECRUITERS_PAGE_SIZE = 100
+WORKDAY_PAGE_SIZE = 20  # Maximum accepted by the Workday jobs endpoint
+MAX_JOBS_PER_BOARD = 1000
+MAX_CONCURRENT_DETAILS = 5  # Detail requests in flight per board (SmartRecruiters, Workday)
+MAX_RESPONSE_BYTES = 20 * 1024 * 1024
+REQUEST_TIMEOUT = 30  # seconds, per request
@@ -0,0 +1,151 @@
+"""
+Check the ATS adapters against recorded feed payloads (fixtures/), without network.
+
+    python -m worker.core.ats_adapters.fixture_check [--update]
+
+Each adapter reads its board from a session serving the fixture files, and
+the Job records must equal fixtures/expected.json. Exits with status 1 on
+any difference. --update rewrites expected.json from the current parsers.
+"""
+
+import sys
+import json
+import asyncio
+import logging
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from worker.types.worker_types import AtsBoard, Job
+from worker.core.ats_adapters.ats_adapters import AtsAdapterRegistry
+from worker.core.ats_adapters.constants import (
+    GREENHOUSE_JOBS_API,
+    LEVER_POSTINGS_API,
+    WORKABLE_JOBS_API,
+    SMARTRECRUITERS_POSTINGS_API,
+    SMARTRECRUITERS_POSTING_API,
+    PERSONIO_FEED,
+    RECRUITEE_OFFERS_API,
+    WORKDAY_JOBS_API,
+    WORKDAY_JOB_API,
+    LEVER_PAGE_SIZE,
+    SMARTRECRUITERS_PAGE_SIZE,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+EXPECTED_FILE = FIXTURES_DIR / "expected.json"
+
+# Board URL of each fixture set, detected like a job listing page
+BOARD_URLS = {
+    "greenhouse": "https://boards.greenhouse.io/acme",
+    "lever": "https://jobs.lever.co/acme",
+    "workable": "https://apply.workable.com/acme/",
+    "smartrecruiters": "https://careers.smartrecruiters.com/acme",
+    "personio": "https://acme.jobs.personio.de/",
+    "recruitee": "https://acme.recruitee.com/",
+    "workday": "https://acme.wd3.myworkdayjobs.com/en-US/External",
+}
+
+# Endpoint → fixture file (endpoints without a fixture answer 404)
+ROUTES = {
+    GREENHOUSE_JOBS_API.format(token="acme"): "greenhouse.json",
+    LEVER_POSTINGS_API.format(region="", token="acme", skip=0, limit=LEVER_PAGE_SIZE): "lever.json",
+    WORKABLE_JOBS_API.format(token="acme"): "workable.json",
+    SMARTRECRUITERS_POSTINGS_API.format(
+        token="acme", offset=0, limit=SMARTRECRUITERS_PAGE_SIZE
+    ): "smartrecruiters_postings.json",
+    SMARTRECRUITERS_POSTING_API.format(
+        token="acme", posting_id="743999912345678"
+    ): "smartrecruiters_posting.json",
+    PERSONIO_FEED.format(host="acme.jobs.personio.de"): "personio.xml",
+    RECRUITEE_OFFERS_API.format(host="acme.recruitee.com"): "recruitee.json",
+    WORKDAY_JOBS_API.format(
+        host="acme.wd3.myworkdayjobs.com", tenant="acme", site="External"
+    ): "workday_jobs.json",
+    WORKDAY_JOB_API.format(
+        host="acme.wd3.myworkdayjobs.com",
+        tenant="acme",
+        site="External",
+        external_path="/job/Basel/Mechanical-Engineer_R-10001",
+    ): "workday_job.json",
+}
+
+
+class FixtureResponse:
+    """The parts of an aiohttp response the adapters read."""
+
+    def __init__(self, url: str, body: Optional[bytes]):
+        self.url = url
+        self.body = body
+        self.content_length = len(body) if body is not None else None
+        self.content = self
+
+    async def __aenter__(self) -> "FixtureResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        if self.body is None:
+            raise RuntimeError(f"404 for {self.url}")
+
+    async def json(self, content_type: Optional[str] = None) -> Any:
+        return json.loads(self.body or b"null")
+
+    async def read(self, size: int = -1) -> bytes:
+        return (self.body or b"")[: size if size >= 0 else None]
+
+
+class FixtureSession:
+    """Session answering the ATS endpoints from the fixture files."""
+
+    def get(self, url: str, **kwargs: Any) -> FixtureResponse:
+        file_name = ROUTES.get(url)
+        return FixtureResponse(url, (FIXTURES_DIR / file_name).read_bytes() if file_name else None)
+
+    def post(self, url: str, **kwargs: Any) -> FixtureResponse:
+        return self.get(url)
+
+
+async def read_boards() -> Dict[str, List[Job]]:
+    """Jobs read by each adapter from its fixtures."""
+    registry = AtsAdapterRegistry(logging.getLogger(__name__))
+    session: Any = FixtureSession()
+
+    results: Dict[str, List[Job]] = {}
+    for ats, url in BOARD_URLS.items():
+        board: Optional[AtsBoard] = registry.detect_from_url(url)
+        if not board or board["ats"] != ats:
+            raise AssertionError(f"{url} detected as {board}, expected {ats}")
+
+        results[ats] = await registry.adapters_by_name[ats].fetch_jobs(session, board)
+
+    return results
+
+
+def main(args: List[str]) -> int:
+    results = asyncio.run(read_boards())
+
+    if "--update" in args:
+        EXPECTED_FILE.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n")
+        print(f"Updated {EXPECTED_FILE}")
+        return 0
+
+    expected = json.loads(EXPECTED_FILE.read_text())
+    failures = 0
+
+    for ats in BOARD_URLS:
+        if results.get(ats) == expected.get(ats):
+            print(f"  {ats:<16} ok ({len(results[ats])} jobs)")
+            continue
+
+        failures += 1
+        print(f"  {ats:<16} MISMATCH")
+        print(f"    expected: {json.dumps(expected.get(ats), ensure_ascii=False)}")
+        print(f"    got:      {json.dumps(results.get(ats), ensure_ascii=False)}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,103 @@
+from collections import defaultdict
+from typing import Any, Dict, List
+from urllib.parse import urlparse
+from worker.utils.url_utils import canonicalize_url, get_registrable_domain
+from worker.core.crawl_frontier.crawl_frontier import score_career_link
+from worker.core.sitemap_discovery.constants import DETAIL_SLUG_PATTERN
+from worker.core.boilerplate_filter.constants import (
+    MIN_PAGES,
+    CHARS_PER_TOKEN,
+    STRUCTURE_LINES,
+    LINK_PATTERN,
+)
+
+
+class BoilerplateFilter:
+    """
+    Learns the site template (navigation, mega-menus, cookie text, footers)
+    from the structured text of the pages prompted in a session, and strips
+    it before the next prompts.
+
+    Every line of structured text is a block: its hash is counted once per
+    page of the site, and lines seen on MIN_PAGES pages or more are dropped.
+    Lines linking to career or job detail pages are always kept.
+    """
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+
+        self.line_counts: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.observed_pages: set[str] = set()
+
+        self.chars_before = 0
+        self.chars_after = 0
+
+    @staticmethod
+    def has_job_link(line: str) -> bool:
+        """Check whether a line links to a career, listing or job detail page."""
+        for link in LINK_PATTERN.findall(line):
+            if score_career_link(link) > 0:
+                return True
+
+            last_segment = urlparse(link).path.rstrip("/").rsplit("/", 1)[-1]
+            if DETAIL_SLUG_PATTERN.search(last_segment):
+                return True
+
+        return False
+
+    def observe(self, url: str, text: str) -> None:
+        """Count the lines of a page once for its site."""
+        page = canonicalize_url(url)
+        if page in self.observed_pages:
+            return
+        self.observed_pages.add(page)
+
+        counts = self.line_counts[get_registrable_domain(url)]
+        for line_hash in {hash(line.strip()) for line in text.splitlines() if line.strip()}:
+            counts[line_hash] += 1
+
+    def is_boilerplate(self, counts: Dict[int, int], line: str) -> bool:
+        """Check whether a line is repeated template text that can be stripped."""
+        stripped = line.strip()
+        if not stripped or stripped in STRUCTURE_LINES:
+            return False
+
+        return counts.get(hash(stripped), 0) >= MIN_PAGES and not self.has_job_link(stripped)
+
+    def strip_chunks(self, url: str, chunks: List[str]) -> List[str]:
+        """Learn from the chunks of a page, then return them without the site template."""
+        self.observe(url, "\n".join(chunks))
+        counts = self.line_counts[get_registrable_domain(url)]
+
+        stripped_chunks = []
+        for chunk in chunks:
+            lines = [line for line in chunk.split("\n") if not self.is_boilerplate(counts, line)]
+            if any(line.strip() and line.strip() not in STRUCTURE_LINES for line in lines):
+                stripped_chunks.append("\n".join(lines))
+
+        # Nothing but template text: the page is prompted as is
+        stripped_chunks = stripped_chunks or chunks
+
+        chars_before = sum(len(chunk) for chunk in chunks)
+        chars_after = sum(len(chunk) for chunk in stripped_chunks)
+        self.chars_before += chars_before
+        self.chars_after += chars_after
+
+        if chars_after < chars_before:
+            self.session_logger.info(
+                f"[BOILERPLATE] {url}: ~{chars_before // CHARS_PER_TOKEN} -> "
+                f"~{chars_after // CHARS_PER_TOKEN} prompt tokens"
+            )
+
+        return stripped_chunks
+
+    def strip(self, url: str, text: str) -> str:
+        """Learn from the structured text of a page, then return it without the site template."""
+        return "\n".join(self.strip_chunks(url, [text]))
+
+    def log_stats(self) -> None:
+        """Log the prompt tokens saved in the session."""
+        self.session_logger.info(
+            f"[BOILERPLATE] Prompt tokens ~{self.chars_before // CHARS_PER_TOKEN} -> "
+            f"~{self.chars_after // CHARS_PER_TOKEN} over {len(self.observed_pages)} pages"
+        )
@@ -0,0 +1,9 @@
+import re
+
+MIN_PAGES = 3  # Distinct pages of a site a line must appear on to count as boilerplate
+CHARS_PER_TOKEN = 4  # Rough prompt token estimate (no tokenizer in the worker)
+
+# Structure markers of extract_structured_text, kept even when repeated
+STRUCTURE_LINES = {"### Links ###"}
+
+LINK_PATTERN = re.compile(r"\((https?://[^\s)]+)\)")
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+from worker.dependencies import CPU_PROCESS_WORKERS, WORKER_ID
+
+T = TypeVar("T")
+
+logger = logging.getLogger(f"worker_{WORKER_ID}")
+
+
+class CpuExecutor:
+    """
+    Runs CPU-bound work off the event loop, so a large page does not freeze
+    the other sessions or the RabbitMQ heartbeats.
+
+    run_in_process: parse-heavy work (functions of cpu_tasks taking HTML bytes
+    and returning compact results) on processes forked at startup, in parallel
+    with the event loop. Falls back to a thread before start(), when disabled
+    (CPU_PROCESS_WORKERS=0) or once a worker process died.
+
+    run_in_thread: light work, and work on objects that cannot leave the
+    process (soups, lxml trees of a PageSnapshot).
+    """
+
+    def __init__(self, max_workers: int = CPU_PROCESS_WORKERS):
+        self.max_workers = max_workers
+        self.pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """Fork the worker processes (at startup, before browsers and sessions start threads)."""
+        if self.pool is not None or self.max_workers <= 0:
+            return
+
+        # Forked children share the loaded modules (and the encoder) copy-on-write
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=multiprocessing.get_context("fork")
+        )
+
+        # A fork pool launches all its processes on the first task
+        self.pool.submit(int).result()
+
+        logger.info(f"CPU executor ready ({self.max_workers} processes)")
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    async def run_in_process(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a picklable module-level function on a worker process."""
+        if self.pool is None:
+            return await self.run_in_thread(func, *args)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, func, *args)
+
+        except BrokenProcessPool as e:
+            logger.warning(f"CPU worker process died, parsing in threads from now on: {e}")
+            self.shutdown()
+
+            return await self.run_in_thread(func, *args)
+
+    @staticmethod
+    async def run_in_thread(func: Callable[..., T], *args: Any) -> T:
+        """Run a function on a thread of the worker process."""
+        return await asyncio.to_thread(func, *args)
+
+
+cpu_executor = CpuExecutor()
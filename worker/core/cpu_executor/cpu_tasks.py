@@ -0,0 +1,81 @@
+from bs4 import Tag
+from typing import List, Optional, Tuple
+from worker.types.worker_types import PageLinks
+from worker.utils.job_utils import html_to_text
+from worker.utils.url_utils import UrlResolver, canonicalize_job_url
+from worker.utils.text_utils import get_emails, extract_structured_text
+from worker.core.crawl_frontier.constants import CHROME_TAGS
+from worker.core.page_processing.html_parser import parse_html
+from worker.core.page_processing.page_snapshot import PageSnapshot
+
+# Parse-heavy work run by CpuExecutor.run_in_process: module-level functions
+# taking HTML bytes and returning small picklable results.
+
+
+def extract_page_links(html: bytes, url: str) -> PageLinks:
+    """Emails, iframe sources and links (href, text, in site chrome) of a crawled page."""
+    snapshot = PageSnapshot(html.decode("utf-8", errors="replace"), url)
+
+    iframe_srcs = []
+    for iframe in snapshot.soup.find_all("iframe", src=True):
+        src = iframe.get("src") if isinstance(iframe, Tag) else None
+        if isinstance(src, str):
+            iframe_srcs.append(src)
+
+    anchors = []
+    for link in snapshot.soup.find_all("a", href=True):
+        href = link.get("href") if isinstance(link, Tag) else None
+        if isinstance(href, str):
+            anchors.append(
+                (href, link.get_text(" ", strip=True), link.find_parent(CHROME_TAGS) is not None)
+            )
+
+    return {
+        "emails": sorted(get_emails(snapshot.visible_text)),
+        "iframe_srcs": iframe_srcs,
+        "anchors": anchors,
+    }
+
+
+def extract_page_structured_text(html: bytes, url: str, noise_tags: List[str]) -> str:
+    """Structured text of a page (known jobs included) without its noise tags."""
+    soup = parse_html(html.decode("utf-8", errors="replace"), noise_tags)
+
+    return extract_structured_text(soup, url, skip_existing_jobs=False)
+
+
+def extract_static_listing(html: bytes, url: str, noise_tags: List[str]) -> Tuple[str, List[str]]:
+    """Structured text of a static job listing page and its links as canonical job URLs."""
+    soup = parse_html(html.decode("utf-8", errors="replace"), noise_tags)
+    resolver = UrlResolver(url, keep_query=True)
+
+    links = set()
+    for link in soup.find_all("a", href=True):
+        href = link.get("href") if isinstance(link, Tag) else None
+        if isinstance(href, str) and (link_url := resolver.resolve(href)):
+            links.add(canonicalize_job_url(link_url))
+
+    return extract_structured_text(soup, url, skip_existing_jobs=False), sorted(links)
+
+
+def extract_page_description(html: bytes, noise_tags: List[str]) -> str:
+    """Text of the body of a job description page, one line per block."""
+    soup = parse_html(html.decode("utf-8", errors="replace"), noise_tags)
+
+    return (soup.body or soup).get_text(separator="\n", strip=True)
+
+
+def extract_embed_srcs(html: bytes) -> List[str]:
+    """Sources of the iframes and scripts of a page (where ATS boards are embedded)."""
+    soup = parse_html(html.decode("utf-8", errors="replace"))
+
+    return [
+        str(tag.get("src", ""))
+        for tag in soup.find_all(["iframe", "script"], src=True)
+        if isinstance(tag, Tag)
+    ]
+
+
+def html_fragments_to_text(fragments: List[Optional[str]]) -> List[Optional[str]]:
+    """Plain text of HTML fragments (ATS job descriptions), None for the empty ones."""
+    return [html_to_text(fragment) for fragment in fragments]
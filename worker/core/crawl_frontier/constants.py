@@ -0,0 +1,176 @@
+import re
+
+from worker.utils.keyword_matcher import KeywordMatcher
+
+# Path / anchor keywords strongly suggesting a page that lists open positions
+LISTING_KEYWORDS = [
+    "jobs",
+    "job-offers",
+    "joboffers",
+    "openings",
+    "open-positions",
+    "positions",
+    "vacancies",
+    "vacancy",
+    "stellenangebote",
+    "stellenmarkt",
+    "offene-stellen",
+    "jobangebote",
+    "offres-emploi",
+    "offres-d-emploi",
+    "nos-offres",
+    "ofertas",
+    "ofertas-de-empleo",
+    "vacantes",
+    "posizioni-aperte",
+    "offerte-di-lavoro",
+    "vacatures",
+    "vagas",
+    "oferty-pracy",
+    "вакансии",
+    "وظائف",
+    "求人",
+    "招聘",
+    "채용",
+]
+
+# Path / anchor keywords suggesting a career section (overview, culture, apply...)
+CAREER_KEYWORDS = [
+    "career",
+    "careers",
+    "job",
+    "join",
+    "join-us",
+    "joinus",
+    "work-with-us",
+    "work-at",
+    "hiring",
+    "recruit",
+    "recruiting",
+    "recruitment",
+    "talent",
+    "apply",
+    "karriere",
+    "stellen",
+    "arbeiten-bei",
+    "emploi",
+    "emplois",
+    "carriere",
+    "carrieres",
+    "carrière",
+    "carrières",
+    "recrutement",
+    "rejoignez",
+    "rejoindre",
+    "empleo",
+    "empleos",
+    "carrera",
+    "carreras",
+    "trabaja",
+    "trabajar",
+    "lavora",
+    "lavoro",
+    "carriera",
+    "werken-bij",
+    "werkenbij",
+    "banen",
+    "carreiras",
+    "trabalhe",
+    "kariera",
+    "praca",
+    "карьера",
+    "работа",
+    "مهن",
+    "توظيف",
+    "採用",
+    "キャリア",
+    "职位",
+    "加入我们",
+    "커리어",
+]
+
+# Pages we still want to visit early (emails, imprint) but below career pages
+CONTACT_KEYWORDS = [
+    "contact",
+    "kontakt",
+    "contacto",
+    "contatti",
+    "impressum",
+    "imprint",
+    "mentions-legales",
+]
+
+# Keywords typical of content we rarely need during career discovery
+NEGATIVE_KEYWORDS = [
+    "blog",
+    "news",
+    "press",
+    "article",
+    "articles",
+    "event",
+    "events",
+    "webinar",
+    "podcast",
+    "story",
+    "stories",
+    "magazine",
+    "product",
+    "products",
+    "shop",
+    "store",
+    "cart",
+    "privacy",
+    "cookie",
+    "terms",
+    "login",
+    "signin",
+    "download",
+    "tag",
+    "category",
+    "author",
+    "actualites",
+    "aktuelles",
+    "noticias",
+    "notizie",
+]
+
+# Embedded players and media hosts, never crawled
+VIDEO_KEYWORDS = [
+    "youtube",
+    "vimeo",
+    "dailymotion",
+    "wistia",
+    "player.",
+    "video",
+]
+
+# Compiled once, shared by the link scoring and the crawlers
+LISTING_MATCHER = KeywordMatcher(LISTING_KEYWORDS)
+CAREER_MATCHER = KeywordMatcher(CAREER_KEYWORDS)
+ANCHOR_MATCHER = KeywordMatcher(LISTING_KEYWORDS + CAREER_KEYWORDS)
+CONTACT_MATCHER = KeywordMatcher(CONTACT_KEYWORDS)
+VIDEO_MATCHER = KeywordMatcher(VIDEO_KEYWORDS)
+
+# Anchors rendered inside these tags (site chrome) often point to the career section
+CHROME_TAGS = ["header", "footer", "nav"]
+
+# === Scoring weights ===
+LISTING_WEIGHT = 4.0
+CAREER_WEIGHT = 3.0
+ANCHOR_WEIGHT = 2.0
+CONTACT_WEIGHT = 1.0
+CHROME_WEIGHT = 1.0
+NEGATIVE_WEIGHT = -2.0
+DEPTH_PENALTY = 0.1
+
+# Links to job detail pages (career-like path ending in an id or a long slug)
+# a visited page needs to count as a confirmed job listing
+MIN_LISTING_JOB_LINKS = 3
+
+# Crawl budget defaults
+MAX_PER_PATTERN = 5  # Prevent over-crawling repetitive URL structures
+MAX_PAGES = 80  # Discovery crawl only, prefix re-crawls are bounded by their depth
+
+LANG_PATTERN = re.compile(r"^[a-z]{2}(-[A-Z]{2})?$")
+NUMERIC_PATTERN = re.compile(r"\d+")
+TOKEN_SPLIT_PATTERN = re.compile(r"[/\-_.?=&+%\s]+")
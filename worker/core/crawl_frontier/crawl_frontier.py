@@ -0,0 +1,220 @@
+import heapq
+
+from collections import defaultdict
+from typing import Any, DefaultDict, List, Optional, Tuple
+from urllib.parse import urlparse, unquote
+from worker.utils.url_utils import canonicalize_url
+from worker.core.sitemap_discovery.constants import DETAIL_SLUG_PATTERN
+from worker.core.crawl_frontier.constants import (
+    LISTING_MATCHER,
+    CAREER_MATCHER,
+    ANCHOR_MATCHER,
+    CONTACT_MATCHER,
+    NEGATIVE_KEYWORDS,
+    LISTING_WEIGHT,
+    CAREER_WEIGHT,
+    ANCHOR_WEIGHT,
+    CONTACT_WEIGHT,
+    CHROME_WEIGHT,
+    NEGATIVE_WEIGHT,
+    DEPTH_PENALTY,
+    MIN_LISTING_JOB_LINKS,
+    MAX_PER_PATTERN,
+    MAX_PAGES,
+    LANG_PATTERN,
+    NUMERIC_PATTERN,
+    TOKEN_SPLIT_PATTERN,
+)
+
+
+def get_pattern_keys(url: str, depth: int = 2) -> List[str]:
+    """
+    Normalize a URL into hierarchical pattern keys for rate-limiting.
+    Strips language codes like /en/, /de/, /en-US/, /pt-BR/, etc.
+    Ensures parent categories also count towards the limit.
+    """
+    parsed = urlparse(url)
+    parts = parsed.path.strip("/").split("/")
+
+    # Drop leading language code if present (e.g., /en/, /de/, /en-US/)
+    if parts and LANG_PATTERN.match(parts[0]):
+        parts = parts[1:]
+
+    # Collapse trailing numeric parts (e.g., /123/)
+    while parts and NUMERIC_PATTERN.fullmatch(parts[-1]):
+        parts = parts[:-1]
+
+    # Generate hierarchical pattern keys
+    keys = []
+    for d in range(min(len(parts), depth), 0, -1):
+        path = "/" + "/".join(parts[:d]) + "/"
+        keys.append(f"{parsed.scheme}://{parsed.netloc}{path}")
+    return keys
+
+
+def score_career_link(
+    url: str, anchor_text: str = "", in_site_chrome: bool = False
+) -> float:
+    """
+    Score how likely a link leads to a career or job listing page.
+
+    Args:
+        url: Absolute link URL.
+        anchor_text: Visible text of the anchor pointing to the URL.
+        in_site_chrome: True if the anchor sits inside a header, footer or nav.
+
+    Returns:
+        float: Higher is more career-like; negative for blog/news/legal pages.
+    """
+    parsed = urlparse(url)
+    path = unquote(parsed.path).lower()
+    query = unquote(parsed.query).lower()
+    text = anchor_text.lower().strip()
+
+    location = f"{path} {query}"
+    tokens = set(TOKEN_SPLIT_PATTERN.split(location))
+
+    score = 0.0
+
+    if LISTING_MATCHER.matches(location):
+        score += LISTING_WEIGHT
+    if CAREER_MATCHER.matches(location):
+        score += CAREER_WEIGHT
+    if text and ANCHOR_MATCHER.matches(text):
+        score += ANCHOR_WEIGHT
+    if CONTACT_MATCHER.matches(location) or CONTACT_MATCHER.matches(text):
+        score += CONTACT_WEIGHT
+    if in_site_chrome and score > 0:
+        score += CHROME_WEIGHT
+
+    score += NEGATIVE_WEIGHT * len(tokens.intersection(NEGATIVE_KEYWORDS))
+
+    # Shallow pages first among equals
+    score -= DEPTH_PENALTY * len([p for p in path.split("/") if p])
+
+    return score
+
+
+def is_job_detail_link(url: str) -> bool:
+    """Check whether a link looks like a job detail page (e.g. /jobs/1234-data-engineer)."""
+    last_segment = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+
+    return bool(DETAIL_SLUG_PATTERN.search(last_segment)) and score_career_link(url) > 0
+
+
+class CrawlFrontier:
+    """
+    Best-first crawl frontier used during career page discovery.
+
+    Keeps a set of every URL already queued or visited (O(1) membership),
+    pops URLs by descending career-likeness, enforces per-pattern caps and
+    a page budget (None for no budget), and stops early once visited pages
+    were confirmed as job listings (see confirm_listing) and only non-career
+    pages remain.
+    """
+
+    def __init__(
+        self,
+        session_logger: Any,
+        max_depth: int = 1,
+        max_pages: Optional[int] = MAX_PAGES,
+        max_per_pattern: Optional[int] = MAX_PER_PATTERN,
+        early_exit: bool = True,
+    ):
+        self.session_logger = session_logger
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.max_per_pattern = max_per_pattern
+        self.early_exit = early_exit
+
+        self.heap: List[Tuple[float, int, str, int]] = []
+        self.seen: set[str] = set()
+        self.pattern_counts: DefaultDict[str, int] = defaultdict(int)
+        self.pages_popped = 0
+        self.listing_hits = 0  # Visited pages confirmed as job listings
+        self.counter = 0
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, url: str) -> bool:
+        return canonicalize_url(url) in self.seen
+
+    def push(
+        self,
+        url: str,
+        depth: int,
+        anchor_text: str = "",
+        in_site_chrome: bool = False,
+    ) -> bool:
+        """Queue a URL (canonicalized) unless it was already seen or is deeper than max_depth."""
+        url = canonicalize_url(url)
+        if url in self.seen or depth > self.max_depth:
+            return False
+
+        self.seen.add(url)
+        self.requeue(url, depth, score_career_link(url, anchor_text, in_site_chrome))
+        return True
+
+    def requeue(self, url: str, depth: int, score: Optional[float] = None) -> None:
+        """Queue a URL again regardless of membership (used for retries)."""
+        url = canonicalize_url(url)
+        if score is None:
+            score = score_career_link(url)
+        self.counter += 1
+        heapq.heappush(self.heap, (-score, self.counter, url, depth))
+
+    def mark_visited(self, url: str) -> None:
+        """Record a visited URL (e.g. the final URL after a redirect)."""
+        self.seen.add(canonicalize_url(url))
+
+    def best_score(self) -> Optional[float]:
+        """Return the score of the next URL to pop, or None if empty."""
+        return -self.heap[0][0] if self.heap else None
+
+    def should_stop(self) -> bool:
+        """Return True when the budget is spent or only non-career pages remain after finding listings."""
+        if not self.heap:
+            return True
+
+        if self.max_pages is not None and self.pages_popped >= self.max_pages:
+            self.session_logger.info(
+                f"Crawl budget reached ({self.max_pages} pages), stopping."
+            )
+            return True
+
+        best = self.best_score()
+        if self.early_exit and self.listing_hits > 0 and best is not None and best <= 0:
+            self.session_logger.info(
+                f"Listing pages found ({self.listing_hits}), skipping {len(self.heap)} non-career pages."
+            )
+            return True
+
+        return False
+
+    def confirm_listing(self, url: str, job_links: int) -> None:
+        """Count a visited page as a job listing if it links to enough job detail pages."""
+        if job_links >= MIN_LISTING_JOB_LINKS:
+            self.listing_hits += 1
+            self.session_logger.info(f"Job listing confirmed ({job_links} job links): {url}")
+
+    def pop(self) -> Optional[Tuple[str, int]]:
+        """Pop the most career-like URL that is still within its pattern cap."""
+        while self.heap and not self.should_stop():
+            _, _, url, depth = heapq.heappop(self.heap)
+
+            if self.max_per_pattern is not None:
+                pattern_keys = get_pattern_keys(url, depth=2)
+                if any(
+                    self.pattern_counts[k] >= self.max_per_pattern for k in pattern_keys
+                ):
+                    self.session_logger.info(f"⏭️ Skipping {url}, pattern cap reached")
+                    continue
+                for k in pattern_keys:
+                    self.pattern_counts[k] += 1
+
+            self.pages_popped += 1
+
+            return url, depth
+
+        return None
@@ -4,6 +4,7 @@ import worker.dependencies as deps
 from psycopg.types.json import Json
 from typing import List, Optional
 from worker.types.worker_types import Job
+from worker.utils.url_utils import canonicalize_job_url
 
 MAX_DB_ATTEMPTS = 3
 RETRY_DELAY = 2.0
@@ -100,19 +101,31 @@ class DBOps:
                 self.session_logger.info("No job offers to insert for this company.")
                 return
 
+            # Job URLs are stored canonical so variants of a posting match one row
+            for job in new_job_offers:
+                if job.get("job_url"):
+                    job["job_url"] = canonicalize_job_url(job["job_url"])
+
             job_urls = [job["job_url"] for job in new_job_offers if job.get("job_url")]
 
+            # Rows of the company stored before job URLs were canonical are matched
+            # by the canonical form of their URL (and renamed to it on update)
             await cur.execute(
                 """
                 SELECT job_url
                 FROM all_jobs
-                WHERE job_url = ANY(%s)
+                WHERE (job_url = ANY(%s) OR company_id = %s)
                 AND is_existing = TRUE;
                 """,
-                (job_urls,),
+                (job_urls, company_id),
             )
 
-            existing_urls = {row[0] for row in await cur.fetchall()}
+            stored_urls: dict[str, str] = {}  # canonical job URL -> stored job URL
+            for (stored_url,) in await cur.fetchall():
+                if stored_url:
+                    stored_urls.setdefault(canonicalize_job_url(stored_url), stored_url)
+
+            existing_urls = set(stored_urls).intersection(job_urls)
 
             self.session_logger.info(
                 f"Found {len(existing_urls)} existing active jobs for this company."
@@ -155,11 +168,12 @@ class DBOps:
                             salary = %s,
                             job_title_vectors = %s,
                             hash_job_description_page = %s,
+                            job_url = %s,
                             is_existing = TRUE
                         WHERE job_url = %s
                         AND is_existing = TRUE;
                         """,
-                        (*job_record[:4], *job_record[5:11], job_record[4]),
+                        (*job_record[:4], *job_record[5:11], job_url, stored_urls[job_url]),
                     )
                 else:
                     # Insert new job
@@ -243,3 +257,31 @@ class DBOps:
                     await asyncio.sleep(RETRY_DELAY)
                 else:
                     raise
+
+    async def get_known_website(self, company_name: str, company_id: int) -> Optional[str]:
+        """Return the website of another company with the same name, or None."""
+        try:
+            pool = deps.get_pool()
+
+            async with pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        """
+                        SELECT website
+                        FROM companies
+                        WHERE lower(name) = lower(%s)
+                        AND id <> %s
+                        AND website IS NOT NULL
+                        ORDER BY update_date DESC NULLS LAST
+                        LIMIT 1
+                        """,
+                        (company_name, company_id),
+                    )
+
+                    row = await cur.fetchone()
+
+            return row[0] if row else None
+
+        except Exception as e:
+            self.session_logger.warning(f"Failed to look up known website of {company_name}: {e}")
+            return None
@@ -2,13 +2,14 @@ import os
 import re
 import io
 import base64
-import random
 import aiofiles
 import aiofiles.os
 import aioboto3
 import aiohttp
 
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Page
+from worker.core.page_processing.page_readiness import wait_for_page_ready
+from worker.core.storage_state_cache.storage_state_cache import StorageStateCache
 from typing import Optional
 from worker.dependencies import (
     CLOUDFLARE_R2_BUCKET,
@@ -17,6 +18,9 @@ from worker.dependencies import (
     CLOUDFLARE_R2_SECRET_KEY,
 )
 
+GOOGLE_URL = "https://www.google.com"
+GOOGLE_CONSENT_COOKIES = {"SOCS", "CONSENT"}  # Set once the consent popup was answered
+
 
 class FindCompanyLogo:
     def __init__(
@@ -31,13 +35,27 @@ class FindCompanyLogo:
         self.session_logger = session_logger
         self.timeout = timeout
 
+        self.storage_state_cache = StorageStateCache(session_logger)
+
     async def handle_google_consent(self, page) -> None:
-        """Detect and click the 'Reject all' button if the Google consent popup appears."""
+        """
+        Detect and click the 'Reject all' button if the Google consent popup appears.
+        The answer is saved (see StorageStateCache) so later contexts skip the popup.
+        """
         try:
+            cookies = await page.context.cookies(GOOGLE_URL)
+            if any(cookie["name"] in GOOGLE_CONSENT_COOKIES for cookie in cookies):
+                self.session_logger.info("Google consent already answered (saved state).")
+                return
+
             locator = page.locator("//button[contains(., 'Reject all')]").first
             await locator.wait_for(timeout=5000)
             await locator.click()
             self.session_logger.info("Google Consent Popup: 'Reject all' clicked.")
+
+            await wait_for_page_ready(page, self.session_logger, jitter=False)
+
+            await self.storage_state_cache.save(page.context, GOOGLE_URL)
         except PlaywrightTimeoutError:
             self.session_logger.info("No Google Consent Popup detected.")
         except Exception as e:
@@ -49,7 +67,7 @@ class FindCompanyLogo:
         """
         search_query = f"{self.company_name} logo png"
         google_images_url = (
-            "https://www.google.com/search?tbm=isch&q=" + search_query.replace(" ", "+")
+            f"{GOOGLE_URL}/search?tbm=isch&q=" + search_query.replace(" ", "+")
         )
 
         try:
@@ -60,7 +78,7 @@ class FindCompanyLogo:
                 google_images_url, timeout=self.timeout, wait_until="load"
             )
 
-            await page.wait_for_timeout(random.uniform(1000, 3000))
+            await wait_for_page_ready(page, self.session_logger)
 
             # Handle Google consent pop-up if it appears
             await self.handle_google_consent(page)
@@ -1,18 +1,18 @@
-import re
-import random
+import time
 import asyncio
 
 from worker.constants.blocked_domains import BLOCKED_DOMAINS
-from collections import deque, defaultdict
-from bs4 import BeautifulSoup, Tag
 from urllib.parse import urljoin, urlparse
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Browser, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Browser
 from worker.types.worker_types import (
     CareerPagesResponse,
     IsJobListingPageResponse,
     JobListingsResult,
+    UrlVerdict,
+    SharedExternalRoot,
+    SharedDomainDiscovery,
 )
-from typing import List, DefaultDict, Literal
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple, cast
 from worker.constants.prompts import (
     get_filter_internal_career_pages_prompt,
     get_filter_external_career_pages_prompt,
@@ -22,9 +22,43 @@ from worker.constants.prompts import (
 from worker.utils.llm_utils import call_llm_structured
 from worker.base_scraper import BaseScraper
 from worker.core.db_ops import DBOps
-from worker.utils.url_utils import same_domain, deduplicate_by_base_url, keep_only_roots
-from worker.dependencies import llm_client, LLM_MODEL
-from worker.utils.text_utils import get_emails, extract_structured_text, extract_visible_text
+from worker.core.crawl_frontier.crawl_frontier import CrawlFrontier, is_job_detail_link
+from worker.core.crawl_frontier.constants import VIDEO_MATCHER
+from worker.core.sitemap_discovery.sitemap_discovery import SitemapDiscovery
+from worker.core.sitemap_discovery.constants import CONFIDENT_SCORE, MAX_CANDIDATES_TO_VERIFY
+from worker.core.tab_pool.tab_pool import TabPool
+from worker.core.page_cache.page_cache import PageCache
+from worker.core.boilerplate_filter.boilerplate_filter import BoilerplateFilter
+from worker.core.page_processing.page_readiness import wait_for_page_ready
+from worker.core.page_processing.constants import READY_SCROLL_TIMEOUT_MS
+from worker.core.cpu_executor.cpu_executor import cpu_executor
+from worker.core.cpu_executor.cpu_tasks import extract_page_links, extract_page_structured_text
+from worker.utils.url_utils import (
+    same_domain,
+    deduplicate_by_base_url,
+    keep_only_roots,
+    canonicalize_url,
+    get_site_host,
+    split_site_path,
+    UrlTrie,
+)
+from worker.dependencies import (
+    llm_client,
+    LLM_MODEL,
+    SHARED_DISCOVERY_TTL_HOURS,
+    DISCOVERY_MAX_LLM_CALLS,
+)
+from worker.utils.redis_commands import (
+    get_url_verdicts,
+    save_url_verdicts,
+    get_shared_cache,
+    save_shared_cache,
+    acquire_shared_lock,
+    release_shared_lock,
+)
+
+SHARED_RESULT_WAIT = 180  # seconds waited for another session crawling the same site
+SHARED_RESULT_POLL_INTERVAL = 5
 
 class FetchJobsListingsScraper(BaseScraper):
     def __init__(
@@ -38,7 +72,7 @@ class FetchJobsListingsScraper(BaseScraper):
     ):
         """Initialize the scraper with company details, browser instance, and an empty state."""
         super().__init__(company_id, company_name, session_logger, browser)
-        self.base_url = base_url.rstrip("/")
+        self.base_url = canonicalize_url(base_url)
         self.external_job_listing_pages: List[str] = []
         self.internal_job_listing_pages: List[str] = []
         self.external_urls: set[str] = set()
@@ -46,376 +80,443 @@ class FetchJobsListingsScraper(BaseScraper):
         self.timeout = timeout
 
         self.db_ops = DBOps(session_logger)
+        self.sitemap_discovery = SitemapDiscovery(session_logger)
+        self.tab_pool = TabPool(session_logger, self.get_context)
+
+        # Page cache hits skip the tab pool, so LLM calls are bounded separately
+        self.llm_semaphore = asyncio.Semaphore(DISCOVERY_MAX_LLM_CALLS)
+
+        # Pages loaded by a discovery step, read again by the next ones without navigating
+        self.page_cache = PageCache(session_logger)
+
+        # Site template learned from the pages prompted, stripped from the next prompts
+        self.boilerplate_filter = BoilerplateFilter(session_logger)
+
+        # Discovery verdicts of previous runs (url -> verdict) and the ones made by this run
+        self.url_verdicts: Dict[str, UrlVerdict] = {}
+        self.new_url_verdicts: Dict[str, UrlVerdict] = {}
 
    
-    async def crawl_site_depth(self, page: Page, base_url: str, max_depth: int = 1) -> List[str]:
+    def pop_crawl_wave(
+        self, frontier: CrawlFrontier, visited_subpages: set[str]
+    ) -> List[Tuple[str, int]]:
+        """Pop the next URLs to load concurrently, best first, skipping visited ones."""
+        wave: List[Tuple[str, int]] = []
+        in_wave: set[str] = set()
+
+        while len(wave) < self.tab_pool.max_tabs and (entry := frontier.pop()) is not None:
+            url, depth = entry
+            normalized_url = canonicalize_url(url)
+
+            if normalized_url in visited_subpages or normalized_url in in_wave:
+                continue
+
+            in_wave.add(normalized_url)
+            wave.append((url, depth))
+
+        return wave
+
+    async def load_page_for_crawl(self, url: str, settle: bool = True) -> Tuple[str, str]:
+        """
+        Load a URL in a pooled tab and return its final URL (after redirects) and HTML.
+        Pages already loaded during this session are read from the page cache.
+        """
+        cached_page = self.page_cache.get(url)
+        if cached_page is not None:
+            return cached_page["final_url"], cached_page["html"]
+
+        async with self.tab_pool.tab(url) as page:
+
+            response = await page.goto(url, timeout=self.timeout, wait_until="load")
+
+            ready = await wait_for_page_ready(page, self.session_logger)
+
+            final_url = page.url
+
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+            # Links rendered lazily after the scroll (pages that never settled are not waited twice)
+            if settle and ready:
+                await wait_for_page_ready(
+                    page, self.session_logger, timeout=READY_SCROLL_TIMEOUT_MS, jitter=False
+                )
+
+            html_content = await page.content()
+
+        self.page_cache.put(
+            url, final_url, response.status if response else None, html_content
+        )
+
+        return final_url, html_content
+
+    def handle_crawl_timeout(
+        self,
+        frontier: CrawlFrontier,
+        failed_urls: set[str],
+        url: str,
+        depth: int,
+        error: BaseException,
+    ) -> float:
+        """Requeue a timed out URL once (its tab was recycled) and return the backoff to apply."""
+        normalized_url = canonicalize_url(url)
+        self.session_logger.warning(f"Timeout on {normalized_url}: {error}")
+
+        if normalized_url in failed_urls:
+            self.session_logger.warning("Already retried once, skipping permanently.")
+            return 0
+
+        failed_urls.add(normalized_url)
+        frontier.requeue(url, depth)
+
+        return 2 * len(failed_urls)
+
+    async def crawl_site_depth(self, base_url: str, max_depth: int = 1) -> List[str]:
         """
         Crawls a site using Playwright to extract emails, subpages, and external links.
-        Limits crawling to `max_depth` hierarchical levels.
+        Limits crawling to `max_depth` hierarchical levels and visits the most
+        career-like pages first (see CrawlFrontier), several tabs at a time.
+        Results of a wave are merged in pop order so the crawl stays deterministic.
         """
 
         # === Initialization ===
         visited_subpages = set()
-        queue = deque([(base_url, 0)])
-        failed_urls = set()
+        frontier = CrawlFrontier(self.session_logger, max_depth=max_depth)
+        frontier.push(base_url, 0)
+        failed_urls: set[str] = set()
         first_iteration = True
-        pattern_counts: DefaultDict[str, int] = defaultdict(int)
 
         # === Crawl control constants ===
-        MAX_PER_PATTERN = 5  # Prevent over-crawling repetitive URL structures
         SKIP_EXTENSIONS = [".js", ".css", ".jpg", ".jpeg", ".png", ".pdf"]
-        VIDEO_KEYWORDS = [
-            "youtube",
-            "vimeo",
-            "dailymotion",
-            "wistia",
-            "player.",
-            "video",
-        ]
-
-        # === Helper: Normalize URL into pattern keys ===
-        def get_pattern_keys(url: str, depth: int = 2) -> List[str]:
-            """
-            Normalize a URL into hierarchical pattern keys for rate-limiting.
-            Strips language codes like /en/, /de/, /en-US/, /pt-BR/, etc.
-            Ensures parent categories also count towards the limit.
-            """
-            parsed = urlparse(url)
-            parts = parsed.path.strip("/").split("/")
-            LANG_PATTERN = re.compile(r"^[a-z]{2}(-[A-Z]{2})?$")
-
-            # Drop leading language code if present (e.g., /en/, /de/, /en-US/)
-            if parts and LANG_PATTERN.match(parts[0]):
-                parts = parts[1:]
-
-            # Collapse trailing numeric parts (e.g., /123/)
-            while parts and re.fullmatch(r"\d+", parts[-1]):
-                parts = parts[:-1]
-
-            # Generate hierarchical pattern keys
-            keys = []
-            for d in range(min(len(parts), depth), 0, -1):
-                path = "/" + "/".join(parts[:d]) + "/"
-                keys.append(f"{parsed.scheme}://{parsed.netloc}{path}")
-            return keys
 
         # === Helper: Enqueue internal links safely ===
-        def enqueue_if_valid(link_url: str, current_depth: int):
-            """Add a same-domain link to the crawl queue if depth and deduplication checks pass."""
+        def enqueue_if_valid(
+            link_url: str,
+            current_depth: int,
+            anchor_text: str = "",
+            in_site_chrome: bool = False,
+        ):
+            """Add a same-domain link to the crawl frontier if depth and deduplication checks pass."""
             is_same_domain = same_domain(link_url, self.base_url)
             if is_same_domain:
-                if (
-                    link_url not in visited_subpages
-                    and all(link_url != q for q, _ in queue)
-                    and current_depth + 1 <= max_depth
-                ):
-                    queue.append((link_url, current_depth + 1))
+                if canonicalize_url(link_url) not in visited_subpages:
+                    frontier.push(
+                        link_url, current_depth + 1, anchor_text, in_site_chrome
+                    )
                 return
 
-            self.external_urls.add(link_url)
+            self.external_urls.add(canonicalize_url(link_url))
 
         # === Crawl Loop ===
-        while queue:
-            url, depth = queue.popleft()
-            normalized_url = url.split("#")[0]
-
-            # --- Pattern rate limiting ---
-            pattern_keys = get_pattern_keys(normalized_url, depth=2)
-            if any(pattern_counts[k] >= MAX_PER_PATTERN for k in pattern_keys):
-                self.session_logger.info(
-                    f"⏭️ Skipping {normalized_url}, pattern cap reached"
-                )
-                continue
-            for k in pattern_keys:
-                pattern_counts[k] += 1
+        while wave := self.pop_crawl_wave(frontier, visited_subpages):
 
-            # --- Already visited or too deep ---
-            if normalized_url in visited_subpages or depth > max_depth:
-                continue
+            results = await asyncio.gather(
+                *(self.load_page_for_crawl(url) for url, _ in wave),
+                return_exceptions=True,
+            )
 
-            try:
+            backoff = 0.0
 
-                await page.goto(
-                    normalized_url, timeout=self.timeout, wait_until="load"
-                )
+            for (url, depth), result in zip(wave, results):
+                normalized_url = canonicalize_url(url)
+
+                # === Timeout handling ===
+                if isinstance(result, PlaywrightTimeoutError):
+                    backoff = max(
+                        backoff,
+                        self.handle_crawl_timeout(
+                            frontier, failed_urls, url, depth, result
+                        ),
+                    )
+                    continue
 
-                await page.wait_for_timeout(random.uniform(1000, 3000))
+                # === General exception handling ===
+                if isinstance(result, BaseException):
+                    self.session_logger.error(
+                        f"⚠️ Unexpected error on {normalized_url}: {result}"
+                    )
+                    continue
 
-                normalized_url = page.url  # handle redirects
+                normalized_url, html_content = result  # handle redirects
 
                 if first_iteration:
-                    self.base_url = normalized_url.rstrip("/")
+                    self.base_url = canonicalize_url(normalized_url)
                     self.session_logger.info(f"🔄 Base URL updated to: {self.base_url}")
                     first_iteration = False
 
                 self.session_logger.info(f"Visited Url: {normalized_url}")
 
-                visited_subpages.add(normalized_url)
+                visited_subpages.add(canonicalize_url(normalized_url))
+                frontier.mark_visited(normalized_url)
 
-                await page.evaluate(
-                    "window.scrollTo(0, document.body.scrollHeight)"
+                # === Extract content (parsed once, on a worker process for links and emails) ===
+                links = await cpu_executor.run_in_process(
+                    extract_page_links, html_content.encode(), normalized_url
                 )
 
-                await page.wait_for_timeout(
-                    random.uniform(1000, 3000)
-                )  # human-like delay
-
-                # === Extract content ===
-                html_content = await page.content()
-                soup = BeautifulSoup(html_content, "html.parser")
-
                 # Extract and store any visible emails
-                visible_text = extract_visible_text(html_content)
-                new_emails = get_emails(visible_text)
+                new_emails = set(links["emails"])
                 if new_emails:
                     self.session_logger.info(f"Emails found: {new_emails}")
                     self.emails.update(new_emails)
 
                 # === Process iframes ===
-                for iframe in soup.find_all("iframe", src=True):
-                    if not isinstance(iframe, Tag):
-                        continue
-
-                    src_attr = iframe.get("src")
-                    if not isinstance(src_attr, str):
-                        continue
-
+                for src_attr in links["iframe_srcs"]:
                     iframe_src = src_attr.split("#")[0]
                     iframe_url = urljoin(normalized_url, iframe_src)
 
                     if (
-                        any(keyword in iframe_url.lower() for keyword in VIDEO_KEYWORDS)
+                        VIDEO_MATCHER.matches(iframe_url.lower())
                         or any(iframe_url.endswith(ext) for ext in SKIP_EXTENSIONS)
                         or iframe_url.startswith("mailto:")
                         or "javascript:void" in iframe_url
-                        or iframe_url in visited_subpages
+                        or canonicalize_url(iframe_url) in visited_subpages
                     ):
                         continue
 
                     enqueue_if_valid(iframe_url, depth)
 
                 # === Process links (<a> tags) ===
-                for link in soup.find_all("a", href=True):
-                    if not isinstance(link, Tag):
-                        continue
-
-                    href_attr = link.get("href")
-                    if not isinstance(href_attr, str):
-                        continue
+                job_links: set[str] = set()
 
+                for href_attr, link_text, in_chrome in links["anchors"]:
                     href = href_attr.split("#")[0]
                     if not href or href.startswith(("#", "tel:", "javascript:")):
                         continue
 
                     absolute_link = urljoin(normalized_url, href)
+                    if is_job_detail_link(absolute_link):
+                        job_links.add(canonicalize_url(absolute_link))
+
                     if (
-                        any(
-                            keyword in absolute_link.lower()
-                            for keyword in VIDEO_KEYWORDS
-                        )
-                        or absolute_link in visited_subpages
+                        VIDEO_MATCHER.matches(absolute_link.lower())
+                        or canonicalize_url(absolute_link) in visited_subpages
                         or any(absolute_link.endswith(ext) for ext in SKIP_EXTENSIONS)
                         or absolute_link.startswith("mailto:")
                         or "javascript:void" in absolute_link
                     ):
                         continue
 
-                    enqueue_if_valid(absolute_link, depth)
-
-            # === Timeout handling ===
-            except PlaywrightTimeoutError as e:
-                self.session_logger.warning(f"Timeout on {normalized_url}: {e}")
-                if normalized_url not in failed_urls:
-                    failed_urls.add(normalized_url)
-                    backoff = 2 * len(failed_urls)
-                    self.session_logger.info(
-                        f"Restarting browser and retrying after {backoff}s..."
+                    enqueue_if_valid(
+                        absolute_link,
+                        depth,
+                        link_text,
+                        in_chrome,
                     )
-                    await asyncio.sleep(backoff)
-                    await self.restart_context()
-                    queue.append((url, depth))
-                else:
-                    self.session_logger.warning(
-                        "Already retried once, skipping permanently."
-                    )
-                continue
 
-            # === General exception handling ===
-            except Exception as e:
-                self.session_logger.error(
-                    f"⚠️ Unexpected error on {normalized_url}: {e}"
-                )
-                continue
+                # Early exit relies on pages actually listing jobs, not on URL keywords
+                frontier.confirm_listing(normalized_url, len(job_links))
+
+            if backoff:
+                self.session_logger.info(f"Retrying timed out pages after {backoff}s...")
+                await asyncio.sleep(backoff)
 
         # === Return crawled pages ===
         return list(visited_subpages)
 
     async def crawl_site_path_prefix_only(
-        self, page: Page, base_url: str, max_depth=1
+        self,
+        base_url: str,
+        max_depth=1,
+        external_urls: Optional[set[str]] = None,
     ) -> List[str]:
         """
         Crawls a site using Playwright to extract emails, subpages, and external links.
         Only visits URLs that match the base_url path prefix.
-        Limits crawling to `max_depth` hierarchical levels.
+        Limits crawling to `max_depth` hierarchical levels, several tabs at a time.
+        External links are collected into `external_urls` (self.external_urls by default).
         """
 
         # === Initialization ===
         visited_subpages = set()
-        queue = deque([(base_url, 0)])
-        failed_urls = set()
+        frontier = CrawlFrontier(
+            self.session_logger,
+            max_depth=max_depth,
+            max_pages=None,
+            max_per_pattern=None,
+            early_exit=False,
+        )
+        frontier.push(base_url, 0)
+        failed_urls: set[str] = set()
+
+        if external_urls is None:
+            external_urls = self.external_urls
 
-        base_parsed = urlparse(base_url)
-        base_path_prefix = base_parsed.path.rstrip("/") or "/"
+        # Pages at or below the base URL path (whole segments: /jobs does not cover /jobsearch)
+        base_scope = UrlTrie([base_url], split=split_site_path)
 
         # === Constants ===
         SKIP_EXTENSIONS = [".js", ".css", ".jpg", ".jpeg", ".png", ".pdf"]
-        VIDEO_KEYWORDS = [
-            "youtube",
-            "vimeo",
-            "dailymotion",
-            "wistia",
-            "player.",
-            "video",
-        ]
 
-        while queue:
-            url, depth = queue.popleft()
-            normalized_url = url.split("#")[0]
+        # === Helper function for enqueueing internal URLs ===
+        def enqueue_if_valid(link_url: str, current_depth: int, anchor_text: str = ""):
+            """Enqueue a same-domain, prefix-matching URL if depth allows."""
+            is_same_domain = same_domain(link_url, base_url)
+            if is_same_domain:
+                if (
+                    base_scope.in_scope(link_url)
+                    and canonicalize_url(link_url) not in visited_subpages
+                ):
+                    frontier.push(link_url, current_depth + 1, anchor_text)
 
-            if normalized_url in visited_subpages or depth > max_depth:
-                continue
+                return
+            external_urls.add(canonicalize_url(link_url))
 
-            try:
+        while wave := self.pop_crawl_wave(frontier, visited_subpages):
 
-                await page.goto(
-                    normalized_url, timeout=self.timeout, wait_until="load"
-                )
+            results = await asyncio.gather(
+                *(
+                    self.load_page_for_crawl(url, settle=False)
+                    for url, _ in wave
+                ),
+                return_exceptions=True,
+            )
 
-                await page.wait_for_timeout(random.uniform(1000, 3000))
+            backoff = 0.0
 
-                self.session_logger.info(f"Visited Url: {page.url}")
+            for (url, depth), result in zip(wave, results):
+                normalized_url = canonicalize_url(url)
 
-                await page.evaluate(
-                    "window.scrollTo(0, document.body.scrollHeight)"
-                )
+                if isinstance(result, PlaywrightTimeoutError):
+                    backoff = max(
+                        backoff,
+                        self.handle_crawl_timeout(
+                            frontier, failed_urls, url, depth, result
+                        ),
+                    )
+                    continue
+
+                # === Catch-All Error Handling ===
+                if isinstance(result, BaseException):
+                    self.session_logger.error(f"Unexpected error on {normalized_url}: {result}")
+                    continue
+
+                final_url, html_content = result
+
+                self.session_logger.info(f"Visited Url: {final_url}")
 
                 visited_subpages.add(normalized_url)
 
-                # === Parse content ===
-                html_content = await page.content()
-                soup = BeautifulSoup(html_content, "html.parser")
+                # === Parse content (once on a worker process, for links and emails) ===
+                links = await cpu_executor.run_in_process(
+                    extract_page_links, html_content.encode(), final_url
+                )
 
                 # === Extract and store emails ===
-                visible_text = extract_visible_text(html_content)
-                new_emails = get_emails(visible_text)
+                new_emails = set(links["emails"])
                 if new_emails:
                     self.session_logger.info(f"Emails found: {new_emails}")
                     self.emails.update(new_emails)
 
-                # === Helper function for enqueueing internal URLs ===
-                def enqueue_if_valid(link_url: str):
-                    """Enqueue a same-domain, prefix-matching URL if depth allows."""
-                    is_same_domain = same_domain(link_url, base_url)
-                    if is_same_domain:
-                        if (
-                            urlparse(link_url).path.startswith(base_path_prefix)
-                            and link_url not in visited_subpages
-                            and all(link_url != queued for queued, _ in queue)
-                            and depth + 1 <= max_depth
-                        ):
-                            queue.append((link_url, depth + 1))
-
-                        return
-                    self.external_urls.add(link_url)
-
                 # === Process iframes ===
-                for iframe in soup.find_all("iframe", src=True):
-                    if not isinstance(iframe, Tag):
-                        continue
-
-                    src_attr = iframe.get("src")
-                    if not isinstance(src_attr, str):
-                        continue
-
+                for src_attr in links["iframe_srcs"]:
                     iframe_src = src_attr.split("#")[0]
-                    iframe_url = urljoin(normalized_url, iframe_src)
+                    iframe_url = urljoin(final_url, iframe_src)
 
                     if (
-                        any(keyword in iframe_url.lower() for keyword in VIDEO_KEYWORDS)
+                        VIDEO_MATCHER.matches(iframe_url.lower())
                         or any(iframe_url.endswith(ext) for ext in SKIP_EXTENSIONS)
                         or iframe_url.startswith("mailto:")
                         or "javascript:void" in iframe_url
                     ):
                         continue
 
-                    enqueue_if_valid(iframe_url)
+                    enqueue_if_valid(iframe_url, depth)
 
                 # === Process <a> links ===
-                for link in soup.find_all("a", href=True):
-                    if not isinstance(link, Tag):
-                        continue
-
-                    href_attr = link.get("href")
-                    if not isinstance(href_attr, str):
-                        continue
-
+                for href_attr, link_text, _ in links["anchors"]:
                     href = href_attr.split("#")[0]
                     if not href or href.startswith(("#", "tel:", "javascript:")):
                         continue
 
-                    absolute_link = urljoin(normalized_url, href)
+                    absolute_link = urljoin(final_url, href)
 
                     if (
-                        any(
-                            keyword in absolute_link.lower()
-                            for keyword in VIDEO_KEYWORDS
-                        )
+                        VIDEO_MATCHER.matches(absolute_link.lower())
                         or any(absolute_link.endswith(ext) for ext in SKIP_EXTENSIONS)
                         or absolute_link.startswith("mailto:")
                         or "javascript:void" in absolute_link
                     ):
                         continue
 
-                    enqueue_if_valid(absolute_link)
+                    enqueue_if_valid(absolute_link, depth, link_text)
 
-            except PlaywrightTimeoutError as e:
-                self.session_logger.warning(f"Timeout on {normalized_url}: {e}")
-                if normalized_url not in failed_urls:
-                    failed_urls.add(normalized_url)
-                    backoff = 2 * len(failed_urls)
-                    self.session_logger.info(
-                        f"Restarting browser after {backoff}s delay..."
-                    )
-                    await asyncio.sleep(backoff)
-                    await self.restart_context()
-                    queue.append((url, depth))
-                else:
-                    self.session_logger.warning(
-                        "Already retried once, skipping permanently."
-                    )
-                continue
-
-            # === Catch-All Error Handling ===
-            except Exception as e:
-                self.session_logger.error(f"Unexpected error on {normalized_url}: {e}")
-                continue
+            if backoff:
+                self.session_logger.info(f"Retrying timed out pages after {backoff}s...")
+                await asyncio.sleep(backoff)
 
         return list(visited_subpages)
 
+    @staticmethod
+    def get_verdict_key(page: str, base_url: Optional[str] = None) -> str:
+        """Return the canonical URL a verdict is stored under (paths are resolved against base_url)."""
+        page = page.strip()
+        if base_url and not page.startswith(("http://", "https://")):
+            page = urljoin(base_url + "/", page.lstrip("/"))
+        return canonicalize_url(page)
+
+    def get_url_verdict(self, page: str, base_url: Optional[str] = None) -> Optional[str]:
+        """Return the verdict known for a page (career_candidate, non_career, listing, non_listing)."""
+        url_verdict = self.url_verdicts.get(self.get_verdict_key(page, base_url))
+        return url_verdict["verdict"] if url_verdict else None
+
+    def record_url_verdict(
+        self,
+        page: str,
+        verdict: Literal["career_candidate", "non_career", "listing", "non_listing"],
+        source: str,
+        base_url: Optional[str] = None,
+    ) -> None:
+        """Remember a discovery verdict, saved at the end of the run."""
+        url_verdict: UrlVerdict = {
+            "verdict": verdict,
+            "source": source,
+            "checked_at": time.time(),
+        }
+        key = self.get_verdict_key(page, base_url)
+        self.url_verdicts[key] = url_verdict
+        self.new_url_verdicts[key] = url_verdict
+
     async def filter_career_pages(
         self,
         pages: set[str],
         scope: Literal["internal", "external", "all"] = "all",
+        base_url: Optional[str] = None,
     ) -> List[str]:
         """Ask the LLM to identify career/job listing pages.
 
+        Pages with a verdict from a previous run are not sent again: known
+        career pages are returned directly, known non-career pages dropped.
+
         Args:
             pages: List of URLs to evaluate.
             scope: "internal" for company domain pages,
                 "external" for third-party sites,
                 "all" for mixed or generic filtering.
+            base_url: URL the relative paths of `pages` are relative to.
         """
 
+        # --- Verdicts remembered from previous runs
+        known_career_pages: List[str] = []
+        pages_to_ask: set[str] = set()
+
+        for page in pages:
+            verdict = self.get_url_verdict(page, base_url)
+            if verdict is None:
+                pages_to_ask.add(page)
+            elif verdict in ("career_candidate", "listing"):
+                known_career_pages.append(page)
+
+        if len(pages_to_ask) < len(pages):
+            self.session_logger.info(
+                f"Verdict memory: {len(known_career_pages)} known career pages, "
+                f"{len(pages) - len(pages_to_ask) - len(known_career_pages)} known non-career pages skipped"
+            )
+
+        if not pages_to_ask:
+            return sorted(known_career_pages)
+
+        pages = pages_to_ask
+
         # --- Choose the right prompt based on scope
         if scope == "internal":
             prompt = get_filter_internal_career_pages_prompt(self.company_name, pages)
@@ -436,106 +537,133 @@ class FetchJobsListingsScraper(BaseScraper):
         ]
 
         # --- Call the LLM (with retry + cleanup)
-        result_structured = await call_llm_structured(
-            llm_client=llm_client,
-            model=LLM_MODEL,
-            messages=messages,
-            logger=self.session_logger,
-            max_tokens=1024,
-            temperature=0.0,
-            retry=True,
-            pydantic_model=CareerPagesResponse,
-        )
+        async with self.llm_semaphore:
+            result_structured = await call_llm_structured(
+                llm_client=llm_client,
+                model=LLM_MODEL,
+                messages=messages,
+                logger=self.session_logger,
+                max_tokens=1024,
+                temperature=0.0,
+                retry=True,
+                pydantic_model=CareerPagesResponse,
+            )
 
         # --- Handle invalid/empty response
         if not result_structured:
             self.session_logger.warning(
                 f"LLM returned invalid or empty JSON for {context}."
             )
-            return []
+            return sorted(known_career_pages)
 
         # --- Validate with Pydantic
         try:
             validated = CareerPagesResponse.model_validate(result_structured)
-            return validated.career_pages or []
+            career_pages = validated.career_pages or []
         except Exception as e:
             self.session_logger.error(f"Validation failed for {context}: {e}")
-            return []
+            return sorted(known_career_pages)
+
+        # --- Remember the verdicts so the next run does not ask again
+        career_keys = {self.get_verdict_key(page, base_url) for page in career_pages}
+
+        for page in pages:
+            self.record_url_verdict(
+                page,
+                "career_candidate"
+                if self.get_verdict_key(page, base_url) in career_keys
+                else "non_career",
+                f"filter_{scope}",
+                base_url,
+            )
 
-    async def identify_job_listing_pages(
-        self, page: Page, urls: set[str], retries: int = 1
-    ) -> List[str]:
+        return sorted(known_career_pages) + career_pages
+
+    async def identify_job_listing_page(self, url: str, retries: int = 1) -> bool:
         """
-        Checks which URLs are job listing pages using an LLM.
-        Uses Playwright to fetch HTML content before analysis.
+        Checks whether a URL is a job listing page using an LLM.
+        Uses a pooled Playwright tab to fetch HTML content before analysis,
+        unless the page was already loaded during this session (page cache).
+        Listing / non-listing verdicts of previous runs are reused as is.
         """
+        verdict = self.get_url_verdict(url)
+        if verdict in ("listing", "non_listing"):
+            self.session_logger.info(f"Known {verdict} page (verdict memory): {url}")
+            return verdict == "listing"
 
-        job_listing_pages: List[str] = []
+        self.session_logger.info(f"Testing job listing page URL: {url}")
 
-        for url in urls:
-            self.session_logger.info(f"Testing job listing page URL: {url}")
+        attempt = 0
+        text_content = await self.page_cache.get_structured_text(url)
 
-            attempt = 0
-            text_content = None
+        # --- Attempt to fetch page content with retries
+        while text_content is None and attempt <= retries:
 
-            # --- Attempt to fetch page content with retries
-            while attempt <= retries:
+            try:
 
-                try:
+                async with self.tab_pool.tab(url) as page:
 
-                    await page.goto(url, timeout=self.timeout, wait_until="load")
+                    response = await page.goto(url, timeout=self.timeout, wait_until="load")
 
-                    await page.wait_for_timeout(random.uniform(1000, 3000))
+                    await wait_for_page_ready(page, self.session_logger)
+
+                    final_url = page.url
 
                     await page.evaluate(
                         "window.scrollTo(0, document.body.scrollHeight)"
                     )
 
                     html_content = await page.content()
-                    soup = BeautifulSoup(html_content, "html.parser")
 
-                    # Remove irrelevant tags
-                    for tag in soup(["script", "style", "meta", "svg"]):
-                        tag.decompose()
+                self.page_cache.put(
+                    url, final_url, response.status if response else None, html_content
+                )
 
-                    text_content = extract_structured_text(
-                        soup, url, skip_existing_jobs=False
-                    )
+                # Irrelevant tags removed
+                text_content = await cpu_executor.run_in_process(
+                    extract_page_structured_text,
+                    html_content.encode(),
+                    url,
+                    ["script", "style", "meta", "svg"],
+                )
 
-                    break
+                break
 
-                except PlaywrightTimeoutError as e:
-                    self.session_logger.warning(
-                        f"Timeout on attempt {attempt + 1} for {url}: {e}"
+            except PlaywrightTimeoutError as e:
+                self.session_logger.warning(
+                    f"Timeout on attempt {attempt + 1} for {url}: {e}"
+                )
+                if attempt < retries:
+                    # The tab that timed out is recycled by the pool
+                    self.session_logger.info("Retrying in a fresh tab...")
+                    attempt += 1
+                    continue
+                else:
+                    self.session_logger.error(
+                        "Retry limit reached. Skipping this URL."
                     )
-                    if attempt < retries:
-                        self.session_logger.info("Restarting browser and retrying...")
-                        await self.restart_context()
-                        attempt += 1
-                        continue
-                    else:
-                        self.session_logger.error(
-                            "Retry limit reached. Skipping this URL."
-                        )
-                        break
-
-                except Exception as e:
-                    self.session_logger.error(f"Unexpected error loading {url}: {e}")
                     break
 
-            # --- Skip if page failed to load
-            if not text_content:
-                continue
+            except Exception as e:
+                self.session_logger.error(f"Unexpected error loading {url}: {e}")
+                break
+
+        # --- Skip if page failed to load
+        if not text_content:
+            return False
+
+        text_content = self.boilerplate_filter.strip(url, text_content)
 
-            # --- Build prompts for LLM
-            system_prompt, user_prompt = get_identify_career_page_prompt(text_content)
+        # --- Build prompts for LLM
+        system_prompt, user_prompt = get_identify_career_page_prompt(text_content)
 
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ]
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-            # --- Use shared LLM helper with auto-cleaning JSON handling
+        # --- Use shared LLM helper with auto-cleaning JSON handling
+        async with self.llm_semaphore:
             result_structured = await call_llm_structured(
                 llm_client=llm_client,
                 model=LLM_MODEL,
@@ -547,32 +675,75 @@ class FetchJobsListingsScraper(BaseScraper):
                 pydantic_model=IsJobListingPageResponse,
             )
 
-            if not result_structured:
-                self.session_logger.warning(
-                    f"No valid JSON response from LLM for {url}"
-                )
-                continue
+        if not result_structured:
+            self.session_logger.warning(
+                f"No valid JSON response from LLM for {url}"
+            )
+            return False
 
-            # --- Validate response with Pydantic
-            try:
-                validated = IsJobListingPageResponse.model_validate(result_structured)
-            except Exception as e:
-                self.session_logger.error(f"Validation failed for {url}: {e}")
-                continue
+        # --- Validate response with Pydantic
+        try:
+            validated = IsJobListingPageResponse.model_validate(result_structured)
+        except Exception as e:
+            self.session_logger.error(f"Validation failed for {url}: {e}")
+            return False
 
-            # --- Final decision
-            if validated.is_job_listing_page == "yes":
-                job_listing_pages.append(url)
-                self.session_logger.info(f"Identified as job listing page: {url}")
-            else:
-                self.session_logger.info(f"Not a job listing page: {url}")
+        # --- Final decision
+        if validated.is_job_listing_page == "yes":
+            self.session_logger.info(f"Identified as job listing page: {url}")
+            self.record_url_verdict(url, "listing", "identify")
+            return True
+
+        self.session_logger.info(f"Not a job listing page: {url}")
+        self.record_url_verdict(url, "non_listing", "identify")
+        return False
+
+    async def identify_job_listing_pages(
+        self, urls: set[str], retries: int = 1
+    ) -> List[str]:
+        """
+        Checks which URLs are job listing pages using an LLM, several pages at a time.
+        Returns them in sorted URL order so results do not depend on load timings.
+        """
+        ordered_urls = sorted(urls)
+
+        results = await asyncio.gather(
+            *(self.identify_job_listing_page(url, retries) for url in ordered_urls)
+        )
+
+        return [url for url, is_listing in zip(ordered_urls, results) if is_listing]
+
+    async def find_job_listing_pages_from_sitemaps(self) -> List[str]:
+        """Score career candidates from robots.txt / sitemaps and confirm the best ones via LLM."""
+        candidates = await self.sitemap_discovery.discover_candidates(self.base_url)
+
+        if not candidates or candidates[0]["score"] < CONFIDENT_SCORE:
+            self.session_logger.info("No confident sitemap candidates, falling back to crawling.")
+            return []
+
+        top_candidates = {
+            candidate["url"] for candidate in candidates[:MAX_CANDIDATES_TO_VERIFY]
+        }
+
+        self.session_logger.info(
+            f"Verifying {len(top_candidates)} sitemap candidates: {top_candidates}"
+        )
+
+        job_listing_pages = await self.identify_job_listing_pages(top_candidates)
+
+        # --- Sitemaps may list another host variant (www / non-www) than the stored website
+        if job_listing_pages:
+            listing_parsed = urlparse(job_listing_pages[0])
+            if listing_parsed.netloc != urlparse(self.base_url).netloc:
+                self.base_url = f"{listing_parsed.scheme}://{listing_parsed.netloc}"
+                self.session_logger.info(f"🔄 Base URL updated to: {self.base_url}")
 
         return job_listing_pages
 
-    async def find_internal_career_pages(self, page: Page) -> List[str]:
-        """Crawl the company's own site, identify career pages, and return deduplicated job listing URLs."""
+    async def find_job_listing_pages_from_crawl(self) -> List[str]:
+        """Crawl the company's own site and identify job listing pages among visited URLs via LLM."""
         # --- Crawl the main site and collect all visited URLs
-        main_visited_pages = await self.crawl_site_depth(page, self.base_url)
+        main_visited_pages = await self.crawl_site_depth(self.base_url)
 
         # --- Prepare container for deduplicated relative paths
         #     We reduce redundancy by normalizing and trimming duplicate base paths
@@ -596,7 +767,7 @@ class FetchJobsListingsScraper(BaseScraper):
 
         # --- Ask LLM to identify which internal paths are career pages
         internal_pages_filtered = await self.filter_career_pages(
-            deduped_main_paths, "internal"
+            deduped_main_paths, "internal", self.base_url
         )
 
         internal_career_pages = set()
@@ -622,9 +793,19 @@ class FetchJobsListingsScraper(BaseScraper):
         )
 
         # --- Ask LLM to identify which internal career pages are job listing pages (vs job detail pages)
-        internal_job_listing_pages = await self.identify_job_listing_pages(
-            page, internal_career_pages
-        )
+        return await self.identify_job_listing_pages(internal_career_pages)
+
+    async def find_internal_career_pages(self) -> List[str]:
+        """Find the company's own job listing pages (sitemaps first, then crawl), before the deeper crawl."""
+        # --- Sitemaps often list the career pages directly, which avoids the depth crawl
+        internal_job_listing_pages = await self.find_job_listing_pages_from_sitemaps()
+
+        if internal_job_listing_pages:
+            self.session_logger.info(
+                "Job listing pages confirmed from sitemaps, skipping depth crawl."
+            )
+        else:
+            internal_job_listing_pages = await self.find_job_listing_pages_from_crawl()
 
         # --- Filter out blocked or irrelevant domains (LinkedIn, Indeed, etc.)
         internal_job_listing_pages = [
@@ -637,6 +818,12 @@ class FetchJobsListingsScraper(BaseScraper):
             f"Job Listing Pages Identified on Internal Site Step 1: {internal_job_listing_pages}"
         )
 
+        return internal_job_listing_pages
+
+    async def expand_internal_career_pages(
+        self, internal_job_listing_pages: List[str]
+    ) -> List[str]:
+        """Re-crawl internal job listing pages one level deeper and return deduplicated URLs."""
         # --- Re-crawl internal job listing pages one level deeper
         #     This helps discover job listings that may live under nested subpages
         self.session_logger.info(
@@ -647,30 +834,37 @@ class FetchJobsListingsScraper(BaseScraper):
         root_parsed = urlparse(self.base_url)
         base_prefix = root_parsed.path
 
-        for job_page_url in internal_job_listing_pages:
-            if job_page_url != self.base_url:
-                subpages = await self.crawl_site_path_prefix_only(
-                    page, job_page_url, max_depth=1
-                )
-                for sub_url in subpages:
-                    parsed = urlparse(sub_url)
-                    if parsed.netloc == root_parsed.netloc:
-                        if parsed.path.startswith(base_prefix):
-                            relative_path = (
-                                parsed.path[len(base_prefix) :].rstrip("/") or "/"
-                            )
-                            expanded_paths_internal.add(relative_path)
-            else:
-                parsed = urlparse(job_page_url)
-                relative_path = parsed.path[len(base_prefix) :].rstrip("/") or "/"
-                expanded_paths_internal.add(relative_path)
+        pages_to_recrawl = [url for url in internal_job_listing_pages if url != self.base_url]
+
+        # --- Job listing pages are crawled concurrently (the tab pool caps the load per host)
+        recrawled_subpages = await asyncio.gather(
+            *(
+                self.crawl_site_path_prefix_only(job_page_url, max_depth=1)
+                for job_page_url in pages_to_recrawl
+            )
+        )
+
+        for subpages in recrawled_subpages:
+            for sub_url in subpages:
+                parsed = urlparse(sub_url)
+                if parsed.netloc == root_parsed.netloc:
+                    if parsed.path.startswith(base_prefix):
+                        relative_path = (
+                            parsed.path[len(base_prefix) :].rstrip("/") or "/"
+                        )
+                        expanded_paths_internal.add(relative_path)
+
+        if self.base_url in internal_job_listing_pages:
+            parsed = urlparse(self.base_url)
+            relative_path = parsed.path[len(base_prefix) :].rstrip("/") or "/"
+            expanded_paths_internal.add(relative_path)
 
         self.session_logger.info(
             f"Asking LLM Again for Deeper Job Listing Pages ({len(expanded_paths_internal)} paths)..."
         )
 
         deeper_internal_pages_filtered = await self.filter_career_pages(
-            expanded_paths_internal, "internal"
+            expanded_paths_internal, "internal", self.base_url
         )
 
         deeper_career_pages_internal = set()
@@ -694,7 +888,7 @@ class FetchJobsListingsScraper(BaseScraper):
         )
 
         deeper_job_pages = await self.identify_job_listing_pages(
-            page, deeper_career_pages_internal
+            deeper_career_pages_internal
         )
 
         deeper_job_pages = [
@@ -704,10 +898,10 @@ class FetchJobsListingsScraper(BaseScraper):
         ]
 
         # --- Merge results with previous internal job listing pages
-        internal_job_listing_pages.extend(deeper_job_pages)
+        internal_job_listing_pages = internal_job_listing_pages + deeper_job_pages
 
         # --- Deduplicate URLs
-        internal_job_listing_pages = list(set(internal_job_listing_pages))
+        internal_job_listing_pages = sorted(set(internal_job_listing_pages))
 
         # --- Remove query strings and fragments, keeping only one clean version per base URL
         #     Example:
@@ -722,19 +916,148 @@ class FetchJobsListingsScraper(BaseScraper):
 
         return internal_job_listing_pages
 
-    async def find_external_career_pages(self, page: Page) -> List[str]:
+    async def identify_external_root_pages(self, root_url: str, visited_pages: List[str]) -> List[str]:
+        """Identify the job listing pages among the crawled pages of one external career site."""
+        # --- Ensure the root URL itself is included
+        external_visited_pages = visited_pages + [root_url]
+
+        # --- Initialize a set to store deduplicated relative paths
+        deduped_paths = set()
+        root_parsed = urlparse(root_url)
+        base_prefix = root_parsed.path.rstrip("/")
+
+        # --- Normalize and deduplicate all discovered URLs
+        for url in external_visited_pages:
+            parsed = urlparse(url)
+            if parsed.netloc == root_parsed.netloc:
+                if parsed.path.startswith(base_prefix):
+                    relative_path = (
+                        parsed.path[len(base_prefix) :].rstrip("/") or "/"
+                    )
+                    deduped_paths.add(relative_path)
+
+        self.session_logger.info(
+            f"Identifying External Job Pages from {len(deduped_paths)} paths via LLM..."
+        )
+
+        pages_filtered = await self.filter_career_pages(deduped_paths, "all", root_url)
+
+        # --- Convert relative paths returned by the LLM into full absolute URLs
+        pages_filtered_full = set(
+            urljoin(root_url + "/", path.lstrip("/")) for path in pages_filtered
+        )
+
+        pages_filtered_full.add(root_url)
+
+        all_identified = await self.identify_job_listing_pages(pages_filtered_full)
+
+        all_identified = [
+            url
+            for url in all_identified
+            if not any(
+                urlparse(url).netloc.endswith(root) for root in BLOCKED_DOMAINS
+            )
+        ]
+
+        # --- Filter out blocked domains (aggregators like LinkedIn, Indeed, etc.)
+        all_identified = deduplicate_by_base_url(all_identified)
+
+        self.session_logger.info(f"Job Pages Identified External: {all_identified}")
+
+        return all_identified
+
+    async def get_shared_result(self, namespace: str, key: str) -> Optional[Any]:
+        """Read a discovery result shared by other sessions, None if missing or unavailable."""
+        try:
+            return await get_shared_cache(namespace, key)
+        except Exception as e:
+            self.session_logger.warning(f"Failed to read shared {namespace} for {key}: {e}")
+            return None
+
+    async def share_result(self, namespace: str, key: str, value: Mapping[str, Any]) -> None:
+        """Share a discovery result with the other sessions."""
+        try:
+            await save_shared_cache(
+                namespace, key, value, SHARED_DISCOVERY_TTL_HOURS * 60 * 60
+            )
+        except Exception as e:
+            self.session_logger.warning(f"Failed to share {namespace} for {key}: {e}")
+
+    async def discover_external_root(self, root_url: str) -> List[str]:
+        """
+        Crawl one external career site (links found there are not followed further)
+        and identify its job listing pages.
+
+        Results are shared across companies by canonical root URL. A session
+        finding another one already crawling the same site waits for its result.
+        """
+        shared_root = cast(
+            Optional[SharedExternalRoot],
+            await self.get_shared_result("external_root", root_url),
+        )
+        if shared_root is not None:
+            self.session_logger.info(
+                f"Reusing shared discovery of {root_url}: {shared_root['job_listing_pages']}"
+            )
+            return shared_root["job_listing_pages"]
+
+        lock_token: Optional[str] = None
+        lock_failed = False
+        try:
+            lock_token = await acquire_shared_lock("external_root", root_url)
+        except Exception as e:
+            lock_failed = True
+            self.session_logger.warning(f"Failed to lock {root_url}, crawling anyway: {e}")
+
+        if lock_token is None and not lock_failed:
+            self.session_logger.info(f"{root_url} is crawled by another session, waiting...")
+
+            for _ in range(SHARED_RESULT_WAIT // SHARED_RESULT_POLL_INTERVAL):
+                await asyncio.sleep(SHARED_RESULT_POLL_INTERVAL)
+                shared_root = await self.get_shared_result("external_root", root_url)
+                if shared_root is not None:
+                    return shared_root["job_listing_pages"]
+
+            self.session_logger.info(f"No shared result for {root_url} in time, crawling it.")
+
+        try:
+            visited_pages = await self.crawl_site_path_prefix_only(
+                root_url, external_urls=set()
+            )
+
+            job_listing_pages = await self.identify_external_root_pages(
+                root_url, visited_pages
+            )
+
+            # --- Only share sites that could be loaded
+            if visited_pages:
+                result: SharedExternalRoot = {"job_listing_pages": job_listing_pages}
+                await self.share_result("external_root", root_url, result)
+
+            return job_listing_pages
+
+        finally:
+            if lock_token is not None:
+                try:
+                    await release_shared_lock("external_root", root_url, lock_token)
+                except Exception:
+                    pass
+
+    async def find_external_career_pages(
+        self, external_urls: set[str], internal_job_listing_pages: List[str]
+    ) -> List[str]:
         """Identify and crawl external job platforms linked from the company site, returning job listing URLs."""
 
         self.session_logger.info("Step 3: Identifying External Career Pages via LLM...")
 
         self.session_logger.info(
-            f"2 Filtered External Urls found in website: {self.external_urls}"
+            f"2 Filtered External Urls found in website: {external_urls}"
         )
 
         # --- Filter out blocked external URLs (convert to set for uniqueness)
         filtered_external_urls: set[str] = {
             url
-            for url in self.external_urls
+            for url in external_urls
             if not any(urlparse(url).netloc.endswith(root) for root in BLOCKED_DOMAINS)
         }
 
@@ -742,6 +1065,9 @@ class FetchJobsListingsScraper(BaseScraper):
             f"Filtered External Urls found in website: {filtered_external_urls}"
         )
 
+        if not filtered_external_urls:
+            return []
+
         # --- Call the LLM to classify external URLs as valid career pages
         external_pages_filtered = await self.filter_career_pages(
             filtered_external_urls, "external"
@@ -767,10 +1093,10 @@ class FetchJobsListingsScraper(BaseScraper):
 
         # --- Remove any overlap between external and internal job listing pages
         external_career_pages_roots = external_career_pages_roots - set(
-            self.internal_job_listing_pages
+            internal_job_listing_pages
         )
         external_career_pages_not_modified = external_career_pages_not_modified - set(
-            self.internal_job_listing_pages
+            internal_job_listing_pages
         )
 
         self.session_logger.info(
@@ -789,98 +1115,132 @@ class FetchJobsListingsScraper(BaseScraper):
             f"External Career Pages Not Modified Identified Shortest Path : {external_career_pages_not_modified}"
         )
 
-        self.session_logger.info(f"Step 4: Crawling External Career Site")
+        self.session_logger.info(f"Step 4: Crawling External Career Sites")
 
-        external_job_listing_pages = []
+        root_urls = sorted(
+            {canonicalize_url(url) for url in external_career_pages_not_modified}
+        )
 
-        for root_url in external_career_pages_not_modified:
+        # --- External sites are discovered concurrently (or reused from other companies)
+        identified_roots = await asyncio.gather(
+            *(self.discover_external_root(root_url) for root_url in root_urls)
+        )
 
-            self.session_logger.info(
-                f"Crawling External Career Site Not modified: {root_url}"
-            )
+        external_job_listing_pages: List[str] = []
+
+        # --- Merge in root order so results do not depend on which site answered first
+        for all_identified in identified_roots:
+            external_job_listing_pages.extend(all_identified)
 
-            # --- Crawl the external site to collect all subpages
-            external_visited_pages = await self.crawl_site_path_prefix_only(page, root_url)
+        return external_job_listing_pages
 
-            # --- Ensure the root URL itself is included
-            external_visited_pages.append(root_url)
+    async def discover_job_listing_pages(self) -> None:
+        """Find the internal and external job listing pages of the company website."""
+        # --- Filter the internal career pages
+        internal_job_listing_pages = await self.find_internal_career_pages()
 
-            # --- Initialize a set to store deduplicated relative paths
-            deduped_paths = set()
-            root_parsed = urlparse(root_url)
-            base_prefix = root_parsed.path.rstrip("/")
+        # --- The deeper internal crawl and the external career sites run in parallel
+        external_urls_found = set(self.external_urls)
 
-            # --- Normalize and deduplicate all discovered URLs
-            for url in external_visited_pages:
-                parsed = urlparse(url)
-                if parsed.netloc == root_parsed.netloc:
-                    if parsed.path.startswith(base_prefix):
-                        relative_path = (
-                            parsed.path[len(base_prefix) :].rstrip("/") or "/"
-                        )
-                        deduped_paths.add(relative_path)
+        self.internal_job_listing_pages, self.external_job_listing_pages = (
+            await asyncio.gather(
+                self.expand_internal_career_pages(internal_job_listing_pages),
+                self.find_external_career_pages(
+                    external_urls_found, internal_job_listing_pages
+                ),
+            )
+        )
 
-            self.session_logger.info(
-                f"Identifying External Job Pages from {len(deduped_paths)} paths via LLM..."
+        # --- External links only found by the deeper internal crawl
+        if late_external_urls := self.external_urls - external_urls_found:
+            self.external_job_listing_pages.extend(
+                await self.find_external_career_pages(
+                    late_external_urls, self.internal_job_listing_pages
+                )
             )
 
-            pages_filtered = await self.filter_career_pages(deduped_paths, "all")
+        self.internal_job_listing_pages = list(
+            dict.fromkeys(
+                canonicalize_url(url) for url in self.internal_job_listing_pages
+            )
+        )
 
-            # --- Convert relative paths returned by the LLM into full absolute URLs
-            pages_filtered_full = set(
-                urljoin(root_url + "/", path.lstrip("/")) for path in pages_filtered
+        self.external_job_listing_pages = [
+            url
+            for url in dict.fromkeys(
+                canonicalize_url(url) for url in self.external_job_listing_pages
             )
+            if url not in self.internal_job_listing_pages
+        ]
 
-            pages_filtered_full.add(root_url)
+    async def __call__(self) -> JobListingsResult:
+        """Starts the scraping process."""
 
-            all_identified = await self.identify_job_listing_pages(page, pages_filtered_full)
+        self.session_logger.info("Step 1: Crawling Main Website...")
 
-            all_identified = [
-                url
-                for url in all_identified
-                if not any(
-                    urlparse(url).netloc.endswith(root) for root in BLOCKED_DOMAINS
-                )
-            ]
+        # Host (without www) and path of the website, before redirects update base_url
+        site_key = get_site_host(self.base_url) + urlparse(self.base_url).path
 
-            # --- Filter out blocked domains (aggregators like LinkedIn, Indeed, etc.)
-            all_identified = deduplicate_by_base_url(all_identified)
+        try:
 
-            # --- Store the identified job listing URLs
-            external_job_listing_pages.extend(all_identified)
+            try:
+                self.url_verdicts = await get_url_verdicts(self.company_id)
+            except Exception as e:
+                self.session_logger.warning(f"Failed to load URL verdicts: {e}")
 
-            self.session_logger.info(f"Job Pages Identified External: {all_identified}")
+            # --- Companies sharing a website reuse each other's discovery (a company
+            #     analysed again always rediscovers, to pick up new career pages)
+            shared_discovery = cast(
+                Optional[SharedDomainDiscovery],
+                await self.get_shared_result("domain_discovery", site_key),
+            )
 
-        return external_job_listing_pages
+            if shared_discovery is not None and shared_discovery.get("company_id") == self.company_id:
+                self.session_logger.info(f"Shared discovery of {site_key} is this company's own, rediscovering")
+                shared_discovery = None
 
-    async def __call__(self) -> JobListingsResult:
-        """Starts the scraping process."""
+            if shared_discovery is not None:
+                self.session_logger.info(f"Reusing shared discovery of {site_key}")
+                self.internal_job_listing_pages = shared_discovery["internal_job_listing_pages"]
+                self.external_job_listing_pages = shared_discovery["external_job_listing_pages"]
+                self.emails.update(shared_discovery["emails"])
 
-        self.session_logger.info("Step 1: Crawling Main Website...")
+            else:
+                # The browser is only needed when nothing could be reused
+                await self.create_context_with_proxy()
 
-        await self.create_context_with_proxy()
+                await self.discover_job_listing_pages()
 
-        page = await self.create_page()
-        
-        try:
-        
-            # --- Filter the internal career pages
-            self.internal_job_listing_pages = await self.find_internal_career_pages(page)
+                if self.internal_job_listing_pages or self.external_job_listing_pages:
+                    result: SharedDomainDiscovery = {
+                        "company_id": self.company_id,
+                        "internal_job_listing_pages": self.internal_job_listing_pages,
+                        "external_job_listing_pages": self.external_job_listing_pages,
+                        "emails": sorted(self.emails),
+                    }
+                    await self.share_result("domain_discovery", site_key, result)
 
             self.session_logger.info(
                 f"Final Job Pages Identified on Internal Site: {self.internal_job_listing_pages}"
             )
 
-            self.external_job_listing_pages = await self.find_external_career_pages(page)
-
             self.session_logger.info(
                 f"Final External Pages Identified: {self.external_job_listing_pages}"
             )
 
         finally:
 
-            await page.close()
-            
+            await self.tab_pool.close()
+
+            self.page_cache.log_stats()
+
+            self.boilerplate_filter.log_stats()
+
+            try:
+                await save_url_verdicts(self.company_id, self.new_url_verdicts)
+            except Exception as e:
+                self.session_logger.warning(f"Failed to save URL verdicts: {e}")
+
             await self.clean_contexts_playwright()
 
             await self.db_ops.save_db_job_listing_pages(
@@ -0,0 +1,14 @@
+import re
+
+JOB_POSTING_TYPE = "JobPosting"
+JSON_LD_SCRIPT_TYPE = "application/ld+json"
+MICRODATA_JOB_POSTING_PATTERN = re.compile(r"schema\.org/JobPosting", re.IGNORECASE)
+
+# Keys under which JSON-LD nests other nodes (graphs, item lists...)
+JSON_LD_CONTAINER_KEYS = ["@graph", "itemListElement", "item", "mainEntity", "hasPart"]
+MAX_JSON_LD_DEPTH = 6
+
+# schema.org jobLocationType value for remote jobs
+TELECOMMUTE = "TELECOMMUTE"
+
+MAX_SALARY_LENGTH = 100  # Same bound as the salaries extracted by the LLM
@@ -0,0 +1,326 @@
+import json
+
+from datetime import datetime, timezone
+from bs4 import BeautifulSoup, Tag
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+from worker.types.worker_types import Job
+from worker.utils.job_utils import normalize_contract_type, html_to_text, country_name_from_code
+from worker.utils.url_utils import canonicalize_url, canonicalize_job_url
+from worker.core.page_processing.html_parser import parse_html
+from worker.core.job_posting_extractor.constants import (
+    JOB_POSTING_TYPE,
+    JSON_LD_SCRIPT_TYPE,
+    MICRODATA_JOB_POSTING_PATTERN,
+    JSON_LD_CONTAINER_KEYS,
+    MAX_JSON_LD_DEPTH,
+    TELECOMMUTE,
+    MAX_SALARY_LENGTH,
+)
+
+
+def first_value(value: Any) -> Any:
+    """Return the first item of a list value, or the value itself."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def text_value(value: Any) -> Optional[str]:
+    """Return a schema.org value as text (plain strings or {"name": ...} nodes)."""
+    value = first_value(value)
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("@value")
+    if isinstance(value, (int, float)):
+        value = str(value)
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+class JobPostingExtractor:
+    """
+    Harvests schema.org JobPosting objects (JSON-LD and microdata) from the raw
+    page HTML, before PageProcessing.return_soup strips scripts and meta tags,
+    and maps them into Job fields.
+    """
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+
+    # === JSON-LD ===
+
+    def iter_json_ld_postings(self, node: Any, depth: int = 0) -> Iterator[Dict[str, Any]]:
+        """Yield every JobPosting node of a JSON-LD document (graphs and item lists included)."""
+        if depth > MAX_JSON_LD_DEPTH:
+            return
+
+        if isinstance(node, list):
+            for item in node:
+                yield from self.iter_json_ld_postings(item, depth + 1)
+            return
+
+        if not isinstance(node, dict):
+            return
+
+        node_type = node.get("@type")
+        types = node_type if isinstance(node_type, list) else [node_type]
+        if JOB_POSTING_TYPE in types:
+            yield node
+            return
+
+        for key in JSON_LD_CONTAINER_KEYS:
+            if key in node:
+                yield from self.iter_json_ld_postings(node[key], depth + 1)
+
+    def read_json_ld(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """Return the JobPosting nodes of every JSON-LD script of the page."""
+        postings: List[Dict[str, Any]] = []
+
+        for script in soup.find_all("script", type=JSON_LD_SCRIPT_TYPE):
+            raw = script.string or script.get_text()
+            if not raw or JOB_POSTING_TYPE not in raw:
+                continue
+
+            try:
+                document = json.loads(raw, strict=False)
+            except ValueError as e:
+                self.session_logger.info(f"[SCHEMA] Invalid JSON-LD skipped: {e}")
+                continue
+
+            postings.extend(self.iter_json_ld_postings(document))
+
+        return postings
+
+    # === Microdata ===
+
+    @staticmethod
+    def read_microdata_value(tag: Tag) -> Optional[str]:
+        """Return the value of a microdata property element."""
+        for attribute in ("content", "datetime", "href", "src"):
+            if tag.has_attr(attribute):
+                return str(tag[attribute])
+        return tag.get_text(separator="\n", strip=True) or None
+
+    def read_microdata_item(self, item: Tag) -> Dict[str, Any]:
+        """Return the properties of a microdata item, nested items as dicts."""
+        properties: Dict[str, Any] = {}
+
+        for prop in item.find_all(attrs={"itemprop": True}):
+            # Only direct properties: nested itemscopes own their descendants
+            if prop.find_parent(attrs={"itemscope": True}) is not item:
+                continue
+
+            value = (
+                self.read_microdata_item(prop)
+                if prop.has_attr("itemscope")
+                else self.read_microdata_value(prop)
+            )
+            for name in str(prop["itemprop"]).split():
+                properties.setdefault(name, value)
+
+        return properties
+
+    def read_microdata(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """Return the JobPosting microdata items of the page as JSON-LD like dicts."""
+        return [
+            self.read_microdata_item(item)
+            for item in soup.find_all(
+                attrs={"itemscope": True, "itemtype": MICRODATA_JOB_POSTING_PATTERN}
+            )
+        ]
+
+    # === Mapping ===
+
+    @staticmethod
+    def is_expired(posting: Dict[str, Any]) -> bool:
+        """Return True if validThrough is in the past."""
+        valid_through = text_value(posting.get("validThrough"))
+        if not valid_through:
+            return False
+
+        try:
+            expiry = datetime.fromisoformat(valid_through)
+        except ValueError:
+            return False
+
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+
+        return expiry < datetime.now(timezone.utc)
+
+    @staticmethod
+    def get_location(posting: Dict[str, Any]) -> tuple[Optional[str], Optional[str]]:
+        """Return raw (country, region) hints, matched later against COUNTRY_REGION_DATA."""
+        location = first_value(posting.get("jobLocation")) or {}
+        address = location.get("address") if isinstance(location, dict) else None
+
+        raw_country: Optional[str] = None
+        raw_region: Optional[str] = None
+
+        if isinstance(address, dict):
+            raw_country = text_value(address.get("addressCountry"))
+            raw_region = text_value(address.get("addressRegion"))
+        elif isinstance(address, str):
+            raw_country = address.rsplit(",", 1)[-1].strip()
+
+        # Remote jobs only declare where applicants may live
+        if not raw_country:
+            raw_country = text_value(posting.get("applicantLocationRequirements"))
+
+        return country_name_from_code(raw_country) or raw_country, raw_region
+
+    @staticmethod
+    def get_contract_type(posting: Dict[str, Any]) -> Optional[str]:
+        """Map employmentType (string or list) to a JobLLMExtracted contract_type."""
+        employment_types = posting.get("employmentType")
+        if not isinstance(employment_types, list):
+            employment_types = [employment_types]
+
+        for employment_type in employment_types:
+            if isinstance(employment_type, str) and (
+                contract_type := normalize_contract_type(employment_type)
+            ):
+                return contract_type
+
+        if text_value(posting.get("jobLocationType")) == TELECOMMUTE:
+            return "remote"
+
+        return None
+
+    @staticmethod
+    def get_salary(posting: Dict[str, Any]) -> Optional[str]:
+        """Format baseSalary / estimatedSalary as e.g. "50000-60000 EUR/YEAR"."""
+        salary = first_value(posting.get("baseSalary") or posting.get("estimatedSalary"))
+
+        if isinstance(salary, (str, int, float)):
+            text = str(salary).strip()
+            return text if text and len(text) < MAX_SALARY_LENGTH else None
+
+        if not isinstance(salary, dict):
+            return None
+
+        value = first_value(salary.get("value"))
+        unit = None
+        if isinstance(value, dict):
+            unit = text_value(value.get("unitText"))
+            min_value = value.get("minValue")
+            max_value = value.get("maxValue")
+            if min_value and max_value and min_value != max_value:
+                amount = f"{min_value}-{max_value}"
+            else:
+                amount = value.get("value") or min_value or max_value
+        else:
+            amount = value
+
+        if amount in (None, ""):
+            return None
+
+        text = f"{amount} {text_value(salary.get('currency')) or ''}".strip()
+        if unit:
+            text += f"/{unit}"
+
+        return text if len(text) < MAX_SALARY_LENGTH else None
+
+    @staticmethod
+    def get_skills(posting: Dict[str, Any]) -> List[str]:
+        """Return the skills property as a list."""
+        skills = posting.get("skills")
+        if isinstance(skills, str):
+            skills = skills.split(",")
+        if not isinstance(skills, list):
+            return []
+
+        return [s for s in (text_value(skill) for skill in skills) if s]
+
+    def posting_to_job(
+        self, posting: Dict[str, Any], page_url: str, default_url: Optional[str] = None
+    ) -> Optional[Job]:
+        """Map a JobPosting node to a Job, or None if expired or missing its title/URL."""
+        if self.is_expired(posting):
+            self.session_logger.info(f"[SCHEMA] Skipping expired posting: {posting.get('title')}")
+            return None
+
+        job_title = text_value(posting.get("title")) or text_value(posting.get("name"))
+        raw_url = text_value(posting.get("url")) or text_value(posting.get("sameAs"))
+        job_url = canonicalize_job_url(urljoin(page_url, raw_url)) if raw_url else default_url
+
+        if not job_title or not job_url:
+            return None
+
+        location_country, location_region = self.get_location(posting)
+
+        job: Job = {
+            "job_title": job_title,
+            "job_url": job_url,
+            "job_description": html_to_text(text_value(posting.get("description"))),
+            "location_country": location_country,
+            "location_region": location_region,
+            "contract_type": self.get_contract_type(posting),
+            "salary": self.get_salary(posting),
+            "skills_required": self.get_skills(posting),
+            "hash_job_description_page": None,
+        }
+
+        return job
+
+    def extract_jobs(
+        self, html_content: str, page_url: str, default_url: Optional[str] = None
+    ) -> List[Job]:
+        """
+        Return the jobs declared as schema.org JobPosting on the page.
+
+        Args:
+            html_content: Raw page HTML (scripts included).
+            page_url: URL of the page, used to resolve relative job URLs.
+            default_url: URL given to postings without one (the page itself on detail pages).
+        """
+        if not html_content or JOB_POSTING_TYPE not in html_content:
+            return []
+
+        soup = parse_html(html_content)
+        postings = self.read_json_ld(soup) or self.read_microdata(soup)
+
+        jobs: List[Job] = []
+        seen_urls: set[str] = set()
+
+        for posting in postings:
+            job = self.posting_to_job(posting, page_url, default_url)
+            if job and job["job_url"] not in seen_urls:
+                seen_urls.add(job["job_url"])
+                jobs.append(job)
+
+        if jobs:
+            self.session_logger.info(f"[SCHEMA] {len(jobs)} JobPosting(s) found on {page_url}")
+
+        return jobs
+
+    @staticmethod
+    def covers_listing(jobs: List[Job], soup: BeautifulSoup, page_url: str) -> bool:
+        """
+        Return True if the structured jobs cover every job linked from a listing page,
+        i.e. every link under the jobs' parent paths points to a structured job.
+        """
+        job_urls = {
+            canonicalize_url(job["job_url"])
+            for job in jobs
+            if canonicalize_url(job["job_url"]) != canonicalize_url(page_url)
+        }
+        if not job_urls or len(job_urls) != len(jobs):
+            return False
+
+        parents = {url.rsplit("/", 1)[0] + "/" for url in job_urls}
+
+        for link in soup.find_all("a", href=True):
+            href = canonicalize_url(urljoin(page_url, str(link["href"])))
+            if href.startswith(tuple(parents)) and href not in job_urls:
+                return False
+
+        return True
+
+    @staticmethod
+    def is_complete(job: Job) -> bool:
+        """Return True if the job already has everything the job infos LLM extracts."""
+        return bool(
+            job.get("location_country") and job.get("salary") and job.get("skills_required")
+        )
@@ -1,5 +1,3 @@
-import random
-
 from bs4 import BeautifulSoup
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Browser, Page
 from typing import List, cast, Tuple, Optional
@@ -7,6 +5,8 @@ from worker.types.worker_types import (
     Job,
     JobListingsResult,
     JobsResponse,
+    ListingPageState,
+    SharedListingJobs,
 )
 from worker.base_scraper import BaseScraper
 from worker.constants.prompts import (
@@ -16,16 +16,31 @@ from worker.utils.llm_utils import call_llm_structured
 from worker.core.show_more_button_detector import ShowMoreButtonDetector
 from worker.core.pagination_detector.pagination_detector import PaginationDetector
 from worker.core.post_process_jobs.post_process_jobs import PostProcessingJobs
-from worker.dependencies import llm_client, LLM_MODEL, WORKER_ID
+from worker.dependencies import llm_client, LLM_MODEL, WORKER_ID, SHARED_JOBS_TTL_HOURS
 from worker.core.db_ops import DBOps
-from worker.utils.url_utils import normalize_url
+from worker.core.sitemap_discovery.sitemap_discovery import SitemapDiscovery
+from worker.core.ats_adapters.ats_adapters import AtsAdapterRegistry
+from worker.core.job_posting_extractor.job_posting_extractor import JobPostingExtractor
+from worker.core.listing_revalidator.listing_revalidator import ListingRevalidator
+from worker.core.json_listing_capture.json_listing_capture import JsonListingCapture
+from worker.core.find_company_logo import GOOGLE_URL
+from worker.utils.redis_commands import (
+    get_listing_pages_state,
+    save_listing_pages_state,
+    get_shared_cache,
+    save_shared_cache,
+)
+from worker.utils.url_utils import UrlResolver, canonicalize_url, canonicalize_job_url
 from worker.utils.text_utils import (
     extract_structured_text_chunks,
     extract_structured_text,
     hash_page_content,
 )
 from worker.core.page_processing.page_processing import PageProcessing
+from worker.core.page_processing.page_readiness import wait_for_page_ready
 from worker.core.lazy_loading_detector import LazyLoadingPageDetector
+from worker.core.boilerplate_filter.boilerplate_filter import BoilerplateFilter
+from worker.core.cpu_executor.cpu_executor import cpu_executor
 from worker.core.pagination_detector.pagination_detector import PaginationDetector
 
 
@@ -57,16 +72,34 @@ class EmailJobsScraper(BaseScraper):
         self.company_description: Optional[str] = None
         self.timeout = timeout
 
+        # Logo search consent (see FindCompanyLogo)
+        self.storage_state_urls = [GOOGLE_URL]
+
+        # job listing page -> [job_title, job_url] pairs extracted from it (and its pagination)
+        self.listing_pages_jobs: dict[str, List[List[str]]] = {}
+        self.listing_pages_lastmod: dict[str, str] = {}
+
         self.db_ops = DBOps(session_logger=self.session_logger)
 
+        self.sitemap_discovery = SitemapDiscovery(session_logger=self.session_logger)
+
+        self.ats_adapters = AtsAdapterRegistry(session_logger=self.session_logger)
+
+        self.job_posting_extractor = JobPostingExtractor(session_logger=self.session_logger)
+
+        self.listing_revalidator = ListingRevalidator(session_logger=self.session_logger)
+
+        self.json_listing_capture = JsonListingCapture(session_logger=self.session_logger)
+
         self.page_processing = PageProcessing(session_logger=self.session_logger)
+
+        self.boilerplate_filter = BoilerplateFilter(session_logger=self.session_logger)
         
         self.show_more_button_detector = ShowMoreButtonDetector(
-            session_logger=self.session_logger
+            session_logger=self.session_logger,
+            page_processing=self.page_processing,
         )
 
-        self.page_processing = PageProcessing(session_logger=self.session_logger)
-
         self.lazy_loading_detector = LazyLoadingPageDetector(
             session_logger=self.session_logger,
         )
@@ -74,6 +107,7 @@ class EmailJobsScraper(BaseScraper):
         self.pagination_detector = PaginationDetector(
             session_logger=self.session_logger,
             containers_pagination_html=self.containers_pagination_html,
+            page_processing=self.page_processing,
         )
 
         self.post_processor_jobs = PostProcessingJobs(
@@ -118,14 +152,32 @@ class EmailJobsScraper(BaseScraper):
 
         attempt = 0
         text_chunks = []
+        structured_jobs: List[Job] = []
 
         while attempt <= retries:
             try:
 
 
-                _, soup = await self.page_processing.return_soup(page)
+                html, soup = await self.page_processing.return_soup(page)
+
+                # --- schema.org JobPosting data listing every job makes the LLM unnecessary
+                structured_jobs = await cpu_executor.run_in_thread(
+                    self.job_posting_extractor.extract_jobs, html, url
+                )
+
+                if structured_jobs and await cpu_executor.run_in_thread(
+                    self.job_posting_extractor.covers_listing, structured_jobs, soup, url
+                ):
+                    self.session_logger.info(
+                        f"[SCHEMA] {len(structured_jobs)} structured jobs cover {url}, skipping LLM"
+                    )
+                    break
+
+                structured_jobs = []
 
-                text_chunks = extract_structured_text_chunks(self.job_offers, soup, url)
+                text_chunks = await cpu_executor.run_in_thread(
+                    extract_structured_text_chunks, self.job_offers, soup, url
+                )
 
                 if text_chunks:
                     break
@@ -157,7 +209,10 @@ class EmailJobsScraper(BaseScraper):
                 )
                 return None
 
-        all_jobs: List[Job] = []
+        all_jobs: List[Job] = list(structured_jobs)
+
+        if text_chunks:
+            text_chunks = self.boilerplate_filter.strip_chunks(url, text_chunks)
 
         for i, chunk in enumerate(text_chunks, start=1):
 
@@ -206,6 +261,7 @@ class EmailJobsScraper(BaseScraper):
             return
 
         existing_jobs = {(job["job_title"], job["job_url"]) for job in self.job_offers}
+        resolver = UrlResolver(url)
 
         for job in all_jobs:
 
@@ -219,7 +275,10 @@ class EmailJobsScraper(BaseScraper):
                 continue
 
             if job_url and not job_url.startswith(("http://", "https://", "mailto:")):
-                job_url = normalize_url(url, job_url)
+                job_url = resolver.resolve(job_url)
+
+            if job_url:
+                job_url = canonicalize_job_url(job_url)
 
             if job_url and (job_title, job_url) not in existing_jobs:
                 job["job_url"] = job_url
@@ -257,7 +316,7 @@ class EmailJobsScraper(BaseScraper):
             retries,
         )
 
-        if url in self.visited_pages and dynamic_pagination is False:
+        if canonicalize_url(url) in self.visited_pages and dynamic_pagination is False:
             self.session_logger.info("Skipping already visited page: %s", url)
             return
 
@@ -275,12 +334,13 @@ class EmailJobsScraper(BaseScraper):
 
             return
 
-        self.visited_pages.add(url)
+        self.visited_pages.add(canonicalize_url(url))
 
         self.session_logger.info(f"Extracting jobs from: {url}")
 
         text_content = ""
         pagination_buttons = []
+        structured_jobs: List[Job] = []
 
         for attempt in range(retries + 1):
             try:
@@ -289,20 +349,34 @@ class EmailJobsScraper(BaseScraper):
 
                     await self.page_processing.go_to_page(page, url)
 
-                await page.wait_for_timeout(random.uniform(2000, 5000))
-
                 await page.evaluate(
                     "window.scrollTo(0, document.body.scrollHeight)"
                 )
 
-                _, soup = await self.page_processing.return_soup(page)
+                # Content lazy-loaded by the scroll
+                await wait_for_page_ready(page, self.session_logger, jitter=False)
 
-                text_content = soup.get_text(separator="\n", strip=True)
+                html, soup = await self.page_processing.return_soup(page)
+
+                text_content = await cpu_executor.run_in_thread(
+                    soup.get_text, "\n", True
+                )
 
                 if not text_content:
                     continue
 
-                text_content = extract_structured_text(soup, url, self.job_offers)
+                structured_jobs = await cpu_executor.run_in_thread(
+                    self.job_posting_extractor.extract_jobs, html, url
+                )
+
+                if structured_jobs and not await cpu_executor.run_in_thread(
+                    self.job_posting_extractor.covers_listing, structured_jobs, soup, url
+                ):
+                    structured_jobs = []
+
+                text_content = await cpu_executor.run_in_thread(
+                    extract_structured_text, soup, url, self.job_offers
+                )
 
                 page_hash = hash_page_content(text_content)
 
@@ -359,37 +433,51 @@ class EmailJobsScraper(BaseScraper):
         if not text_content:
             return
 
-        messages = [
-            {"role": "system", "content": PROMPT_EXTRACT_JOBS},
-            {"role": "user", "content": f"### Extracted Text Content:\n{text_content}"},
-        ]
-
-        result_structured = await call_llm_structured(
-            llm_client=llm_client,
-            model=LLM_MODEL,
-            messages=messages,
-            logger=self.session_logger,
-            max_tokens=8192,
-            temperature=0.0,
-            retry=True,
-            pydantic_model=JobsResponse,
-        )
+        job_data: List[Job]
 
-        if result_structured is None:
-            self.session_logger.info("LLM returned no structured result")
-            return
+        if structured_jobs:
 
-        try:
-            job_data: List[Job] = cast(
-                List[Job],
-                [job.model_dump() for job in result_structured.jobs],
+            self.session_logger.info(
+                f"[SCHEMA] {len(structured_jobs)} structured jobs cover {url}, skipping LLM"
             )
 
-            self.session_logger.info(f"Found {len(job_data)} job(s): {job_data}")
+            job_data = structured_jobs
 
-        except Exception as e:
-            self.session_logger.error(f"Processing failed for {result_structured}: {e}")
-            return
+        else:
+
+            text_content = self.boilerplate_filter.strip(url, text_content)
+
+            messages = [
+                {"role": "system", "content": PROMPT_EXTRACT_JOBS},
+                {"role": "user", "content": f"### Extracted Text Content:\n{text_content}"},
+            ]
+
+            result_structured = await call_llm_structured(
+                llm_client=llm_client,
+                model=LLM_MODEL,
+                messages=messages,
+                logger=self.session_logger,
+                max_tokens=8192,
+                temperature=0.0,
+                retry=True,
+                pydantic_model=JobsResponse,
+            )
+
+            if result_structured is None:
+                self.session_logger.info("LLM returned no structured result")
+                return
+
+            try:
+                job_data = cast(
+                    List[Job],
+                    [job.model_dump() for job in result_structured.jobs],
+                )
+
+                self.session_logger.info(f"Found {len(job_data)} job(s): {job_data}")
+
+            except Exception as e:
+                self.session_logger.error(f"Processing failed for {result_structured}: {e}")
+                return
 
 
         existing_jobs = {
@@ -401,6 +489,7 @@ class EmailJobsScraper(BaseScraper):
         }
 
         new_jobs = []
+        resolver = UrlResolver(url)
 
         for job in job_data:
 
@@ -414,11 +503,14 @@ class EmailJobsScraper(BaseScraper):
                 continue
 
             job_url_normalized = (
-                normalize_url(url, job_url, False)
+                resolver.resolve(job_url)
                 if not job_url.startswith(("http://", "https://", "mailto:"))
                 else job_url
             )
 
+            if job_url_normalized:
+                job_url_normalized = canonicalize_job_url(job_url_normalized)
+
             if (
                 job_url_normalized
                 and (
@@ -473,6 +565,120 @@ class EmailJobsScraper(BaseScraper):
 
         return
 
+    async def process_page_job_listing_with_ats(
+        self, url: str, html_content: Optional[str] = None
+    ) -> bool:
+        """
+        Extract the jobs of a job listing page hosted on (or embedding) a known ATS
+        through its public feed, descriptions included. Embedded boards are only
+        recognised once the browser loaded the page (html_content).
+
+        Returns:
+            bool: True if the page was handled natively, False to fall back to the browser.
+        """
+        ats_jobs = await self.ats_adapters.fetch_jobs(url, html_content)
+
+        if not ats_jobs:
+            return False
+
+        existing_jobs = {(job["job_title"], job["job_url"]) for job in self.job_offers}
+
+        for job in ats_jobs:
+            job["job_url"] = canonicalize_job_url(job["job_url"])
+            if (job["job_title"], job["job_url"]) not in existing_jobs:
+                existing_jobs.add((job["job_title"], job["job_url"]))
+                self.job_offers.append(job)
+
+        self.session_logger.info("Current number of job offers found: ")
+        self.session_logger.info(len(self.job_offers))
+
+        return True
+
+    def add_listing_jobs(self, job_pages_jobs: List[List[str]]) -> None:
+        """Add [job_title, job_url] pairs extracted earlier to the job offers, without details."""
+        existing_jobs = {job["job_url"] for job in self.job_offers}
+
+        for job_title, job_url in job_pages_jobs:
+            job_url = canonicalize_job_url(job_url)
+            if job_url in existing_jobs:
+                continue
+            existing_jobs.add(job_url)
+            self.job_offers.append(
+                {
+                    "job_title": job_title,
+                    "job_url": job_url,
+                    "hash_job_description_page": None,
+                }
+            )
+
+    async def reuse_shared_listing_jobs(self, job_page: str) -> bool:
+        """
+        Reuse the jobs another session extracted recently from the same external
+        job listing page (e.g. a board shared by group subsidiaries).
+
+        Returns:
+            bool: True if the page was handled from the shared result.
+        """
+        try:
+            shared_jobs = cast(
+                Optional[SharedListingJobs], await get_shared_cache("listing_jobs", job_page)
+            )
+        except Exception as e:
+            self.session_logger.warning(f"Failed to read shared jobs of {job_page}: {e}")
+            return False
+
+        if not shared_jobs or not shared_jobs["jobs"]:
+            return False
+
+        self.session_logger.info(
+            f"Reusing {len(shared_jobs['jobs'])} jobs extracted by another session: {job_page}"
+        )
+
+        self.add_listing_jobs(shared_jobs["jobs"])
+        self.listing_pages_jobs[job_page] = shared_jobs["jobs"]
+
+        return True
+
+    async def share_listing_jobs(self, job_page: str) -> None:
+        """Share the jobs extracted from an external job listing page with the other sessions."""
+        jobs = self.listing_pages_jobs.get(job_page)
+        if not jobs:
+            return
+
+        shared_jobs: SharedListingJobs = {"jobs": jobs}
+
+        try:
+            await save_shared_cache(
+                "listing_jobs", job_page, shared_jobs, SHARED_JOBS_TTL_HOURS * 60 * 60
+            )
+        except Exception as e:
+            self.session_logger.warning(f"Failed to share jobs of {job_page}: {e}")
+
+    async def process_page_job_listing_with_json(self, page: Page, url: str) -> bool:
+        """
+        Extract the jobs of a loaded job listing page from the JSON responses of
+        the API it renders them from (every page of it), without clicking or LLM.
+
+        Returns:
+            bool: True if the page was handled this way, False to fall back to the rendered text.
+        """
+        json_jobs = await self.json_listing_capture.extract_jobs(page, url)
+
+        if not json_jobs:
+            return False
+
+        existing_jobs = {(job["job_title"], job["job_url"]) for job in self.job_offers}
+
+        for job in json_jobs:
+            if (job["job_title"], job["job_url"]) not in existing_jobs:
+                existing_jobs.add((job["job_title"], job["job_url"]))
+                self.job_offers.append(job)
+
+        self.session_logger.info("Current number of job offers found: ")
+        self.session_logger.info(len(self.job_offers))
+
+        return True
+
     async def extract_job_listings(self, job_pages: List[str]) -> None:
         """Extracts job listings from identified job pages and follows pagination."""
         self.visited_pages: set[str] = set()
@@ -489,21 +695,51 @@ class EmailJobsScraper(BaseScraper):
 
             base_url = job_page
             attempt = 0
+            jobs_before = len(self.job_offers)
+            is_external = job_page in self.external_job_listing_pages
+
+            # --- External boards are often shared by several companies
+            if is_external and await self.reuse_shared_listing_jobs(job_page):
+                continue
 
-            while attempt < max_attempts:
+            # --- Hosted ATS boards (recognised from the URL) are read from their public feed, no browser needed
+            handled_natively = await self.process_page_job_listing_with_ats(job_page)
+
+            if not handled_natively:
+                await self.script_allowlist.start(job_page)
+
+            while not handled_natively and attempt < max_attempts:
 
                 attempt += 1
 
                 page = await self.create_page()
 
+                # --- Records the JSON API responses the page renders its listing from
+                self.json_listing_capture.attach(page)
+
                 try:
+                    loaded = await self.page_processing.go_to_page(page, job_page)
+
+                    # --- ATS boards embedded in the page (iframe / script), URL matches were tried above
+                    if (
+                        loaded
+                        and not self.ats_adapters.detect_from_url(job_page)
+                        and await self.process_page_job_listing_with_ats(job_page, await page.content())
+                    ):
+                        break
+
+                    if loaded and await self.process_page_job_listing_with_json(
+                        page, job_page
+                    ):
+                        break
+
                     self.session_logger.info(
                         f"Checking pagination from: {job_page} (attempt {attempt}/{max_attempts})"
                     )
 
                     pagination_buttons_full = (
                         await self.pagination_detector.check_if_pagination_buttons(
-                            page, job_page
+                            page, job_page, navigate=not loaded
                         )
                     )
 
@@ -551,8 +787,89 @@ class EmailJobsScraper(BaseScraper):
 
                     await page.close()
 
+            # --- Learns or checks the third-party scripts this site needs (no-op if not started)
+            await self.script_allowlist.finish(len(self.job_offers) - jobs_before)
+
+            self.listing_pages_jobs[job_page] = [
+                [job["job_title"], job["job_url"]]
+                for job in self.job_offers[jobs_before:]
+            ]
+
+            if is_external:
+                await self.share_listing_jobs(job_page)
+
         return
 
+    async def reuse_unchanged_listing_pages(self, job_pages: List[str]) -> List[str]:
+        """
+        Skip job listing pages whose sitemap lastmod did not change since the
+        last run, or that answered 304 / the same fingerprint to a conditional
+        request, reusing the jobs extracted from them back then.
+
+        Returns:
+            List[str]: The job listing pages that still need to be processed.
+        """
+        # Only an optimization: without the previous state every page is processed
+        try:
+            previous_state = await get_listing_pages_state(self.company_id)
+        except Exception as e:
+            self.session_logger.warning(f"Failed to load listing pages state, processing every page: {e}")
+            return job_pages
+
+        revalidated_pages = await self.listing_revalidator.revalidate(
+            job_pages, previous_state
+        )
+
+        pages_to_process: List[str] = []
+
+        for job_page in job_pages:
+            previous = previous_state.get(job_page)
+            lastmod = self.listing_pages_lastmod.get(job_page)
+
+            if not previous:
+                pages_to_process.append(job_page)
+                continue
+
+            if lastmod and previous.get("lastmod") == lastmod:
+                reason = f"since {lastmod}"
+            elif job_page in revalidated_pages:
+                reason = "(HTTP validators)"
+            else:
+                pages_to_process.append(job_page)
+                continue
+
+            previous_jobs = previous.get("jobs") or []
+            if not previous_jobs:
+                pages_to_process.append(job_page)
+                continue
+
+            self.session_logger.info(
+                f"Unchanged {reason}, reusing {len(previous_jobs)} jobs: {job_page}"
+            )
+
+            self.add_listing_jobs(previous_jobs)
+
+            self.listing_pages_jobs[job_page] = previous_jobs
+
+        return pages_to_process
+
+    async def save_listing_pages_state(self) -> None:
+        """Persist, per job listing page, its sitemap lastmod, HTTP validators and extracted jobs."""
+        state: dict[str, ListingPageState] = {}
+
+        for job_page in self.internal_job_listing_pages + self.external_job_listing_pages:
+            jobs = self.listing_pages_jobs.get(job_page, [])
+            state[job_page] = {
+                "lastmod": self.listing_pages_lastmod.get(job_page),
+                "jobs": jobs,
+                "validators": self.listing_revalidator.get_validators_to_save(job_page, jobs),
+            }
+
+        try:
+            await save_listing_pages_state(self.company_id, state)
+        except Exception as e:
+            self.session_logger.warning(f"Failed to save listing pages state: {e}")
+
     async def __call__(self):
         """Starts the jobs scraping processes."""
 
@@ -564,8 +881,24 @@ class EmailJobsScraper(BaseScraper):
             self.internal_job_listing_pages + self.external_job_listing_pages
         )
 
+        self.listing_pages_lastmod = await self.sitemap_discovery.get_lastmods(
+            job_listing_pages_to_process
+        )
+
+        # --- Checker runs: pages unchanged since the last run keep their previous jobs
+        if WORKER_ID != "analyser":
+            job_listing_pages_to_process = await self.reuse_unchanged_listing_pages(
+                job_listing_pages_to_process
+            )
+
+        else:
+            # Baseline validators for the next checker run
+            await self.listing_revalidator.revalidate(job_listing_pages_to_process, {})
+
         await self.extract_job_listings(job_listing_pages_to_process)
 
+        self.boilerplate_filter.log_stats()
+
         page = await self.create_page()
 
         try:
@@ -602,4 +935,6 @@ class EmailJobsScraper(BaseScraper):
             new_job_offers=self.new_job_offers,
         )
 
+        await self.save_listing_pages_state()
+
         return len(self.new_job_offers)
@@ -0,0 +1,88 @@
+import re
+
+# === Capture ===
+CAPTURED_RESOURCE_TYPES = {"xhr", "fetch"}
+JSON_CONTENT_TYPE_PATTERN = re.compile(r"application/(?:[\w.-]+\+)?json", re.IGNORECASE)
+MAX_CAPTURED_RESPONSES = 50
+MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+MAX_JSON_DEPTH = 6
+
+# Request headers not replayed (recomputed by the HTTP client or the browser context)
+SKIPPED_REPLAY_HEADERS = {"content-length", "cookie", "host", "connection", "accept-encoding"}
+
+# === Job-like objects (keys compared lowercased, without "_", "-" and spaces) ===
+TITLE_KEYS = ["title", "jobtitle", "postingtitle", "positiontitle", "position", "name", "text"]
+URL_KEYS = [
+    "url",
+    "absoluteurl",
+    "joburl",
+    "jobdetailurl",
+    "detailurl",
+    "hostedurl",
+    "canonicalurl",
+    "permalink",
+    "applyurl",
+    "link",
+    "href",
+    "externalpath",
+]
+LOCATION_KEYS = [
+    "location",
+    "locations",
+    "joblocation",
+    "locationname",
+    "locationstext",
+    "city",
+    "office",
+    "offices",
+]
+CONTRACT_KEYS = ["employmenttype", "contracttype", "jobtype", "commitment", "worktype", "timetype"]
+DESCRIPTION_KEYS = ["description", "jobdescription", "descriptionhtml", "content"]
+# Keys only job postings have (dates, locations and teams also describe news,
+# blog posts or offices, they are not enough to recognise a job array)
+JOB_HINT_KEYS = CONTRACT_KEYS + [
+    "jobid",
+    "jobreqid",
+    "requisitionid",
+    "reqid",
+    "postingid",
+    "jobpostingid",
+    "internaljobid",
+    "jobcode",
+    "jobfamily",
+    "jobcategory",
+    "jobfunction",
+    "workplacetype",
+    "remotetype",
+    "experiencelevel",
+    "seniority",
+    "applyurl",
+    "applicationurl",
+    "bulletfields",  # Workday: requisition id of the posting
+]
+
+# URL keys holding a path relative to the board site, not to the host
+# (Workday: /job/Basel/Engineer_R-1 under https://x.wd3.myworkdayjobs.com/en-US/External)
+SITE_RELATIVE_URL_KEYS = ["externalpath"]
+BOARD_PATH_END_PATTERN = re.compile(r"/(?:jobs?|details)(?:/.*)?$")
+LOCATION_NAME_KEYS = ["name", "label", "text", "city", "region", "state", "country"]
+
+MIN_JOB_LIKE_RATIO = 0.6  # Share of the objects of an array that must look like jobs
+MIN_RENDERED_JOB_RATIO = 0.5  # Share of the sampled jobs that must be rendered on the page
+
+# Links and text of the rendered page, to check a captured array is the listing shown
+RENDERED_LISTING_SCRIPT = """
+() => ({
+    links: [...document.querySelectorAll("a[href]")].map((a) => a.href),
+    text: document.body ? document.body.innerText : "",
+})
+"""
+MAX_SAMPLED_ITEMS = 20
+MIN_DESCRIPTION_LENGTH = 500  # Shorter descriptions are teasers, the job page is still read
+
+# === Pagination replay ===
+PAGE_PARAMS = ["page", "pagenumber", "pageindex", "pagenum", "p"]
+OFFSET_PARAMS = ["offset", "start", "startindex", "from", "skip"]  # Not GraphQL "first": a page size
+TOTAL_KEYS = ["total", "totalcount", "totalresults", "totalhits", "totaljobs", "totalelements", "numfound"]
+MAX_REPLAY_PAGES = 50
+MAX_CAPTURED_JOBS = 1000
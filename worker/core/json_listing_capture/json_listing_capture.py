@@ -0,0 +1,459 @@
+import re
+import json
+
+from playwright.async_api import Page, Response
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from worker.types.worker_types import ApiPagination, Job, JobArrayKeys
+from worker.utils.url_utils import canonicalize_url, canonicalize_job_url
+from worker.utils.job_utils import normalize_contract_type, html_to_text, split_location
+from worker.core.json_listing_capture.constants import (
+    CAPTURED_RESOURCE_TYPES,
+    JSON_CONTENT_TYPE_PATTERN,
+    MAX_CAPTURED_RESPONSES,
+    MAX_RESPONSE_BYTES,
+    MAX_JSON_DEPTH,
+    SKIPPED_REPLAY_HEADERS,
+    TITLE_KEYS,
+    URL_KEYS,
+    LOCATION_KEYS,
+    CONTRACT_KEYS,
+    DESCRIPTION_KEYS,
+    JOB_HINT_KEYS,
+    SITE_RELATIVE_URL_KEYS,
+    BOARD_PATH_END_PATTERN,
+    LOCATION_NAME_KEYS,
+    MIN_JOB_LIKE_RATIO,
+    MIN_RENDERED_JOB_RATIO,
+    RENDERED_LISTING_SCRIPT,
+    MAX_SAMPLED_ITEMS,
+    MIN_DESCRIPTION_LENGTH,
+    PAGE_PARAMS,
+    OFFSET_PARAMS,
+    TOTAL_KEYS,
+    MAX_REPLAY_PAGES,
+    MAX_CAPTURED_JOBS,
+)
+
+JsonPath = Tuple[Union[str, int], ...]
+
+
+def normalize_key(key: str) -> str:
+    """Lowercase a JSON key and drop "_", "-" and spaces (jobTitle, job_title -> jobtitle)."""
+    return re.sub(r"[_\-\s]", "", key).lower()
+
+
+def find_key(item: Dict[str, Any], candidates: List[str]) -> Optional[str]:
+    """Return the first key of `item` matching a candidate and holding a value."""
+    keys = {normalize_key(key): key for key in item}
+
+    for candidate in candidates:
+        key = keys.get(candidate)
+        if key is not None and item[key] not in (None, "", [], {}):
+            return key
+
+    return None
+
+
+def join_board_path(page_url: str, path: str) -> str:
+    """Join a board-relative job path to the board URL of a listing page (/en-US/External + /job/...)."""
+    parts = urlsplit(page_url)
+    board_path = BOARD_PATH_END_PATTERN.sub("", parts.path.rstrip("/"))
+
+    return urlunsplit((parts.scheme, parts.netloc, board_path + "/" + path.lstrip("/"), "", ""))
+
+
+def get_at_path(data: Any, path: JsonPath) -> Any:
+    """Return the value at `path` in a JSON document, or None."""
+    for step in path:
+        try:
+            data = data[step]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+
+class JsonListingCapture:
+    """
+    Records the JSON responses of the XHR / fetch requests a job listing page
+    makes, finds the arrays of job-like objects in them and maps those to Job
+    records. When the listing API is paginated by page or offset parameters,
+    the next pages are requested directly over HTTP (with the cookies of the
+    browser context) instead of clicking through the rendered pagination.
+    """
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+        self.responses: List[Response] = []
+
+    # === Capture ===
+
+    def attach(self, page: Page) -> None:
+        """Start recording the JSON responses of a page (call before navigating)."""
+        self.responses = []
+        page.on("response", self.record_response)
+
+    def record_response(self, response: Response) -> None:
+        """Keep XHR / fetch responses declared as JSON (bodies are read later)."""
+        if len(self.responses) >= MAX_CAPTURED_RESPONSES:
+            return
+
+        if response.request.resource_type not in CAPTURED_RESOURCE_TYPES or not response.ok:
+            return
+
+        if JSON_CONTENT_TYPE_PATTERN.search(response.headers.get("content-type", "")):
+            self.responses.append(response)
+
+    @staticmethod
+    async def read_json(response: Response) -> Any:
+        """Return the parsed body of a captured response, or None."""
+        try:
+            body = await response.body()
+            if len(body) > MAX_RESPONSE_BYTES:
+                return None
+            return json.loads(body)
+        except Exception:
+            return None
+
+    # === Job arrays ===
+
+    def iter_object_arrays(
+        self, node: Any, path: JsonPath = (), depth: int = 0
+    ) -> Iterator[Tuple[JsonPath, List[Dict[str, Any]]]]:
+        """Yield (path, array) for every array of objects of a JSON document."""
+        if depth > MAX_JSON_DEPTH:
+            return
+
+        if isinstance(node, dict):
+            for key, value in node.items():
+                yield from self.iter_object_arrays(value, path + (key,), depth + 1)
+
+        elif isinstance(node, list) and node:
+            if isinstance(node[0], dict):
+                yield path, [item for item in node if isinstance(item, dict)]
+                return
+
+            for index, value in enumerate(node[:MAX_SAMPLED_ITEMS]):
+                yield from self.iter_object_arrays(value, path + (index,), depth + 1)
+
+    @staticmethod
+    def get_job_keys(items: List[Dict[str, Any]]) -> Optional[JobArrayKeys]:
+        """
+        Return the keys holding the Job fields if the objects look like jobs:
+        a title, a URL and at least one key only job postings have (job id,
+        requisition id, employment type...).
+        """
+        sample = items[:MAX_SAMPLED_ITEMS]
+        if not sample:
+            return None
+
+        job_like = [
+            item
+            for item in sample
+            if isinstance(item.get(find_key(item, TITLE_KEYS) or ""), str)
+            and isinstance(item.get(find_key(item, URL_KEYS) or ""), str)
+            and find_key(item, JOB_HINT_KEYS)
+        ]
+
+        if len(job_like) < MIN_JOB_LIKE_RATIO * len(sample):
+            return None
+
+        first = job_like[0]
+
+        return {
+            "title": find_key(first, TITLE_KEYS) or "",
+            "url": find_key(first, URL_KEYS) or "",
+            "location": find_key(first, LOCATION_KEYS),
+            "contract": find_key(first, CONTRACT_KEYS),
+            "description": find_key(first, DESCRIPTION_KEYS),
+        }
+
+    @staticmethod
+    def location_text(value: Any) -> Optional[str]:
+        """Flatten a location value (string, object or list of those) to "City, Country" text."""
+        if isinstance(value, list):
+            value = value[0] if value else None
+
+        if isinstance(value, dict):
+            parts = [
+                str(value[key])
+                for key in (find_key(value, [name]) for name in LOCATION_NAME_KEYS)
+                if key and isinstance(value[key], (str, int))
+            ]
+            value = ", ".join(dict.fromkeys(parts))
+
+        return value.strip() if isinstance(value, str) and value.strip() else None
+
+    def item_to_job(
+        self, item: Dict[str, Any], keys: JobArrayKeys, page_url: str
+    ) -> Optional[Job]:
+        """Map a job-like object to a Job, or None without a title or an http(s) URL."""
+        title = item.get(keys["title"])
+        raw_url = item.get(keys["url"])
+
+        if not isinstance(title, str) or not title.strip() or not isinstance(raw_url, str):
+            return None
+
+        if normalize_key(keys["url"]) in SITE_RELATIVE_URL_KEYS and not urlsplit(raw_url).scheme:
+            job_url = canonicalize_job_url(join_board_path(page_url, raw_url))
+        else:
+            job_url = canonicalize_job_url(urljoin(page_url, raw_url))
+        if not job_url.startswith(("http://", "https://")):
+            return None
+
+        location_country, location_region = split_location(
+            self.location_text(item.get(keys["location"])) if keys["location"] else None
+        )
+
+        contract = item.get(keys["contract"]) if keys["contract"] else None
+        if isinstance(contract, dict):
+            contract = contract.get("name") or contract.get("label")
+
+        description = item.get(keys["description"]) if keys["description"] else None
+        description = html_to_text(description) if isinstance(description, str) else None
+
+        job: Job = {
+            "job_title": title.strip(),
+            "job_url": job_url,
+            "location_country": location_country,
+            "location_region": location_region,
+            "contract_type": (
+                normalize_contract_type(contract) if isinstance(contract, str) else None
+            ),
+            "hash_job_description_page": None,
+        }
+
+        # Listing APIs often only return a teaser, the job page is then read as usual
+        if description and len(description) >= MIN_DESCRIPTION_LENGTH:
+            job["job_description"] = description
+
+        return job
+
+    def map_items(
+        self, items: List[Dict[str, Any]], keys: JobArrayKeys, page_url: str
+    ) -> List[Job]:
+        """Map job-like objects to Jobs, dropping the invalid ones."""
+        return [
+            job for job in (self.item_to_job(item, keys, page_url) for item in items) if job
+        ]
+
+    @staticmethod
+    async def get_rendered_listing(page: Page) -> Optional[Tuple[set[str], str]]:
+        """Return the canonical link URLs and the whitespace-collapsed lowercase text of the page."""
+        try:
+            rendered = await page.evaluate(RENDERED_LISTING_SCRIPT)
+        except Exception:
+            return None
+
+        links = {canonicalize_url(link) for link in rendered["links"] if isinstance(link, str)}
+        text = " ".join(str(rendered["text"]).split()).lower()
+
+        return links, text
+
+    @staticmethod
+    def is_rendered(jobs: List[Job], rendered: Tuple[set[str], str]) -> bool:
+        """Check that most sampled jobs are shown on the page (linked, or their title in the text)."""
+        links, text = rendered
+        sample = jobs[:MAX_SAMPLED_ITEMS]
+
+        shown = [
+            job
+            for job in sample
+            if canonicalize_url(job["job_url"]) in links
+            or " ".join(job["job_title"].split()).lower() in text
+        ]
+
+        return len(shown) >= MIN_RENDERED_JOB_RATIO * len(sample)
+
+    # === Pagination replay ===
+
+    @staticmethod
+    def match_pagination_param(name: str, value: Any) -> Optional[Tuple[str, int]]:
+        """Return (kind, value) if a request parameter is a page number or an offset."""
+        if isinstance(value, str) and value.isdigit():
+            value = int(value)
+        if not isinstance(value, int) or isinstance(value, bool):
+            return None
+
+        key = normalize_key(name)
+        if key in PAGE_PARAMS:
+            return "page", value
+        if key in OFFSET_PARAMS:
+            return "offset", value
+
+        return None
+
+    def get_pagination(self, response: Response) -> Optional[ApiPagination]:
+        """Find the page / offset parameter of a captured request (query string or JSON body)."""
+        request = response.request
+
+        for name, value in parse_qsl(urlsplit(request.url).query):
+            if match := self.match_pagination_param(name, value):
+                return {"kind": match[0], "location": "query", "param": name, "value": match[1]}
+
+        try:
+            body = json.loads(request.post_data or "")
+        except ValueError:
+            return None
+
+        if isinstance(body, dict):
+            for name, value in body.items():
+                if match := self.match_pagination_param(name, value):
+                    return {"kind": match[0], "location": "body", "param": name, "value": match[1]}
+
+        return None
+
+    @staticmethod
+    def get_total(data: Any, path: JsonPath) -> Optional[int]:
+        """Return the total number of results declared next to the array (or at the root)."""
+        for container in (get_at_path(data, path[:-1]), data):
+            if not isinstance(container, dict):
+                continue
+            key = find_key(container, TOTAL_KEYS)
+            if key and isinstance(container[key], int):
+                return container[key]
+        return None
+
+    async def fetch_page(
+        self, page: Page, response: Response, pagination: ApiPagination, value: int
+    ) -> Any:
+        """Replay a captured request with another page / offset value and return its JSON."""
+        request = response.request
+
+        headers = {
+            name: header
+            for name, header in (await request.all_headers()).items()
+            if not name.startswith(":") and name.lower() not in SKIPPED_REPLAY_HEADERS
+        }
+
+        url = request.url
+        data = request.post_data
+
+        if pagination["location"] == "query":
+            parts = urlsplit(url)
+            params = [
+                (name, str(value) if name == pagination["param"] else param_value)
+                for name, param_value in parse_qsl(parts.query, keep_blank_values=True)
+            ]
+            url = urlunsplit(parts._replace(query=urlencode(params)))
+        else:
+            body = json.loads(data or "{}")
+            body[pagination["param"]] = value
+            data = json.dumps(body)
+
+        # The context request client shares the cookies of the browser context
+        api_response = await page.context.request.fetch(
+            url, method=request.method, headers=headers, data=data
+        )
+
+        try:
+            if not api_response.ok:
+                return None
+            return await api_response.json()
+        finally:
+            await api_response.dispose()
+
+    async def replay_pagination(
+        self,
+        page: Page,
+        response: Response,
+        data: Any,
+        path: JsonPath,
+        keys: JobArrayKeys,
+        page_url: str,
+        jobs: List[Job],
+    ) -> None:
+        """Request the next pages of a paginated listing API, appending new jobs to `jobs`."""
+        pagination = self.get_pagination(response)
+        if not pagination:
+            return
+
+        total = self.get_total(data, path)
+        seen_urls = {job["job_url"] for job in jobs}
+        value = pagination["value"]
+        page_size = len(get_at_path(data, path) or [])
+
+        for _ in range(MAX_REPLAY_PAGES):
+            if (total is not None and len(jobs) >= total) or len(jobs) >= MAX_CAPTURED_JOBS:
+                break
+
+            value += 1 if pagination["kind"] == "page" else page_size
+
+            try:
+                next_data = await self.fetch_page(page, response, pagination, value)
+            except Exception as e:
+                self.session_logger.info(f"[JSON] Replay failed at {pagination['param']}={value}: {e}")
+                break
+
+            items = get_at_path(next_data, path)
+            if not isinstance(items, list):
+                break
+
+            new_jobs = [
+                job
+                for job in self.map_items(
+                    [item for item in items if isinstance(item, dict)], keys, page_url
+                )
+                if job["job_url"] not in seen_urls
+            ]
+
+            if not new_jobs:
+                break
+
+            seen_urls.update(job["job_url"] for job in new_jobs)
+            jobs.extend(new_jobs)
+
+        self.session_logger.info(
+            f"[JSON] Replayed {pagination['param']} up to {value}, {len(jobs)} jobs"
+        )
+
+    async def extract_jobs(self, page: Page, page_url: str) -> List[Job]:
+        """
+        Return the jobs of the best job-like array found in the captured JSON
+        responses, every page of its API included. Only arrays whose jobs are
+        rendered on the page count (a news or office XHR of a careers page is
+        not its listing). Empty if none was found.
+        """
+        best: Optional[Tuple[Response, Any, JsonPath, JobArrayKeys, List[Job]]] = None
+        rendered: Optional[Tuple[set[str], str]] = None
+
+        for response in list(self.responses):
+            data = await self.read_json(response)
+            if data is None:
+                continue
+
+            for path, items in self.iter_object_arrays(data):
+                keys = self.get_job_keys(items)
+                if not keys:
+                    continue
+
+                jobs = self.map_items(items, keys, page_url)
+                if not jobs or (best is not None and len(jobs) <= len(best[4])):
+                    continue
+
+                rendered = rendered or await self.get_rendered_listing(page)
+                if rendered is None:
+                    return []
+
+                if not self.is_rendered(jobs, rendered):
+                    self.session_logger.info(
+                        f"[JSON] Skipping {response.request.url} at {list(path)}: jobs not rendered on the page"
+                    )
+                    continue
+
+                best = (response, data, path, keys, jobs)
+
+        if best is None:
+            return []
+
+        response, data, path, keys, jobs = best
+
+        self.session_logger.info(
+            f"[JSON] {len(jobs)} jobs found in {response.request.url} at {list(path)}"
+        )
+
+        jobs = list({job["job_url"]: job for job in jobs}.values())
+
+        await self.replay_pagination(page, response, data, path, keys, page_url, jobs)
+
+        return jobs[:MAX_CAPTURED_JOBS]
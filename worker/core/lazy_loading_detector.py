@@ -1,8 +1,8 @@
-import random
 
 from dataclasses import dataclass
 from typing import Any
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Page
+from worker.core.page_processing.page_readiness import wait_for_page_ready
 
 @dataclass
 class LazyLoadingPageDetector:
@@ -22,7 +22,7 @@ class LazyLoadingPageDetector:
                 
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                 
-                await page.wait_for_timeout(random.uniform(3000, 5000))
+                await wait_for_page_ready(page, self.session_logger)
 
                 new_height = await page.evaluate("document.body.scrollHeight")
 
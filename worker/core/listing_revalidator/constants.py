@@ -0,0 +1,5 @@
+REQUEST_TIMEOUT = 15  # seconds, per request
+MAX_CONCURRENT_REQUESTS = 8
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+NOISE_TAGS = ["script", "style", "meta", "noscript", "svg"]
@@ -0,0 +1,130 @@
+import asyncio
+import aiohttp
+
+from typing import Any, Dict, List, Optional, Tuple
+from worker.types.worker_types import ListingPageState, PageValidators
+from worker.utils.http_utils import create_http_session, fetch_conditional
+from worker.utils.text_utils import hash_page_content
+from worker.core.cpu_executor.cpu_executor import cpu_executor
+from worker.utils.url_utils import canonicalize_job_url
+from worker.core.cpu_executor.cpu_tasks import extract_static_listing
+from worker.core.listing_revalidator.constants import (
+    REQUEST_TIMEOUT,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_PAGE_BYTES,
+    NOISE_TAGS,
+)
+
+
+class ListingRevalidator:
+    """
+    Tells, without a browser, whether job listing pages changed since the last run
+    using conditional requests (ETag / Last-Modified) and a fingerprint of the
+    structured text of their static HTML.
+
+    Validators are only kept for server-rendered pages, i.e. pages whose static
+    HTML already links every job extracted from them: the HTML shell of a
+    client-rendered board stays the same while its jobs change.
+    """
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+
+        # Validators and static links (canonical job URLs) collected during this run
+        self.validators: Dict[str, PageValidators] = {}
+        self.static_links: Dict[str, set[str]] = {}
+
+    @staticmethod
+    async def get_fingerprint(html: str, url: str) -> Tuple[str, set[str]]:
+        """Return (fingerprint, canonical job URLs of the links) of a static HTML document, parsed off the loop."""
+        text, links = await cpu_executor.run_in_process(
+            extract_static_listing, html.encode(), url, NOISE_TAGS
+        )
+
+        return hash_page_content(text), set(links)
+
+    async def revalidate_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        previous: Optional[PageValidators],
+    ) -> bool:
+        """Return True if the page is unchanged since the validators of the last run."""
+        status, body, etag, last_modified = await fetch_conditional(
+            session,
+            url,
+            etag=previous.get("etag") if previous else None,
+            last_modified=previous.get("last_modified") if previous else None,
+            max_bytes=MAX_PAGE_BYTES,
+        )
+
+        if status == 304 and previous:
+            self.validators[url] = {
+                "etag": etag or previous.get("etag"),
+                "last_modified": last_modified or previous.get("last_modified"),
+                "fingerprint": previous.get("fingerprint"),
+            }
+            return True
+
+        if status != 200 or not body:
+            return False
+
+        fingerprint, links = await self.get_fingerprint(body, url)
+
+        self.static_links[url] = links
+        self.validators[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fingerprint": fingerprint,
+        }
+
+        return bool(previous and previous.get("fingerprint") == fingerprint)
+
+    async def revalidate(
+        self, urls: List[str], previous_state: Dict[str, ListingPageState]
+    ) -> set[str]:
+        """
+        Revalidate job listing pages against the validators of the last run.
+
+        Returns:
+            set[str]: The pages known to be unchanged.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def check(session: aiohttp.ClientSession, url: str) -> bool:
+            previous = (previous_state.get(url) or {}).get("validators")
+            async with semaphore:
+                try:
+                    return await self.revalidate_page(session, url, previous)
+                except Exception as e:
+                    self.session_logger.info(f"[REVALIDATE] Request failed for {url}: {e}")
+                    return False
+
+        async with create_http_session(REQUEST_TIMEOUT) as session:
+            results = await asyncio.gather(*(check(session, url) for url in urls))
+
+        unchanged = {url for url, is_unchanged in zip(urls, results) if is_unchanged}
+
+        self.session_logger.info(
+            f"[REVALIDATE] {len(unchanged)}/{len(urls)} job listing pages unchanged"
+        )
+
+        return unchanged
+
+    def get_validators_to_save(
+        self, url: str, jobs: List[List[str]]
+    ) -> Optional[PageValidators]:
+        """Return the validators to persist for a page, None if they cannot be trusted."""
+        validators = self.validators.get(url)
+
+        if not validators or not jobs:
+            return None
+
+        # Fresh 200: trust it only if the static HTML lists every extracted job
+        static_links = self.static_links.get(url)
+        if static_links is not None and not all(
+            canonicalize_job_url(job_url) in static_links for _, job_url in jobs
+        ):
+            return None
+
+        return validators
@@ -0,0 +1,3 @@
+NOISE_TAGS = ["script", "style", "meta", "svg"]
+MIN_CACHED_STATUS = 200
+MAX_CACHED_STATUS = 399  # Error pages are loaded again by the next step
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+from typing import Any, Optional
+from worker.dependencies import PAGE_CACHE_MAX_MB
+from worker.types.worker_types import CachedPage
+from worker.utils.url_utils import canonicalize_url
+from worker.core.cpu_executor.cpu_executor import cpu_executor
+from worker.core.cpu_executor.cpu_tasks import extract_page_structured_text
+from worker.core.page_cache.constants import NOISE_TAGS, MIN_CACHED_STATUS, MAX_CACHED_STATUS
+
+
+class PageCache:
+    """
+    Pages loaded during a discovery session, keyed by canonical URL (requested
+    and final URL after redirects), so later steps read them instead of
+    navigating again. Least recently used pages are evicted past the memory cap.
+    """
+
+    def __init__(self, session_logger: Any, max_bytes: int = PAGE_CACHE_MAX_MB * 1024 * 1024):
+        self.session_logger = session_logger
+        self.max_bytes = max_bytes
+
+        self.pages: OrderedDict[str, CachedPage] = OrderedDict()
+        self.size = 0  # Characters of HTML and structured text held (shared entries counted once)
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_page_size(cached_page: CachedPage) -> int:
+        """Return the characters held by a cached page."""
+        return len(cached_page["html"]) + len(cached_page["structured_text"] or "")
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page of a URL, or None if it was not loaded in this session."""
+        key = canonicalize_url(url)
+        cached_page = self.pages.get(key)
+
+        if cached_page is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.pages.move_to_end(key)
+        self.session_logger.debug(f"[PAGE CACHE] Reusing {key}")
+
+        return cached_page
+
+    def put(self, url: str, final_url: str, status: Optional[int], html: str) -> None:
+        """Cache a loaded page under its requested and final URLs (error pages are skipped)."""
+        if status is not None and not MIN_CACHED_STATUS <= status <= MAX_CACHED_STATUS:
+            return
+
+        cached_page: CachedPage = {
+            "final_url": final_url,
+            "status": status,
+            "html": html,
+            "structured_text": None,
+        }
+
+        page_size = self.get_page_size(cached_page)
+        if page_size > self.max_bytes:
+            return
+
+        for key in dict.fromkeys((canonicalize_url(url), canonicalize_url(final_url))):
+            self.remove(key)
+            self.pages[key] = cached_page
+
+        self.size += page_size
+        self.evict()
+
+    async def get_structured_text(self, url: str) -> Optional[str]:
+        """Return the structured text of a cached page (computed once), or None if not cached."""
+        cached_page = self.get(url)
+        if cached_page is None:
+            return None
+
+        if cached_page["structured_text"] is None:
+            structured_text = await cpu_executor.run_in_process(
+                extract_page_structured_text, cached_page["html"].encode(), url, NOISE_TAGS
+            )
+
+            # The page may have been evicted or computed by another task meanwhile
+            if cached_page["structured_text"] is None:
+                cached_page["structured_text"] = structured_text
+
+                if any(other is cached_page for other in self.pages.values()):
+                    self.size += len(structured_text)
+                    self.evict()
+
+        return cached_page["structured_text"]
+
+    def remove(self, key: str) -> None:
+        """Drop a canonical URL, releasing its page once no other URL shares it."""
+        cached_page = self.pages.pop(key, None)
+        if cached_page is None:
+            return
+
+        if not any(other is cached_page for other in self.pages.values()):
+            self.size -= self.get_page_size(cached_page)
+
+    def evict(self) -> None:
+        """Drop the least recently used pages until the cache fits its memory cap."""
+        while self.size > self.max_bytes and self.pages:
+            self.remove(next(iter(self.pages)))
+
+    def log_stats(self) -> None:
+        """Log how many navigations the cache saved."""
+        self.session_logger.info(
+            f"[PAGE CACHE] {self.hits} hits, {self.misses} misses, "
+            f"{len(self.pages)} URLs held ({self.size // 1024} KB)"
+        )
@@ -17,7 +17,152 @@ USELESS_TAGS = [
     "track",
 ]
 
+# === HTML parsing ===
+PARSER_BACKENDS = ["lxml", "html.parser"]  # BeautifulSoup tree builders
+DEFAULT_PARSER_BACKEND = "lxml"
+
+# Dropped from PageSnapshot.soup (see PageProcessing.return_soup)
+SNAPSHOT_NOISE_TAGS = ["script", "style", "meta", "noscript", "svg"]
+
+# === In-page extraction ===
+# Run in the page so only the result crosses the Playwright pipe (page.content()
+# ships inline scripts, SVGs and JSON blobs that Python drops anyway).
+
+# DOM serialized without noise tags, pruned on a detached clone
+PRUNED_HTML_SCRIPT = """
+(noiseTags) => {
+    const root = document.documentElement.cloneNode(true);
+    root.querySelectorAll(noiseTags.join(",")).forEach((element) => element.remove());
+    return root.outerHTML;
+}
+"""
+
+# Stripped text nodes outside noise tags joined by spaces (like PageSnapshot.text)
+PAGE_TEXT_SCRIPT = """
+(noiseTags) => {
+    const noise = new Set(noiseTags);
+    const walker = document.createTreeWalker(
+        document.documentElement,
+        NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT,
+        {
+            acceptNode: (node) =>
+                node.nodeType === Node.ELEMENT_NODE && noise.has(node.localName)
+                    ? NodeFilter.FILTER_REJECT
+                    : NodeFilter.FILTER_ACCEPT,
+        },
+    );
+
+    const texts = [];
+    while (walker.nextNode()) {
+        const node = walker.currentNode;
+        if (node.nodeType !== Node.TEXT_NODE) continue;
+        const text = node.data.trim();
+        if (text) texts.push(text);
+    }
+    return texts.join(" ");
+}
+"""
+
 JSON_HEAVY_PATTERN = re.compile(
     r'^\s*[\[{].*[\]}]\s*$', 
     re.DOTALL
-)
\ No newline at end of file
+)
+# === Page readiness ===
+READY_QUIET_WINDOW_MS = 500  # Page structure, anchors and network must be still for this long
+READY_TIMEOUT_MS = 5000  # Ceiling: pages that never settle stop here
+READY_SCROLL_TIMEOUT_MS = 2000  # Ceiling of the wait for links rendered after a scroll
+READY_LONG_REQUEST_MS = 2000  # Requests pending longer are ignored (long polling, beacons, streams)
+READY_POLLING_MS = 100
+
+# Installed before any page script runs (see BaseScraper.create_context_with_proxy):
+# tracks the last structural DOM change (elements added or removed), the fetch/XHR
+# requests in flight and the anchor set. Text updates (tickers, counters, carousels
+# changing captions) and requests pending past READY_LONG_REQUEST_MS do not delay readiness.
+READINESS_INIT_SCRIPT = """
+(() => {
+    if (window.__pageReadiness) return;
+
+    const state = {
+        lastMutation: performance.now(),
+        lastNetwork: performance.now(),
+        lastAnchorChange: performance.now(),
+        anchors: "",
+        pending: new Set(),  // Start times of the requests in flight
+    };
+
+    const addsOrRemovesElements = (mutation) =>
+        [...mutation.addedNodes, ...mutation.removedNodes].some(
+            (node) => node.nodeType === Node.ELEMENT_NODE
+        );
+
+    const observe = () => {
+        new MutationObserver((mutations) => {
+            if (mutations.some(addsOrRemovesElements)) state.lastMutation = performance.now();
+        }).observe(document.documentElement, { childList: true, subtree: true });
+    };
+    if (document.documentElement) observe();
+    else document.addEventListener("DOMContentLoaded", observe, { once: true });
+
+    const requestStarted = () => {
+        const request = { start: performance.now() };
+        state.pending.add(request);
+        return () => {
+            state.pending.delete(request);
+            state.lastNetwork = performance.now();
+        };
+    };
+
+    // Wrappers report the source of the original function (page scripts can check it)
+    const cloak = (wrapper, original) => {
+        Object.defineProperty(wrapper, "toString", {
+            value: () => original.toString(),
+            configurable: true,
+            writable: true,
+        });
+        return wrapper;
+    };
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = cloak(function (...args) {
+            const requestDone = requestStarted();
+            return originalFetch.apply(this, args).finally(requestDone);
+        }, originalFetch);
+    }
+
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = cloak(function (...args) {
+        this.addEventListener("loadend", requestStarted(), { once: true });
+        return originalSend.apply(this, args);
+    }, originalSend);
+
+    Object.defineProperty(window, "__pageReadiness", {
+        enumerable: false,
+        value: {
+            isReady(quietMs, longRequestMs) {
+                const now = performance.now();
+
+                const anchors = [...document.querySelectorAll("a[href]")]
+                    .map((a) => a.getAttribute("href"))
+                    .join("\\n");
+                if (anchors !== state.anchors) {
+                    state.anchors = anchors;
+                    state.lastAnchorChange = now;
+                }
+
+                const loading = [...state.pending].some(
+                    (request) => now - request.start < longRequestMs
+                );
+
+                return document.readyState !== "loading"
+                    && !loading
+                    && now - state.lastMutation >= quietMs
+                    && now - state.lastNetwork >= quietMs
+                    && now - state.lastAnchorChange >= quietMs;
+            },
+        },
+    });
+})()
+"""
+
+READINESS_CHECK_SCRIPT = "([quietMs, longRequestMs]) => window.__pageReadiness.isReady(quietMs, longRequestMs)"
@@ -0,0 +1,41 @@
+from bs4 import BeautifulSoup
+from typing import Iterable, Optional
+from worker.dependencies import HTML_PARSER_BACKEND
+from worker.core.page_processing.constants import PARSER_BACKENDS, DEFAULT_PARSER_BACKEND
+
+
+def get_backend(backend: Optional[str] = None) -> str:
+    """
+    Return the BeautifulSoup tree builder to use: the requested one
+    (HTML_PARSER_BACKEND by default), or lxml if it is unknown.
+    """
+    backend = backend or HTML_PARSER_BACKEND
+
+    return backend if backend in PARSER_BACKENDS else DEFAULT_PARSER_BACKEND
+
+
+def parse_html(
+    html: str, noise_tags: Optional[Iterable[str]] = None, backend: Optional[str] = None
+) -> BeautifulSoup:
+    """
+    Parse HTML into a BeautifulSoup tree, removing `noise_tags` (with their content).
+    The tree is built by lxml (C) unless the pure-Python html.parser is selected.
+    """
+    soup = BeautifulSoup(html, get_backend(backend))
+
+    if noise_tags:
+        for tag in soup(list(noise_tags)):
+            tag.decompose()
+
+    return soup
+
+
+def get_html_text(
+    html: str,
+    noise_tags: Optional[Iterable[str]] = None,
+    separator: str = " ",
+    strip: bool = False,
+    backend: Optional[str] = None,
+) -> str:
+    """Return the text of an HTML document without `noise_tags`, like BeautifulSoup.get_text(separator, strip)."""
+    return parse_html(html, noise_tags, backend).get_text(separator=separator, strip=strip)
@@ -1,7 +1,13 @@
-import random 
 from bs4 import BeautifulSoup
-from typing import Tuple, Any
-from playwright.async_api import Page
+from typing import Optional, Tuple, Any
+from playwright.async_api import Error as PlaywrightError, Page
+from worker.core.page_processing.page_readiness import wait_for_page_ready
+from worker.core.page_processing.page_snapshot import PageSnapshot
+from worker.core.page_processing.constants import (
+    SNAPSHOT_NOISE_TAGS,
+    PRUNED_HTML_SCRIPT,
+    PAGE_TEXT_SCRIPT,
+)
 
 class PageProcessing:
     def __init__(
@@ -9,36 +15,10 @@ class PageProcessing:
         session_logger: Any,
     ):
         self.session_logger = session_logger
+
+        # Last DOM state parsed, reused while the page HTML does not change
+        self.snapshot: Optional[PageSnapshot] = None
     
-    @staticmethod
-    async def wait_for_links_in_page_stable(page: Page, timeout=2000, step=200):
-        """Wait until the number of anchor links on the page stops changing for two consecutive checks."""
-
-        last_count = -1
-        elapsed = 0
-        stable_rounds = 0
-
-        while elapsed < timeout:
-            count = await page.evaluate(
-                """
-                () => Array.from(document.querySelectorAll('a'))
-                    .map(a => a.getAttribute('href'))
-                    .filter(href => href && href.trim().length > 0)
-                    .length
-                """
-            )
-
-            if count == last_count:
-                stable_rounds += 1
-                if stable_rounds >= 2:   # require stability twice
-                    return
-            else:
-                stable_rounds = 0
-
-            last_count = count
-            await page.wait_for_timeout(step)
-            elapsed += step
-            
     async def go_to_page(
         self, page: Page, url: str, MAX_PAGE_RETRIES=0, timeout=30000
     ) -> bool:
@@ -59,9 +39,8 @@ class PageProcessing:
                     wait_until="load", #load
                 )
                 
-                await self.wait_for_links_in_page_stable(page, timeout=5000, step=500)
-                
-                await page.wait_for_timeout(random.uniform(2000, 4000))
+                # DOM, anchors and requests quiet (in-page observer) + stealth jitter
+                await wait_for_page_ready(page, self.session_logger)
                                         
                 success = True
 
@@ -77,15 +56,51 @@ class PageProcessing:
 
         return success
     
-    async def return_soup(self, page: Page) -> Tuple[str, BeautifulSoup]:
-        """Extract the page HTML and return a cleaned BeautifulSoup object with noise tags removed."""
+    async def get_snapshot(self, page: Page) -> PageSnapshot:
+        """
+        Return a snapshot of the current DOM of a page. The previous snapshot
+        (and everything already parsed from it) is reused if the HTML is unchanged.
+        """
+        return self.reuse_snapshot(await page.content(), page.url)
+
+    def reuse_snapshot(self, html: str, url: str) -> PageSnapshot:
+        """Return the previous snapshot if it has the same HTML and URL, else a new one."""
+        if self.snapshot is None or self.snapshot.html != html or self.snapshot.url != url:
+            self.snapshot = PageSnapshot(html, url)
+
+        return self.snapshot
+
+    async def get_pruned_snapshot(self, page: Page) -> PageSnapshot:
+        """
+        Return a snapshot of the current DOM serialized in the page without noise
+        tags, so scripts and SVGs are neither transferred nor parsed. Its HTML has
+        no JSON-LD either: structured job readers need get_snapshot().
+        """
+        try:
+            html = await page.evaluate(PRUNED_HTML_SCRIPT, SNAPSHOT_NOISE_TAGS)
+        except PlaywrightError as e:
+            self.session_logger.debug(f"In-page pruning failed, reading full HTML: {e}")
+            return await self.get_snapshot(page)
+
+        return self.reuse_snapshot(html, page.url)
+
+    async def get_page_text(self, page: Page) -> str:
+        """Return the cleaned text of the current page (like PageSnapshot.text), computed in the page."""
+        try:
+            return await page.evaluate(PAGE_TEXT_SCRIPT, SNAPSHOT_NOISE_TAGS)
+        except PlaywrightError as e:
+            self.session_logger.debug(f"In-page text extraction failed, parsing HTML: {e}")
+
+        snapshot = await self.get_snapshot(page)
+        await snapshot.load("text")
+
+        return snapshot.text
 
-        html = await page.content()
-        
-        soup = BeautifulSoup(html, "html.parser")
+    async def return_soup(self, page: Page) -> Tuple[str, BeautifulSoup]:
+        """Extract the page HTML and return a cleaned BeautifulSoup object with noise tags removed (read-only)."""
 
-        for tag in soup(["script", "style", "meta", "noscript", "svg"]):
-            tag.decompose()
+        snapshot = await self.get_snapshot(page)
+        await snapshot.load("soup")
 
-        return html, soup
+        return snapshot.html, snapshot.soup
     
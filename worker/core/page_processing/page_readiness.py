@@ -0,0 +1,67 @@
+import random
+
+from typing import Any, Optional
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Page
+from worker.dependencies import STEALTH_JITTER_MIN_MS, STEALTH_JITTER_MAX_MS
+from worker.core.page_processing.constants import (
+    READY_QUIET_WINDOW_MS,
+    READY_TIMEOUT_MS,
+    READY_LONG_REQUEST_MS,
+    READY_POLLING_MS,
+    READINESS_INIT_SCRIPT,
+    READINESS_CHECK_SCRIPT,
+)
+
+
+async def wait_for_page_ready(
+    page: Page,
+    session_logger: Optional[Any] = None,
+    quiet_ms: int = READY_QUIET_WINDOW_MS,
+    timeout: int = READY_TIMEOUT_MS,
+    jitter: bool = True,
+) -> bool:
+    """
+    Wait until the page structure (elements added or removed), the anchor set
+    and fetch/XHR traffic have been quiet for `quiet_ms`, at most `timeout` ms,
+    then add the configured stealth jitter. Text-only updates and requests
+    pending for more than READY_LONG_REQUEST_MS are ignored.
+
+    Returns:
+        bool: True if the page settled, False if the ceiling was reached.
+    """
+    ready = True
+
+    try:
+        # Pages opened outside a tracked context get the tracker late (in-flight requests are missed)
+        await page.evaluate(READINESS_INIT_SCRIPT)
+
+        await page.wait_for_function(
+            READINESS_CHECK_SCRIPT,
+            arg=[quiet_ms, READY_LONG_REQUEST_MS],
+            polling=READY_POLLING_MS,
+            timeout=timeout,
+        )
+
+    except PlaywrightTimeoutError:
+        ready = False
+        if session_logger:
+            session_logger.info(f"Page not quiet after {timeout} ms, continuing: {page.url}")
+
+    except Exception as e:
+        # Navigation during the wait destroys the execution context
+        ready = False
+        if session_logger:
+            session_logger.info(f"Readiness check interrupted on {page.url}: {e}")
+
+    if jitter:
+        await stealth_pause(page)
+
+    return ready
+
+
+async def stealth_pause(page: Page) -> None:
+    """Short random pause (STEALTH_JITTER_MIN_MS..MAX_MS) keeping a human-like rhythm."""
+    if STEALTH_JITTER_MAX_MS > 0:
+        await page.wait_for_timeout(
+            random.uniform(STEALTH_JITTER_MIN_MS, STEALTH_JITTER_MAX_MS)
+        )
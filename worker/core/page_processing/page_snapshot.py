@@ -0,0 +1,79 @@
+from bs4 import BeautifulSoup, Tag
+from functools import cached_property
+from lxml import etree
+from playwright.async_api import Page
+from typing import Dict, List, Optional, Tuple
+from worker.utils.url_utils import UrlResolver
+from worker.utils.text_utils import extract_structured_text
+from worker.utils.xpath_utils import build_text_xpath_index
+from worker.core.page_processing.constants import SNAPSHOT_NOISE_TAGS
+from worker.core.page_processing.html_parser import parse_html
+from worker.core.cpu_executor.cpu_executor import cpu_executor
+
+
+class PageSnapshot:
+    """
+    HTML of a page at one point in time, parsed once. Every view (soup,
+    lxml tree, texts, anchors) is computed on first access and shared by
+    the detectors and extractors reading the same DOM state.
+    """
+
+    def __init__(self, html: str, url: str):
+        self.html = html
+        self.url = url
+
+    @classmethod
+    async def capture(cls, page: Page) -> "PageSnapshot":
+        """Snapshot the current DOM of a page."""
+        return cls(await page.content(), page.url)
+
+    async def load(self, *views: str) -> None:
+        """Compute views (e.g. "soup", "tree") on a thread, so reading them later does not block the event loop."""
+        await cpu_executor.run_in_thread(lambda: [getattr(self, view) for view in views])
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """Soup of the page without scripts, styles and other noise tags (read-only)."""
+        return parse_html(self.html, SNAPSHOT_NOISE_TAGS)
+
+    @cached_property
+    def tree(self) -> Optional[etree._Element]:
+        """lxml root of the cleaned soup, so XPaths built from the soup resolve in it."""
+        return etree.HTML(str(self.soup))
+
+    @cached_property
+    def text(self) -> str:
+        """Cleaned text, whitespace collapsed between elements."""
+        return self.soup.get_text(" ", strip=True)
+
+    @cached_property
+    def visible_text(self) -> str:
+        """Cleaned text as rendered, whitespace kept (e.g. for email extraction)."""
+        return self.soup.get_text(" ", strip=False)
+
+    @cached_property
+    def anchors(self) -> List[Tuple[str, str]]:
+        """(absolute URL, text) of every link of the page."""
+        anchors = []
+        resolver = UrlResolver(self.url, keep_query=True)
+
+        for link in self.soup.find_all("a", href=True):
+            href = link.get("href") if isinstance(link, Tag) else None
+            if not isinstance(href, str):
+                continue
+
+            link_url = resolver.resolve(href)
+            if link_url:
+                anchors.append((link_url, link.get_text(" ", strip=True)))
+
+        return anchors
+
+    @cached_property
+    def structured_text(self) -> str:
+        """Structured text (headings, lists, tables, links) of every link, known jobs included."""
+        return extract_structured_text(self.soup, self.url, skip_existing_jobs=False)
+
+    @cached_property
+    def text_xpaths(self) -> Tuple[List[str], Dict[str, List[str]]]:
+        """Unique element texts (document order) and the XPaths of the elements of each text."""
+        return build_text_xpath_index(self.soup)
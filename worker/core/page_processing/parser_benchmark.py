@@ -0,0 +1,62 @@
+"""
+Per-page parse time of each BeautifulSoup tree builder (HTML_PARSER_BACKEND).
+
+    python -m worker.core.page_processing.parser_benchmark [page.html ...]
+
+Without files, a synthetic career page (~3 MB, 2000 job cards) is used.
+"""
+
+import sys
+import time
+
+from typing import Callable, List
+from worker.core.page_processing.constants import PARSER_BACKENDS, SNAPSHOT_NOISE_TAGS
+from worker.core.page_processing.html_parser import parse_html, get_html_text
+
+RUNS = 5
+
+
+def build_career_page(jobs_count: int = 2000) -> str:
+    """Synthetic job listing page, scripts and styles included like a real SPA."""
+    cards = "".join(
+        f'<li class="job-card" data-id="{i}"><a href="/jobs/{i}-software-engineer">'
+        f"<h3>Software Engineer {i} (80-100%)</h3></a>"
+        f'<div class="meta"><span>Zürich</span><span>Full-time</span><span>Engineering</span></div>'
+        f"<p>{'We build reliable systems for millions of users. ' * 20}</p>"
+        f'<button aria-label="Save job {i}"><svg><path d="M0 0h24v24H0z"/></svg></button></li>'
+        for i in range(jobs_count)
+    )
+    script = "<script>" + "window.__STATE__.push({id: 1, title: 'x'});" * 5000 + "</script>"
+    style = "<style>" + ".job-card{margin:0;padding:4px}" * 2000 + "</style>"
+
+    return (
+        f"<html><head><title>Careers</title>{style}{script}</head>"
+        f"<body><nav><a href='/'>Home</a></nav><ul>{cards}</ul><footer>©</footer></body></html>"
+    )
+
+
+def time_per_run(func: Callable[[], object]) -> float:
+    """Best time of RUNS calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(paths: List[str]) -> None:
+    pages = [open(path, encoding="utf-8", errors="ignore").read() for path in paths]
+    pages = pages or [build_career_page()]
+
+    for html in pages:
+        print(f"Page of {len(html) / 1024 / 1024:.1f} MB")
+
+        for backend in PARSER_BACKENDS:
+            text_ms = time_per_run(lambda: get_html_text(html, SNAPSHOT_NOISE_TAGS, backend=backend))
+            soup_ms = time_per_run(lambda: parse_html(html, SNAPSHOT_NOISE_TAGS, backend=backend))
+            print(f"  {backend:<12} soup {soup_ms:8.1f} ms   text {text_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,3 +1,5 @@
+from worker.utils.keyword_matcher import KeywordMatcher
+
 PAGINATION_KEYWORDS = [
     "pagination",
     "pager",
@@ -49,3 +51,7 @@ TEXT_KEYWORDS = [
     "⏩",
     "⏪",
 ] + [str(i) for i in range(200)]
+
+# Compiled once (see PaginationDetector.index_keyword_matches)
+PAGINATION_MATCHER = KeywordMatcher(PAGINATION_KEYWORDS)
+TEXT_MATCHER = KeywordMatcher(TEXT_KEYWORDS)
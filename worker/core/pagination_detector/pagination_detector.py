@@ -1,5 +1,4 @@
 import re
-import random
 
 from html import unescape
 from lxml import etree, html
@@ -8,7 +7,7 @@ from worker.types.worker_types import (
     PaginationButtons,
     PaginationSelector
 )
-from bs4.element import PageElement
+from bs4.element import NavigableString
 from typing import List, Tuple, Optional, cast, Any
 from worker.constants.prompts import (
     PROMPT_IDENTIFY_PAGINATION_CONTAINER,
@@ -18,21 +17,26 @@ from worker.utils.llm_utils import call_llm_structured
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Page
 from worker.dependencies import llm_client, LLM_MODEL
 from worker.utils.url_utils import share_base_and_path_level, normalize_url
-from worker.core.pagination_detector.constants import TEXT_KEYWORDS, PAGINATION_KEYWORDS
+from worker.core.pagination_detector.constants import TEXT_MATCHER, PAGINATION_MATCHER
 from worker.core.page_processing.page_processing import PageProcessing
+from worker.core.page_processing.page_snapshot import PageSnapshot
+from worker.core.cpu_executor.cpu_executor import cpu_executor
+from worker.core.page_processing.page_readiness import wait_for_page_ready
 
 class PaginationDetector:
     def __init__(
         self,
         session_logger: Any,
         containers_pagination_html: dict[str, set[str]],
-        timeout: int = 20000
+        timeout: int = 20000,
+        page_processing: Optional[PageProcessing] = None,
     ):
         self.session_logger = session_logger
         self.containers_pagination_html = containers_pagination_html
         self.timeout = timeout
         
-        self.page_processing = PageProcessing(session_logger=session_logger)
+        # Shared with the other detectors of a scraper so one DOM state is parsed once
+        self.page_processing = page_processing or PageProcessing(session_logger=session_logger)
 
     @staticmethod
     def is_clickable(el: Tag) -> bool:
@@ -76,55 +80,69 @@ class PaginationDetector:
         return False
 
     @staticmethod
-    def contains_text_keyword(tag: Tag) -> bool:
-        """Check whether the tag or its children contain pagination-related keywords."""
-
-        def safe_attr_text(t: Tag, attr: str) -> str:
-            """Safely return lowercase text for an attribute (handles str, list, None)."""
-            val = t.get(attr)
-            if isinstance(val, list):
-                return " ".join(val).lower()
-            return (val or "").lower()
-
-        combined_text = (
-            tag.get_text(" ", strip=True).lower()
-            + " "
-            + " ".join(safe_attr_text(tag, attr) for attr in ("aria-label", "title"))
-            + " "
-            + " ".join(
-                child.get_text(" ", strip=True).lower()
-                + " "
-                + " ".join(
-                    safe_attr_text(child, attr) for attr in ("aria-label", "title")
-                )
-                for child in tag.find_all(True)
-                if isinstance(child, Tag)
-            )
-        )
-
-        return any(kw in combined_text for kw in TEXT_KEYWORDS)
+    def get_attr_text(tag: Tag, attr: str) -> str:
+        """Lowercase text of an attribute (handles str, list, None)."""
+        val = tag.get(attr)
+        if isinstance(val, list):
+            return " ".join(val).lower()
+        return (val or "").lower()
 
     @staticmethod
-    def matches_keywords(tag: Tag) -> bool:
-        """Return True if the tag or any of its children has a pagination-related id, class, or aria-label."""
-        def attr_text(t: PageElement, attr: str) -> str:
-            if not isinstance(t, Tag):
-                return ""
-            val = t.get(attr)
-            if isinstance(val, list):
-                return " ".join(val).lower()
-            return (val or "").lower()
-
-        for attr in ("id", "class", "aria-label"):
-            if any(kw in attr_text(tag, attr) for kw in PAGINATION_KEYWORDS):
-                return True
+    def accepts_string(tag: Tag, string: NavigableString) -> bool:
+        """Check whether tag.get_text() reads strings of this type (e.g. <template> strings)."""
+        types = tag.interesting_string_types or Tag.MAIN_CONTENT_STRING_TYPES
+        if isinstance(types, type):
+            return type(string) is types
+        return type(string) in types
+
+    @classmethod
+    def index_keyword_matches(cls, soup: BeautifulSoup) -> Tuple[set[int], set[int]]:
+        """
+        Index in one pass over the document which tags have a pagination keyword
+        in their subtree (tag included):
+            attr_matches: ids of tags with one in an id, class or aria-label
+            text_matches: ids of tags with one in their text, aria-label or title
 
-        # Also check children
-        for child in tag.find_all(True):
-            for attr in ("id", "class", "aria-label"):
-                if any(kw in attr_text(child, attr) for kw in PAGINATION_KEYWORDS):
-                    return True
-        return False
+        A match is recorded on the element carrying it, then on its ancestors
+        (up to the first one already recorded).
+        """
+        attr_matches: set[int] = set()
+        text_matches: set[int] = set()
+        path: List[Tag] = []  # Open tags, root first
+
+        def record(matches: set[int], depth: int) -> None:
+            for tag in reversed(path[: depth + 1]):
+                if id(tag) in matches:
+                    break
+                matches.add(id(tag))
+
+        for node in soup.descendants:
+            while path and path[-1] is not node.parent:
+                path.pop()
+
+            if isinstance(node, Tag):
+                path.append(node)
+
+                if any(
+                    PAGINATION_MATCHER.matches(cls.get_attr_text(node, attr))
+                    for attr in ("id", "class", "aria-label")
+                ):
+                    record(attr_matches, len(path) - 1)
+
+                if any(
+                    TEXT_MATCHER.matches(cls.get_attr_text(node, attr))
+                    for attr in ("aria-label", "title")
+                ):
+                    record(text_matches, len(path) - 1)
+
+            elif isinstance(node, NavigableString) and TEXT_MATCHER.matches(node.lower()):
+                # Recorded on the deepest tag whose get_text() reads this string type
+                for depth in range(len(path) - 1, -1, -1):
+                    if cls.accepts_string(path[depth], node):
+                        record(text_matches, depth)
+                        break
+
+        return attr_matches, text_matches
 
     @staticmethod
     def count_base_links(base_url: str, tag: Tag) -> int:
@@ -193,7 +211,7 @@ class PaginationDetector:
         return False
     
     async def extract_links_selectors_from_container(
-        self, page: Page, container_html: str, soup: BeautifulSoup
+        self, page: Page, container_html: str, snapshot: PageSnapshot
     ) -> PaginationButtons:
         """
         Extracts usable selectors for clickable pagination elements.
@@ -215,9 +233,11 @@ class PaginationDetector:
             self.session_logger.warning(f"Failed to parse container HTML: {e}")
             return {"selectors": [], "is_shadow_dom": False}
 
-        # --- Parse the full page HTML (from BeautifulSoup) into lxml for XPath operations ---
+        # --- Full page lxml tree for XPath operations (parsed once per snapshot) ---
         try:
-            full_root = etree.HTML(str(soup))
+            full_root = snapshot.tree
+            if full_root is None:
+                raise ValueError("empty document")
             full_tree = etree.ElementTree(full_root)
         except Exception as e:
             self.session_logger.warning(f"Failed to parse soup into lxml: {e}")
@@ -380,18 +400,22 @@ class PaginationDetector:
         # --- Collect base candidates (nav/div/ul), reversed so footer comes first ---
         pagination_candidates = list(reversed(soup.body.find_all(["nav", "div", "ul"])))
 
+        attr_matches, text_matches = await cpu_executor.run_in_thread(
+            self.index_keyword_matches, soup
+        )
+
         # --- Step 1: Filter by attribute names and values ---
         pagination_candidates = [
             t
             for t in pagination_candidates
-            if isinstance(t, Tag) and self.matches_keywords(t)
+            if isinstance(t, Tag) and id(t) in attr_matches
         ]
 
         # --- Step 2: Filter by pagination-related visible text ---
         pagination_candidates = [
             t
             for t in pagination_candidates
-            if isinstance(t, Tag) and self.contains_text_keyword(t)
+            if isinstance(t, Tag) and id(t) in text_matches
         ]
 
         # --- Step 3: Must contain clickable elements ---
@@ -483,7 +507,7 @@ class PaginationDetector:
         return None
     
     async def extract_pagination_buttons(
-        self, page: Page, soup: BeautifulSoup, base_url: str
+        self, page: Page, snapshot: PageSnapshot, base_url: str
     ) -> PaginationButtons:
         """
         Two-step process to extract pagination buttons using LLM assistance.
@@ -492,6 +516,9 @@ class PaginationDetector:
         Step 2: If none work, use the LLM to detect a new pagination container from the page.
         """
 
+        # --- Parse off the event loop, the steps below read the soup and lxml tree ---
+        await snapshot.load("soup", "tree")
+
         # --- Ensure the base_url has an entry in the cache ---
         self.containers_pagination_html.setdefault(base_url, set())
 
@@ -504,7 +531,7 @@ class PaginationDetector:
 
             for container_html in self.containers_pagination_html[base_url]:
                 pagination_data = await self.extract_links_selectors_from_container(
-                    page, container_html, soup
+                    page, container_html, snapshot
                 )
                 if pagination_data["selectors"]:
                     self.containers_pagination_html[base_url].add(container_html)
@@ -515,7 +542,7 @@ class PaginationDetector:
 
         # --- Step 2: Fallback — ask LLM to identify a new pagination container ---
         container_identified = await self.identify_pagination_container(
-            soup, base_url
+            snapshot.soup, base_url
         )
 
         if not container_identified:
@@ -531,13 +558,13 @@ class PaginationDetector:
 
         # --- Extract pagination XPaths from the identified container ---
         pagination_data = await self.extract_links_selectors_from_container(
-            page, container_pagination_html, soup
+            page, container_pagination_html, snapshot
         )
 
         return pagination_data
     
     async def check_if_pagination_buttons(
-        self, page: Page, url: str, retries=1
+        self, page: Page, url: str, retries=1, navigate=True
     ) -> PaginationButtons:
         """
         Loads a given URL using Playwright and attempts to detect pagination buttons.
@@ -545,22 +572,27 @@ class PaginationDetector:
         Args:
             url: The webpage URL to inspect.
             retries: Number of retry attempts if a Playwright timeout occurs.
+            navigate: False if the page is already loaded on `url`.
 
         Returns:
             A list of XPath strings corresponding to detected pagination buttons.
         """
         try:
 
-            await page.goto(url, timeout=self.timeout, wait_until="load")
+            if navigate:
 
-            await page.wait_for_timeout(random.uniform(3000, 5000))
+                await page.goto(url, timeout=self.timeout, wait_until="load")
+
+                await wait_for_page_ready(page, self.session_logger)
 
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
 
-            _, soup = await self.page_processing.return_soup(page)
+            await wait_for_page_ready(page, self.session_logger, jitter=False)
+
+            snapshot = await self.page_processing.get_snapshot(page)
 
             pagination_buttons_full = await self.extract_pagination_buttons(
-                page, soup, url
+                page, snapshot, url
             )
 
             return pagination_buttons_full
@@ -613,7 +645,7 @@ class PaginationDetector:
                 return None
 
             # ---------- Wait for content change ----------
-            await page.wait_for_timeout(random.uniform(2000, 5000))
+            await wait_for_page_ready(page, self.session_logger)
             
             new_url = await page.evaluate("() => window.location.href")
             
@@ -1,4 +1,3 @@
-import random
 import asyncio
 import pymupdf  # type: ignore
 import pymupdf4llm  # type: ignore
@@ -11,9 +10,12 @@ import uuid
 
 from numpy.linalg import norm
 from Levenshtein import ratio as levenshtein_ratio
-from bs4 import BeautifulSoup
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Page
 from worker.core.find_company_logo import FindCompanyLogo
+from worker.core.page_processing.page_readiness import wait_for_page_ready
+from worker.core.job_posting_extractor.job_posting_extractor import JobPostingExtractor
+from worker.core.cpu_executor.cpu_executor import cpu_executor
+from worker.core.cpu_executor.cpu_tasks import extract_page_description
 from typing import Any, Optional, List, Dict, Tuple
 from worker.constants.prompts import (
     get_extract_company_description_prompt,
@@ -27,6 +29,7 @@ from worker.types.worker_types import (
 )
 from worker.dependencies import llm_client, LLM_MODEL, encoder_model
 from worker.utils.text_utils import get_emails
+from worker.utils.url_utils import canonicalize_job_url
 from worker.core.post_process_jobs.constants import COUNTRY_REGION_DATA, BLOCKED_EXTENSIONS
 from docx import Document
 from pathlib import Path
@@ -61,6 +64,8 @@ class PostProcessingJobs:
             self.session_logger, self.company_name, self.company_id
         )
 
+        self.job_posting_extractor = JobPostingExtractor(self.session_logger)
+
     @staticmethod
     def find_best_match_country(
         input_country: Optional[str], score_threshold: int = 85
@@ -164,6 +169,22 @@ class PostProcessingJobs:
         """Normalize country name: replace 'Israel' with 'Occupied Palestine'."""
         return "Occupied Palestine" if country == "Israel" else country
 
+    async def compute_simhash(self, text: Optional[str]) -> Optional[int]:
+        """Return the SimHash of a job description as a signed 63-bit integer, or None if too short."""
+        if not text or len(text) <= 50:
+            self.session_logger.info("Job description too short (<50 chars), skipping SimHash")
+            return None
+
+        simhash_obj = await asyncio.to_thread(Simhash, text.split())
+        simhash = simhash_obj.value
+
+        if simhash is None:
+            self.session_logger.warning("Simhash returned None, skipping hash computation")
+            return None
+
+        # Force signed 63-bit integer (PostgreSQL-safe)
+        return int(simhash & ((1 << 63) - 1))
+
     async def extract_job_description_file(
         self,
         url: str,
@@ -258,21 +279,9 @@ class PostProcessingJobs:
             return None, None
 
         # ---------- SimHash + Emails ----------
-        simhash_value: Optional[int] = None
-
-        if content and len(content) > 50:
-            tokens = content.split()
-            simhash_obj = await asyncio.to_thread(Simhash, tokens)
-            simhash = simhash_obj.value
-
-            if simhash is None:
-                self.session_logger.warning("Simhash returned None, skipping hash computation")
-            else:
-                simhash_value = int(simhash & ((1 << 63) - 1))
-        else:
-            self.session_logger.info("Job description too short (<50 chars), skipping SimHash")
+        simhash_value = await self.compute_simhash(content)
 
-        if content and (new_emails := get_emails(content)):
+        if content and (new_emails := await cpu_executor.run_in_thread(get_emails, content)):
             self.session_logger.info(f"Emails found: {new_emails}")
             self.emails.update(new_emails)
 
@@ -280,48 +289,40 @@ class PostProcessingJobs:
 
     async def extract_job_description(
         self, page: Page, url: str, retries=1
-    ) -> Optional[Tuple[str, Optional[int]]]:
-        """Extract a job description text from a job description page."""
+    ) -> Optional[Tuple[str, Optional[int], Optional[Job]]]:
+        """
+        Extract a job description text from a job description page, along with
+        the page's schema.org JobPosting data when it declares one.
+        """
         try:
 
             await page.goto(url, timeout=self.timeout, wait_until="load")
 
-            await page.wait_for_timeout(random.uniform(1000, 3000))
+            await wait_for_page_ready(page, self.session_logger)
 
             html_content = await page.content()
-            soup = await asyncio.to_thread(BeautifulSoup, html_content, "lxml")
 
-            job_description = soup.body or soup
-
-            for tag in job_description(["script", "style", "meta", "noscript", "svg"]):
-                tag.decompose()
-
-            text_job_description = job_description.get_text(separator="\n", strip=True)
-
-            simhash_value: Optional[int] = None
+            structured_jobs = await cpu_executor.run_in_thread(
+                self.job_posting_extractor.extract_jobs, html_content, url, url
+            )
+            structured_job = next(
+                (job for job in structured_jobs if job["job_url"] == url),
+                structured_jobs[0] if len(structured_jobs) == 1 else None,
+            )
 
-            if len(text_job_description) > 50:
-                tokens = text_job_description.split()
-                simhash_obj = await asyncio.to_thread(Simhash, tokens)
-                simhash = simhash_obj.value
+            text_job_description = await cpu_executor.run_in_process(
+                extract_page_description,
+                html_content.encode(),
+                ["script", "style", "meta", "noscript", "svg"],
+            )
 
-                if simhash is None:
-                    self.session_logger.warning(
-                        "Simhash returned None, skipping hash computation"
-                    )
-                else:
-                    # Force signed 63-bit integer (PostgreSQL-safe)
-                    simhash_value = int(simhash & ((1 << 63) - 1))
-            else:
-                self.session_logger.info(
-                    "Job description too short (<50 chars), skipping SimHash"
-                )
+            simhash_value = await self.compute_simhash(text_job_description)
 
-            if new_emails := get_emails(text_job_description):
+            if new_emails := await cpu_executor.run_in_thread(get_emails, text_job_description):
                 self.session_logger.info(f"Emails found: {new_emails}")
                 self.emails.update(new_emails)
 
-            return text_job_description, simhash_value
+            return text_job_description, simhash_value, structured_job
 
         except PlaywrightTimeoutError as e:
             self.session_logger.warning(f"Timeout loading {url}: {e}")
@@ -441,7 +442,7 @@ class PostProcessingJobs:
                 job_url, timeout=self.timeout, wait_until="domcontentloaded"
             )
 
-            await page.wait_for_timeout(random.uniform(1000, 3000))
+            await wait_for_page_ready(page, self.session_logger)
 
             if not response:
                 self.session_logger.info(f"No response for {job_url}")
@@ -475,17 +476,28 @@ class PostProcessingJobs:
 
         seen_urls: set[str] = set()
 
-        job_offers_urls = set([job["job_url"] for job in self.job_offers])
+        job_offers_urls = set([canonicalize_job_url(job["job_url"]) for job in self.job_offers])
 
-        self.old_job_offers.extend(list(self.current_job_offers - job_offers_urls))
+        # Stored URLs may predate canonicalization: compare canonical forms, keep stored ones
+        current_job_offers_canonical = {
+            canonicalize_job_url(url) for url in self.current_job_offers
+        }
+
+        self.old_job_offers.extend(
+            [
+                url
+                for url in self.current_job_offers
+                if canonicalize_job_url(url) not in job_offers_urls
+            ]
+        )
 
         new_job_offers_to_complete = [
             job
             for job in self.job_offers
             if job.get("job_title")
             and job.get("job_url")
-            and job["job_url"] not in self.current_job_offers
-            and not_seen_and_add(job["job_url"], seen_urls)
+            and canonicalize_job_url(job["job_url"]) not in current_job_offers_canonical
+            and not_seen_and_add(canonicalize_job_url(job["job_url"]), seen_urls)
             # and await self.check_single_link(job["job_url"])
         ]
 
@@ -535,8 +547,23 @@ class PostProcessingJobs:
             # --- Extract job description ---
 
             result_job_description = None
+            structured_job: Optional[Job] = None
+
+            if job.get("job_description"):
+
+                # Already read from the source (e.g. an ATS feed), no navigation needed
+                known_description = job["job_description"] or ""
+
+                if new_emails := await cpu_executor.run_in_thread(get_emails, known_description):
+                    self.session_logger.info(f"Emails found: {new_emails}")
+                    self.emails.update(new_emails)
 
-            if job_url.lower().endswith((".pdf", ".docx")):
+                result_job_description = (
+                    known_description,
+                    await self.compute_simhash(known_description),
+                )
+
+            elif job_url.lower().endswith((".pdf", ".docx")):
 
                 result_job_description = await self.extract_job_description_file(
                     job_url
@@ -544,9 +571,11 @@ class PostProcessingJobs:
 
             else:
 
-                result_job_description = await self.extract_job_description(
-                    page, job_url
-                )
+                result_page = await self.extract_job_description(page, job_url)
+
+                if result_page is not None:
+                    text_job_description, hash_page, structured_job = result_page
+                    result_job_description = (text_job_description, hash_page)
 
             if result_job_description is None:
                 job_description, hash_job_description_page = None, None
@@ -556,15 +585,38 @@ class PostProcessingJobs:
             job["job_description"] = job_description
             job["hash_job_description_page"] = hash_job_description_page
 
+            # --- Fill missing fields from the page's schema.org JobPosting ---
+            if structured_job:
+                for key in (
+                    "location_country",
+                    "location_region",
+                    "contract_type",
+                    "salary",
+                    "skills_required",
+                ):
+                    if structured_job.get(key) and not job.get(key):
+                        job[key] = structured_job[key]  # type: ignore[literal-required]
+
             # --- Extract structured info ---
             if job_description:
-                skills_required, country, region, salary = (
-                    await self.extract_infos_job_description(
-                        job_description,
+                if self.job_posting_extractor.is_complete(job):
+                    self.session_logger.info(
+                        "Location, salary and skills known from structured data, skipping LLM"
+                    )
+                    skills_required, country, region, salary = (
+                        job.get("skills_required", []),
                         job.get("location_country"),
                         job.get("location_region"),
+                        job.get("salary"),
+                    )
+                else:
+                    skills_required, country, region, salary = (
+                        await self.extract_infos_job_description(
+                            job_description,
+                            job.get("location_country"),
+                            job.get("location_region"),
+                        )
                     )
-                )
 
                 country = self.find_best_match_country(country)
                 region = self.find_best_match_region(region, country)
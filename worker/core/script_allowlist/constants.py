@@ -0,0 +1,38 @@
+# Script hosts never kept in a learned allowlist (analytics, chat widgets, A/B testing, session replay)
+NON_ESSENTIAL_SCRIPT_HOSTS = [
+    "hotjar.com",
+    "clarity.ms",
+    "segment.com",
+    "segment.io",
+    "mixpanel.com",
+    "amplitude.com",
+    "heap.io",
+    "heapanalytics.com",
+    "fullstory.com",
+    "mouseflow.com",
+    "quantummetric.com",
+    "contentsquare.net",
+    "optimizely.com",
+    "visualwebsiteoptimizer.com",
+    "abtasty.com",
+    "kameleoon.eu",
+    "intercom.io",
+    "intercomcdn.com",
+    "crisp.chat",
+    "drift.com",
+    "driftt.com",
+    "tawk.to",
+    "zdassets.com",
+    "livechatinc.com",
+    "hs-analytics.net",
+    "hs-banner.com",
+    "hsadspixel.net",
+    "snap.licdn.com",
+    "matomo.cloud",
+    "nr-data.net",
+    "newrelic.com",
+    "sentry-cdn.com",
+    "datadoghq-browser-agent.com",
+]
+
+MIN_YIELD_RATIO = 0.5  # Fewer jobs than this share of the learned baseline triggers re-learning
@@ -0,0 +1,163 @@
+import time
+
+from playwright.async_api import Request
+from typing import Any, Dict, Optional, cast
+from urllib.parse import urlparse
+from worker.dependencies import SCRIPT_ALLOWLIST_TTL_DAYS
+from worker.types.worker_types import ScriptAllowlistPolicy
+from worker.utils.url_utils import get_registrable_domain
+from worker.utils.redis_commands import get_shared_cache, save_shared_cache, delete_shared_cache
+from worker.core.script_allowlist.constants import NON_ESSENTIAL_SCRIPT_HOSTS, MIN_YIELD_RATIO
+
+
+class ScriptAllowlist:
+    """
+    Third-party scripts allowed while extracting a site's job listing pages.
+
+    The first visit of a site runs in learning mode: nothing is blocked and
+    the third-party script origins loaded are recorded. If jobs were found,
+    those origins (minus analytics, chat and A/B testing hosts) become the
+    site's allowlist, shared by every worker. Later visits block every other
+    third-party script. A job listing page not seen yet on a known site is
+    also visited in learning mode, its origins are added to the allowlist.
+    When a job listing page yields much fewer jobs than its first visit, the
+    allowlist is dropped and the next visit learns again.
+    """
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+
+        self.policies: Dict[str, Optional[ScriptAllowlistPolicy]] = {}
+        self.site: Optional[str] = None  # Site being extracted, None when inactive
+        self.page_url: Optional[str] = None
+        self.learning = False  # Nothing blocked, origins recorded
+        self.observed_origins: set[str] = set()
+        self.blocked_count = 0
+
+    @staticmethod
+    def get_origin(url: str) -> str:
+        """Return the scheme and host of a URL."""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.hostname or ''}"
+
+    @staticmethod
+    def is_non_essential(origin: str) -> bool:
+        """Check whether a script origin belongs to analytics / chat / A/B testing services."""
+        host = urlparse(origin).hostname or ""
+        return any(
+            host == domain or host.endswith("." + domain) for domain in NON_ESSENTIAL_SCRIPT_HOSTS
+        )
+
+    async def start(self, url: str) -> None:
+        """Apply (or learn) the allowlist of the site of a job listing page until finish()."""
+        site = get_registrable_domain(url)
+
+        if site not in self.policies:
+            try:
+                self.policies[site] = cast(
+                    Optional[ScriptAllowlistPolicy],
+                    await get_shared_cache("script_allowlist", site),
+                )
+            except Exception as e:
+                self.session_logger.warning(f"Failed to load script allowlist of {site}: {e}")
+                self.policies[site] = None
+
+        self.site = site
+        self.page_url = url
+        self.observed_origins = set()
+        self.blocked_count = 0
+
+        policy = self.policies[site]
+        self.learning = policy is None or url not in policy["baseline_jobs"]
+
+        if self.learning:
+            self.session_logger.info(f"[SCRIPTS] Learning third-party scripts of {site} on {url}")
+
+    def should_block(self, request: Request) -> bool:
+        """Check whether a script request must be blocked (recording it while learning)."""
+        if self.site is None or get_registrable_domain(request.url) == self.site:
+            return False
+
+        origin = self.get_origin(request.url)
+        policy = self.policies.get(self.site)
+
+        if self.learning or policy is None:
+            self.observed_origins.add(origin)
+            return False
+
+        if origin in policy["allowed_origins"]:
+            return False
+
+        self.blocked_count += 1
+        return True
+
+    async def save_policy(self, site: str, policy: ScriptAllowlistPolicy) -> None:
+        """Share the allowlist of a site with every worker."""
+        self.policies[site] = policy
+
+        await save_shared_cache(
+            "script_allowlist", site, policy, SCRIPT_ALLOWLIST_TTL_DAYS * 24 * 60 * 60
+        )
+
+    def get_needed_origins(self) -> set[str]:
+        """Third-party script origins observed while learning, minus non-essential services."""
+        return {origin for origin in self.observed_origins if not self.is_non_essential(origin)}
+
+    async def finish(self, jobs_count: int) -> None:
+        """Learn or check the allowlist of the current site from the jobs its page yielded."""
+        site, page_url = self.site, self.page_url
+        if site is None or page_url is None:
+            return
+
+        self.site = self.page_url = None
+        policy = self.policies.get(site)
+
+        try:
+            # A learning visit without jobs teaches nothing (no 0 baseline, no empty allowlist)
+            if self.learning and jobs_count == 0:
+                return
+
+            if policy is None:
+                policy = {
+                    "allowed_origins": sorted(self.get_needed_origins()),
+                    "baseline_jobs": {page_url: jobs_count},
+                    "learned_at": time.time(),
+                }
+
+                await self.save_policy(site, policy)
+
+                self.session_logger.info(
+                    f"[SCRIPTS] Learned {len(policy['allowed_origins'])}/{len(self.observed_origins)} "
+                    f"third-party script origins needed on {site}"
+                )
+
+            elif self.learning:
+                # Other job listing page of a known site, learned like the first one
+                allowed_origins = set(policy["allowed_origins"])
+                new_origins = self.get_needed_origins() - allowed_origins
+
+                policy["allowed_origins"] = sorted(allowed_origins | new_origins)
+                policy["baseline_jobs"][page_url] = jobs_count
+                await self.save_policy(site, policy)
+
+                self.session_logger.info(
+                    f"[SCRIPTS] Learned {len(new_origins)} more third-party script origins on {page_url}"
+                )
+
+            elif jobs_count < policy["baseline_jobs"][page_url] * MIN_YIELD_RATIO:
+                self.policies[site] = None
+
+                await delete_shared_cache("script_allowlist", site)
+
+                self.session_logger.info(
+                    f"[SCRIPTS] Yield dropped on {page_url} ({jobs_count} jobs, "
+                    f"{policy['baseline_jobs'][page_url]} before), re-learning next visit"
+                )
+
+            else:
+                self.session_logger.info(
+                    f"[SCRIPTS] Blocked {self.blocked_count} third-party scripts on {site}"
+                )
+
+        except Exception as e:
+            self.session_logger.warning(f"Failed to update script allowlist of {site}: {e}")
@@ -1,80 +1,39 @@
-import random
 import asyncio
 
-from bs4 import BeautifulSoup
 from worker.constants.prompts import PROMPT_IDENTIFY_SHOW_MORE_BUTTON_TEXT
 from worker.utils.llm_utils import call_llm_structured
 from worker.types.worker_types import (
     ButtonLoadMoreIdentifier,
 )
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Page
-from typing import List, Tuple, Optional, Callable, Any
-from collections import defaultdict
+from typing import Tuple, Optional, Callable, Any
 from urllib.parse import urlparse
 from playwright.async_api import Page
 from worker.dependencies import llm_client, LLM_MODEL
-from worker.utils.text_utils import hash_page_content, extract_visible_text
+from worker.utils.text_utils import hash_page_content
 from worker.utils.xpath_utils import find_first_existing_xpath
 from worker.core.page_processing.page_processing import PageProcessing
+from worker.core.page_processing.page_snapshot import PageSnapshot
+from worker.core.page_processing.page_readiness import wait_for_page_ready
 
 class ShowMoreButtonDetector:
-    def __init__(self, session_logger: Any, timeout: int = 20000):
+    def __init__(
+        self,
+        session_logger: Any,
+        timeout: int = 20000,
+        page_processing: Optional[PageProcessing] = None,
+    ):
         """Initialize ShowMoreButtonDetector with a session logger and Playwright timeout."""
         self.session_logger = session_logger
         self.timeout = timeout
 
-        self.page_processing = PageProcessing(
+        # Shared with the other detectors of a scraper so one DOM state is parsed once
+        self.page_processing = page_processing or PageProcessing(
             session_logger=session_logger,
         )
 
-    @staticmethod
-    def extract_all_text_with_xpath(
-        soup: BeautifulSoup,
-    ) -> Tuple[List[str], dict[str, List[str]]]:
-        """
-        Extract all visible text from the page.
-        Returns:
-            texts: list of unique text strings
-            mapping: dict {text: [list of xpath(s)]}
-        """
-
-        def get_xpath(element) -> str:
-            """Build a unique XPath for the given element."""
-            components = []
-            child = element
-            for parent in element.parents:
-                if parent.name is None:
-                    break
-                siblings = parent.find_all(child.name, recursive=False)
-                if len(siblings) > 1:
-                    index = siblings.index(child) + 1
-                    components.append(f"{child.name}[{index}]")
-                else:
-                    components.append(child.name)
-                child = parent
-            return "/" + "/".join(reversed(components))
-
-        texts = []
-        mapping = defaultdict(list)
-        seen = set()
-
-        for element in soup.find_all(True):
-            text = element.get_text(" ", strip=True)
-            if text:
-                xpath = get_xpath(element)
-
-                # store mapping (multiple elements can share same text)
-                mapping[text].append(xpath)
-
-                # add to texts list only once
-                if text not in seen:
-                    texts.append(text)
-                    seen.add(text)
-
-        return texts, mapping
-
     async def extract_show_more_button(
-        self, page: Page, soup: BeautifulSoup, url: str
+        self, page: Page, snapshot: PageSnapshot, url: str
     ) -> Optional[Tuple[str, str]]:
         """
         Uses an LLM to identify a 'Show More' (load more) button on the given page.
@@ -84,7 +43,8 @@ class ShowMoreButtonDetector:
             A tuple (xpath, button_text), both empty if no valid match is found.
         """
         try:
-            texts, mapping = self.extract_all_text_with_xpath(soup)
+            await snapshot.load("text_xpaths", "tree")
+            texts, mapping = snapshot.text_xpaths
             n = len(texts)
             if n < 50:
                 page_text = "\n".join(texts)
@@ -133,7 +93,7 @@ class ShowMoreButtonDetector:
                 self.session_logger.warning(f"No XPath mapping found for text '{button_text}'")
                 return None
 
-            xpath = find_first_existing_xpath(soup, candidate_xpaths)
+            xpath = find_first_existing_xpath(snapshot.tree, candidate_xpaths)
 
             if xpath:
                 return xpath, button_text
@@ -164,9 +124,9 @@ class ShowMoreButtonDetector:
         """
         try:
 
-            _, soup = await self.page_processing.return_soup(page)
+            snapshot = await self.page_processing.get_snapshot(page)
 
-            show_more_button = await self.extract_show_more_button(page, soup, url)
+            show_more_button = await self.extract_show_more_button(page, snapshot, url)
 
             return show_more_button
 
@@ -188,16 +148,7 @@ class ShowMoreButtonDetector:
 
     async def get_page_content(self, page: Page):
         """Return the cleaned visible text of the current page with noise tags removed."""
-        html_content = await page.content()
-
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        for tag in soup(["script", "style", "meta", "noscript", "svg"]):
-            tag.decompose()
-
-        text = soup.get_text(" ", strip=True)
-
-        return text
+        return await self.page_processing.get_page_text(page)
 
     async def click_button_load_more(self, page: Page, button_text: str):
         """
@@ -207,13 +158,11 @@ class ShowMoreButtonDetector:
 
         try:
 
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Only the soup is read, noise tags can be pruned in the page
+            snapshot = await self.page_processing.get_pruned_snapshot(page)
+            await snapshot.load("text_xpaths")
 
-            for tag in soup(["script", "style", "meta", "noscript", "svg"]):
-                tag.decompose()
-
-            _, mapping = self.extract_all_text_with_xpath(soup)
+            _, mapping = snapshot.text_xpaths
 
             candidate_xpaths = mapping.get(button_text, [])
 
@@ -329,9 +278,10 @@ class ShowMoreButtonDetector:
                     )
                     break
 
-                await page.wait_for_load_state("networkidle", timeout=self.timeout)
-
-                await page.wait_for_timeout(random.uniform(3000, 5000))
+                # New items rendered and their requests finished
+                await wait_for_page_ready(
+                    page, self.session_logger, timeout=self.timeout
+                )
 
                 page_content = await self.get_page_content(page)
 
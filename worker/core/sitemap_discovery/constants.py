@@ -0,0 +1,27 @@
+import re
+
+from worker.core.crawl_frontier.constants import CAREER_WEIGHT, LISTING_WEIGHT
+
+DEFAULT_SITEMAP_PATHS = ["/sitemap.xml", "/sitemap_index.xml"]
+
+# === Streaming bounds ===
+CHUNK_SIZE = 64 * 1024
+INFLATE_STEP = 256 * 1024  # Max bytes inflated from one gzip chunk at a time
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024  # Decompressed bytes read per sitemap
+MAX_ROBOTS_BYTES = 512 * 1024
+MAX_SITEMAPS = 20  # Sitemaps (including index children) read per site
+MAX_PENDING_SITEMAPS = 200
+MAX_URLS_SCANNED = 200_000
+REQUEST_TIMEOUT = 30  # seconds, per request
+DISCOVERY_TIMEOUT = 60  # seconds, whole discovery
+
+# === Candidate selection ===
+MIN_CANDIDATE_SCORE = CAREER_WEIGHT - 1.0
+CONFIDENT_SCORE = LISTING_WEIGHT
+MAX_CANDIDATES = 30
+MAX_CANDIDATES_PER_PATTERN = 2
+MAX_CANDIDATES_TO_VERIFY = 8
+
+# Last path segment of a job detail page (ids or long title slugs)
+DETAIL_SLUG_PATTERN = re.compile(r"\d{3,}|(?:[^/\-]+-){4,}")
+DETAIL_PENALTY = -LISTING_WEIGHT
@@ -0,0 +1,320 @@
+import zlib
+import heapq
+import asyncio
+import aiohttp
+
+from lxml import etree
+from contextlib import aclosing
+from collections import defaultdict
+from typing import Any, AsyncIterator, DefaultDict, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse, urljoin
+from worker.types.worker_types import SitemapCandidate
+from worker.utils.url_utils import same_domain, canonicalize_url
+from worker.utils.http_utils import create_http_session
+from worker.core.crawl_frontier.crawl_frontier import score_career_link, get_pattern_keys
+from worker.core.sitemap_discovery.constants import (
+    DEFAULT_SITEMAP_PATHS,
+    CHUNK_SIZE,
+    INFLATE_STEP,
+    MAX_SITEMAP_BYTES,
+    MAX_ROBOTS_BYTES,
+    MAX_SITEMAPS,
+    MAX_PENDING_SITEMAPS,
+    MAX_URLS_SCANNED,
+    REQUEST_TIMEOUT,
+    DISCOVERY_TIMEOUT,
+    MIN_CANDIDATE_SCORE,
+    MAX_CANDIDATES,
+    MAX_CANDIDATES_PER_PATTERN,
+    DETAIL_SLUG_PATTERN,
+    DETAIL_PENALTY,
+)
+
+
+class SitemapDiscovery:
+    """
+    Reads robots.txt and sitemaps (plain, gzip and sitemap indexes) of a site
+    without a browser, streaming the XML so memory stays bounded.
+    """
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+
+    @staticmethod
+    def get_origin(url: str) -> str:
+        """Return scheme://netloc of a URL."""
+        parsed = urlparse(url)
+        return f"{parsed.scheme or 'https'}://{parsed.netloc}"
+
+    @staticmethod
+    def score_sitemap_url(url: str) -> float:
+        """Score a page URL listed in a sitemap, penalizing job detail pages."""
+        score = score_career_link(url)
+        last_segment = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+        if DETAIL_SLUG_PATTERN.search(last_segment):
+            score += DETAIL_PENALTY
+        return score
+
+    @staticmethod
+    def read_entries(
+        parser: etree.XMLPullParser,
+    ) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Yield (kind, loc, lastmod) for every completed <url>/<sitemap> element and free it."""
+        for _, elem in parser.read_events():
+            if not isinstance(elem.tag, str):
+                continue
+
+            kind = etree.QName(elem).localname
+            if kind not in ("url", "sitemap"):
+                continue
+
+            loc: Optional[str] = None
+            lastmod: Optional[str] = None
+            for child in elem:
+                if not isinstance(child.tag, str):
+                    continue
+                name = etree.QName(child).localname
+                if name == "loc":
+                    loc = (child.text or "").strip()
+                elif name == "lastmod":
+                    lastmod = (child.text or "").strip() or None
+
+            # Free parsed elements so memory does not grow with the sitemap size
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+            if loc:
+                yield kind, loc, lastmod
+
+    async def get_robots_sitemaps(
+        self, session: aiohttp.ClientSession, origin: str
+    ) -> List[str]:
+        """Return sitemap URLs declared in robots.txt, or the default locations."""
+        sitemaps: List[str] = []
+
+        try:
+            async with session.get(f"{origin}/robots.txt", allow_redirects=True) as response:
+                if response.status == 200:
+                    raw = await response.content.read(MAX_ROBOTS_BYTES)
+                    for line in raw.decode("utf-8", errors="ignore").splitlines():
+                        key, _, value = line.partition(":")
+                        if key.strip().lower() == "sitemap" and value.strip():
+                            sitemaps.append(urljoin(origin + "/", value.strip()))
+        except Exception as e:
+            self.session_logger.info(f"[SITEMAP] robots.txt unavailable for {origin}: {e}")
+
+        if not sitemaps:
+            sitemaps = [origin + path for path in DEFAULT_SITEMAP_PATHS]
+
+        return sitemaps
+
+    async def stream_sitemap(
+        self, session: aiohttp.ClientSession, sitemap_url: str
+    ) -> AsyncIterator[Tuple[str, str, Optional[str]]]:
+        """Stream one sitemap (plain or gzip) and yield its entries as they are parsed."""
+        try:
+            async with session.get(sitemap_url, allow_redirects=True) as response:
+                if response.status != 200:
+                    self.session_logger.info(
+                        f"[SITEMAP] {sitemap_url} → HTTP {response.status}"
+                    )
+                    return
+
+                parser = etree.XMLPullParser(
+                    events=("end",),
+                    recover=True,
+                    resolve_entities=False,
+                    no_network=True,
+                )
+                decompressor = None
+                first_chunk = True
+                total_bytes = 0
+
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    # Gzip sitemaps served without Content-Encoding (e.g. sitemap.xml.gz)
+                    if first_chunk:
+                        first_chunk = False
+                        if chunk[:2] == b"\x1f\x8b":
+                            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+                    pieces = [chunk]
+                    if decompressor is not None:
+                        pieces = []
+                        data = decompressor.decompress(chunk, INFLATE_STEP)
+                        while data:
+                            pieces.append(data)
+                            if total_bytes + sum(len(p) for p in pieces) > MAX_SITEMAP_BYTES:
+                                break
+                            tail = decompressor.unconsumed_tail
+                            data = decompressor.decompress(tail, INFLATE_STEP) if tail else b""
+
+                    for piece in pieces:
+                        total_bytes += len(piece)
+                        if total_bytes > MAX_SITEMAP_BYTES:
+                            self.session_logger.warning(
+                                f"[SITEMAP] {sitemap_url} exceeds {MAX_SITEMAP_BYTES} bytes, truncated."
+                            )
+                            return
+
+                        parser.feed(piece)
+                        for entry in self.read_entries(parser):
+                            yield entry
+
+        except Exception as e:
+            self.session_logger.info(f"[SITEMAP] Failed reading {sitemap_url}: {e}")
+
+    async def iter_page_entries(
+        self, session: aiohttp.ClientSession, base_url: str
+    ) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        Yield (loc, lastmod) for every page listed in the site's sitemaps.
+        Sitemap indexes are followed best-first (career-like sitemap names first).
+        """
+        origin = self.get_origin(base_url)
+        roots = await self.get_robots_sitemaps(session, origin)
+
+        pending: List[Tuple[float, int, str]] = []
+        for i, sitemap_url in enumerate(roots):
+            heapq.heappush(pending, (-score_career_link(sitemap_url), i, sitemap_url))
+
+        counter = len(roots)
+        visited: set[str] = set()
+        urls_scanned = 0
+
+        while pending and len(visited) < MAX_SITEMAPS:
+            _, _, sitemap_url = heapq.heappop(pending)
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+
+            async with aclosing(self.stream_sitemap(session, sitemap_url)) as entries:
+                async for kind, loc, lastmod in entries:
+                    if kind == "sitemap":
+                        if loc not in visited and len(pending) < MAX_PENDING_SITEMAPS:
+                            counter += 1
+                            heapq.heappush(pending, (-score_career_link(loc), counter, loc))
+                        continue
+
+                    urls_scanned += 1
+                    if urls_scanned > MAX_URLS_SCANNED:
+                        self.session_logger.info(
+                            f"[SITEMAP] Scanned {MAX_URLS_SCANNED} URLs for {origin}, stopping."
+                        )
+                        return
+
+                    yield loc, lastmod
+
+    async def collect_candidates(self, base_url: str) -> List[SitemapCandidate]:
+        """Scan the sitemaps and keep the best scored same-domain career page candidates."""
+        candidates: Dict[str, SitemapCandidate] = {}
+
+        def add_candidate(url: str, score: float, lastmod: Optional[str]) -> None:
+            if score < MIN_CANDIDATE_SCORE:
+                return
+            url = canonicalize_url(url)
+            current = candidates.get(url)
+            if current is None or current["score"] < score:
+                candidates[url] = {"url": url, "score": score, "lastmod": lastmod}
+
+            # Keep memory bounded on huge sitemaps
+            if len(candidates) > MAX_CANDIDATES * 10:
+                best = heapq.nlargest(
+                    MAX_CANDIDATES * 5, candidates.values(), key=lambda c: c["score"]
+                )
+                candidates.clear()
+                candidates.update({c["url"]: c for c in best})
+
+        async with create_http_session(REQUEST_TIMEOUT) as session:
+            async with aclosing(self.iter_page_entries(session, base_url)) as entries:
+                async for loc, lastmod in entries:
+                    if not same_domain(loc, base_url):
+                        continue
+
+                    url = loc.split("#")[0].rstrip("/")
+                    add_candidate(url, self.score_sitemap_url(url), lastmod)
+
+                    # Detail pages are listed, their parent usually is the listing page
+                    parent = url.rsplit("/", 1)[0]
+                    if urlparse(parent).path not in ("", "/"):
+                        add_candidate(parent, self.score_sitemap_url(parent), None)
+
+        # --- Cap candidates per URL pattern so one section cannot take all slots
+        selected: List[SitemapCandidate] = []
+        pattern_counts: DefaultDict[str, int] = defaultdict(int)
+
+        for candidate in sorted(
+            candidates.values(), key=lambda c: (-c["score"], len(c["url"]))
+        ):
+            pattern = (get_pattern_keys(candidate["url"], depth=2) or [candidate["url"]])[-1]
+            if pattern_counts[pattern] >= MAX_CANDIDATES_PER_PATTERN:
+                continue
+            pattern_counts[pattern] += 1
+            selected.append(candidate)
+            if len(selected) >= MAX_CANDIDATES:
+                break
+
+        return selected
+
+    async def discover_candidates(self, base_url: str) -> List[SitemapCandidate]:
+        """Return career page candidates from robots.txt / sitemaps, best first."""
+        try:
+            candidates = await asyncio.wait_for(
+                self.collect_candidates(base_url), timeout=DISCOVERY_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            self.session_logger.warning(f"[SITEMAP] Discovery timed out for {base_url}")
+            return []
+        except Exception as e:
+            self.session_logger.warning(f"[SITEMAP] Discovery failed for {base_url}: {e}")
+            return []
+
+        self.session_logger.info(
+            f"[SITEMAP] {len(candidates)} career candidates for {base_url}: "
+            f"{[(c['url'], round(c['score'], 1)) for c in candidates[:10]]}"
+        )
+
+        return candidates
+
+    async def collect_lastmods(self, urls: List[str]) -> Dict[str, str]:
+        """Look up the sitemap lastmod of each URL, reading each origin's sitemaps once."""
+        targets_by_origin: DefaultDict[str, Dict[str, str]] = defaultdict(dict)
+        for url in urls:
+            targets_by_origin[self.get_origin(url)][url.split("#")[0].rstrip("/")] = url
+
+        lastmods: Dict[str, str] = {}
+
+        async with create_http_session(REQUEST_TIMEOUT) as session:
+            for origin, targets in targets_by_origin.items():
+                remaining = dict(targets)
+                async with aclosing(self.iter_page_entries(session, origin)) as entries:
+                    async for loc, lastmod in entries:
+                        original = remaining.pop(loc.split("#")[0].rstrip("/"), None)
+                        if original and lastmod:
+                            lastmods[original] = lastmod
+                        if not remaining:
+                            break
+
+        return lastmods
+
+    async def get_lastmods(self, urls: List[str]) -> Dict[str, str]:
+        """Return {url: lastmod} for the given pages when their sitemaps declare it."""
+        if not urls:
+            return {}
+
+        try:
+            lastmods = await asyncio.wait_for(
+                self.collect_lastmods(urls), timeout=DISCOVERY_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            self.session_logger.warning("[SITEMAP] lastmod lookup timed out")
+            return {}
+        except Exception as e:
+            self.session_logger.warning(f"[SITEMAP] lastmod lookup failed: {e}")
+            return {}
+
+        self.session_logger.info(f"[SITEMAP] lastmod found for {len(lastmods)}/{len(urls)} pages")
+
+        return lastmods
@@ -0,0 +1,96 @@
+import json
+import time
+
+from playwright.async_api import BrowserContext
+from typing import Any, List, Optional, cast
+from urllib.parse import urlparse
+from worker.dependencies import STORAGE_STATE_MAX_KB
+from worker.types.worker_types import StorageState
+from worker.utils.url_utils import get_registrable_domain
+from worker.utils.redis_commands import get_storage_states, save_storage_state
+
+
+class StorageStateCache:
+    """
+    Cookies and localStorage of a browser context, saved per registrable
+    domain once a consent wall (or any interstitial) was handled there, and
+    loaded into the next contexts visiting that domain through `storage_state`.
+    """
+
+    def __init__(self, session_logger: Any, max_bytes: int = STORAGE_STATE_MAX_KB * 1024):
+        self.session_logger = session_logger
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def filter_state(state: StorageState, domain: str) -> StorageState:
+        """Keep the cookies and localStorage origins of a registrable domain."""
+        return {
+            "cookies": [
+                cookie
+                for cookie in state.get("cookies", [])
+                if get_registrable_domain(cookie.get("domain", "").lstrip(".")) == domain
+            ],
+            "origins": [
+                origin
+                for origin in state.get("origins", [])
+                if get_registrable_domain(urlparse(origin.get("origin", "")).hostname or "")
+                == domain
+            ],
+        }
+
+    async def load(self, urls: List[str]) -> Optional[StorageState]:
+        """Return the saved storage states of the domains of `urls` merged, or None if none is saved."""
+        domains = sorted({get_registrable_domain(url) for url in urls if url})
+
+        try:
+            states = await get_storage_states(domains)
+        except Exception as e:
+            self.session_logger.warning(f"Failed to load storage states of {domains}: {e}")
+            return None
+
+        if not states:
+            return None
+
+        now = time.time()
+        merged: StorageState = {"cookies": [], "origins": []}
+
+        for state in states.values():
+            merged["cookies"].extend(
+                cookie
+                for cookie in state.get("cookies", [])
+                # -1 marks session cookies
+                if cookie.get("expires", -1) == -1 or cookie["expires"] > now
+            )
+            merged["origins"].extend(state.get("origins", []))
+
+        self.session_logger.info(f"Loaded saved storage state of {sorted(states)}")
+
+        return merged
+
+    async def save(self, context: BrowserContext, url: str) -> None:
+        """Save the cookies and localStorage of the domain of `url` from a context."""
+        domain = get_registrable_domain(url)
+
+        try:
+            state = self.filter_state(
+                cast(StorageState, await context.storage_state()), domain
+            )
+            serialized = json.dumps(state)
+
+            if not state["cookies"] and not state["origins"]:
+                return
+
+            if len(serialized) > self.max_bytes:
+                self.session_logger.info(
+                    f"Storage state of {domain} too large to save ({len(serialized)} bytes)"
+                )
+                return
+
+            await save_storage_state(domain, serialized)
+
+            self.session_logger.info(
+                f"Saved storage state of {domain} ({len(state['cookies'])} cookies)"
+            )
+
+        except Exception as e:
+            self.session_logger.warning(f"Failed to save storage state of {domain}: {e}")
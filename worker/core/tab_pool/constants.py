@@ -0,0 +1,3 @@
+# Jittered delay between two requests to the same host (seconds)
+POLITENESS_DELAY_MIN = 0.5
+POLITENESS_DELAY_MAX = 1.5
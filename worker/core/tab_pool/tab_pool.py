@@ -0,0 +1,92 @@
+import random
+import asyncio
+
+from contextlib import asynccontextmanager
+from collections import defaultdict
+from playwright.async_api import BrowserContext, Page
+from typing import Any, AsyncIterator, Callable, DefaultDict, Dict, List
+from urllib.parse import urlparse
+from worker.dependencies import CRAWL_MAX_TABS, CRAWL_MAX_TABS_PER_HOST
+from worker.core.tab_pool.constants import POLITENESS_DELAY_MIN, POLITENESS_DELAY_MAX
+
+
+class TabPool:
+    """
+    Small pool of Playwright pages sharing the scraper's browser context.
+
+    Caps the number of pages loading at once (overall and per host) and
+    spaces out requests to the same host with a jittered politeness delay.
+    A page that raised while borrowed is closed and replaced on next use.
+    """
+
+    def __init__(
+        self,
+        session_logger: Any,
+        get_context: Callable[[], BrowserContext],
+        max_tabs: int = CRAWL_MAX_TABS,
+        max_tabs_per_host: int = CRAWL_MAX_TABS_PER_HOST,
+    ):
+        self.session_logger = session_logger
+        self.get_context = get_context
+        self.max_tabs = max_tabs
+
+        self.tabs_semaphore = asyncio.Semaphore(max_tabs)
+        self.host_semaphores: DefaultDict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max_tabs_per_host)
+        )
+        self.next_request_at: Dict[str, float] = {}
+        self.idle_pages: List[Page] = []
+
+    async def wait_politeness_delay(self, host: str) -> None:
+        """Sleep until the next request slot of this host (slots are reserved before sleeping)."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        slot = max(now, self.next_request_at.get(host, now))
+        self.next_request_at[host] = slot + random.uniform(
+            POLITENESS_DELAY_MIN, POLITENESS_DELAY_MAX
+        )
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def get_page(self) -> Page:
+        """Reuse an idle page of the current context or open a new one."""
+        while self.idle_pages:
+            page = self.idle_pages.pop()
+            if not page.is_closed():
+                return page
+
+        return await self.get_context().new_page()
+
+    @asynccontextmanager
+    async def tab(self, url: str) -> AsyncIterator[Page]:
+        """Borrow a page to load `url`, honouring the overall and per-host caps."""
+        host = urlparse(url).netloc.lower()
+
+        async with self.host_semaphores[host], self.tabs_semaphore:
+            await self.wait_politeness_delay(host)
+
+            page = await self.get_page()
+            healthy = False
+
+            try:
+                yield page
+                healthy = True
+            finally:
+                if healthy and not page.is_closed():
+                    self.idle_pages.append(page)
+                else:
+                    try:
+                        await page.close()
+                    except Exception as e:
+                        self.session_logger.debug(f"Error closing failed tab: {e}")
+
+    async def close(self) -> None:
+        """Close every idle page."""
+        while self.idle_pages:
+            page = self.idle_pages.pop()
+            try:
+                await page.close()
+            except Exception:
+                pass
@@ -0,0 +1,40 @@
+import re
+
+# Tried in this order, the first verified candidate wins
+CANDIDATE_TLDS = [".ch", ".com", ".fr", ".de", ".it", ".at", ".eu", ".io", ".co", ".net", ".org"]
+
+# Legal forms and generic words dropped from the company name before building domains
+LEGAL_SUFFIXES = {
+    "ag", "sa", "sarl", "sàrl", "gmbh", "ltd", "limited", "inc", "llc", "plc",
+    "sas", "sasu", "srl", "spa", "bv", "nv", "kg", "co", "corp", "corporation",
+    "holding", "group", "groupe", "the", "company", "cie",
+}
+NAME_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+TITLE_PATTERN = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+SITE_NAME_PATTERN = re.compile(
+    r"<meta[^>]+property=[\"']og:site_name[\"'][^>]+content=[\"']([^\"']+)", re.IGNORECASE
+)
+
+# Lowercase markers of parked or for-sale domains (their title often repeats the domain name)
+PARKED_DOMAIN_MARKERS = [
+    "domain is for sale",
+    "domain may be for sale",
+    "buy this domain",
+    "this domain is parked",
+    "domain parking",
+    "parked free",
+    "parkingcrew",
+    "sedoparking",
+    "sedo.com",
+    "afternic",
+    "hugedomains",
+    "domain zu verkaufen",
+    "domaine à vendre",
+    "dominio in vendita",
+]
+
+MAX_CANDIDATES = 24
+MAX_CONCURRENT_CHECKS = 8
+DNS_TIMEOUT = 3  # seconds
+HTTP_TIMEOUT = 8  # seconds, per candidate
+MAX_HEAD_BYTES = 64 * 1024  # Enough for <title> and og:site_name
@@ -0,0 +1,210 @@
+import html
+import socket
+import asyncio
+import aiohttp
+import unicodedata
+
+from typing import Any, List, Optional, cast
+from urllib.parse import urlparse
+from worker.core.db_ops import DBOps
+from worker.dependencies import WEBSITE_CACHE_TTL_DAYS
+from worker.types.worker_types import SharedWebsite
+from worker.utils.http_utils import create_http_session
+from worker.utils.redis_commands import get_shared_cache, save_shared_cache
+from worker.core.website_resolver.constants import (
+    CANDIDATE_TLDS,
+    LEGAL_SUFFIXES,
+    NAME_TOKEN_PATTERN,
+    TITLE_PATTERN,
+    SITE_NAME_PATTERN,
+    PARKED_DOMAIN_MARKERS,
+    MAX_CANDIDATES,
+    MAX_CONCURRENT_CHECKS,
+    DNS_TIMEOUT,
+    HTTP_TIMEOUT,
+    MAX_HEAD_BYTES,
+)
+
+
+def get_name_tokens(text: str) -> List[str]:
+    """Lowercase ASCII words of a company name or page title (accents and dots removed)."""
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    ascii_text = ascii_text.replace(".", "")  # S.A. -> SA
+    return NAME_TOKEN_PATTERN.findall(ascii_text.lower())
+
+
+class WebsiteResolver:
+    """
+    Finds a company website without a search engine: domains guessed from the
+    company name (name.ch, name.com...) are checked with DNS, then HTTP, and
+    kept only if the page title or site name matches the company name.
+
+    Results are cached by normalized company name (Redis, shared by every
+    worker), and companies of the same name already in the DB are reused.
+    """
+
+    def __init__(self, session_logger: Any):
+        self.session_logger = session_logger
+        self.db_ops = DBOps(session_logger)
+
+    @staticmethod
+    def get_significant_tokens(company_name: str) -> List[str]:
+        """Words of the company name without legal forms (AG, GmbH, SA...)."""
+        tokens = get_name_tokens(company_name)
+        significant = [token for token in tokens if token not in LEGAL_SUFFIXES]
+        return significant or tokens
+
+    @staticmethod
+    def get_candidate_hosts(tokens: List[str]) -> List[str]:
+        """Domains to try, most likely first: joined words, hyphenated words, first word."""
+        slugs = ["".join(tokens)]
+        if len(tokens) > 1:
+            slugs.append("-".join(tokens))
+            if len(tokens[0]) >= 4:
+                slugs.append(tokens[0])
+
+        hosts = [slug + tld for slug in dict.fromkeys(slugs) for tld in CANDIDATE_TLDS]
+
+        return hosts[:MAX_CANDIDATES]
+
+    @staticmethod
+    async def resolves(host: str) -> bool:
+        """Check that a host has a DNS record."""
+        try:
+            await asyncio.wait_for(
+                asyncio.get_running_loop().getaddrinfo(host, 443, type=socket.SOCK_STREAM),
+                timeout=DNS_TIMEOUT,
+            )
+            return True
+        except (socket.gaierror, asyncio.TimeoutError, OSError):
+            return False
+
+    @staticmethod
+    def matches_name(tokens: List[str], page_head: str, hosts: List[str]) -> bool:
+        """
+        Check that the page title or og:site_name contains the company name as
+        whole words (or as one joined word: "AcmeCorp"). The hosts the page was
+        served from are removed from the text first, so a page only naming its
+        own domain ("acme.ch - Home") does not match, and parked domains never do.
+        """
+        lowered_head = page_head.lower()
+        if any(marker in lowered_head for marker in PARKED_DOMAIN_MARKERS):
+            return False
+
+        name = "".join(tokens)
+        host_names = {host.lower().removeprefix("www.") for host in hosts if host}
+
+        for pattern in (TITLE_PATTERN, SITE_NAME_PATTERN):
+            match = pattern.search(page_head)
+            if not match:
+                continue
+
+            text = html.unescape(match.group(1)).lower()
+            for host_name in host_names:
+                text = text.replace("www." + host_name, " ").replace(host_name, " ")
+
+            title_tokens = get_name_tokens(text)
+            if name in title_tokens or any(
+                title_tokens[i : i + len(tokens)] == tokens for i in range(len(title_tokens))
+            ):
+                return True
+
+        return False
+
+    async def verify_candidate(
+        self, session: aiohttp.ClientSession, host: str, tokens: List[str]
+    ) -> Optional[str]:
+        """Return the website (scheme and host after redirects) if the host serves the company site."""
+        for scheme in ("https", "http"):
+            url = f"{scheme}://{host}/"
+
+            try:
+                async with session.head(url, allow_redirects=True) as response:
+                    # Some servers refuse HEAD, the GET below decides for them
+                    if response.status in (404, 410) or response.status >= 500:
+                        return None
+                    final_url = str(response.url)
+
+                async with session.get(final_url, allow_redirects=True) as response:
+                    if response.status >= 400:
+                        return None
+                    final_url = str(response.url)
+                    raw = await response.content.read(MAX_HEAD_BYTES)
+                    page_head = raw.decode(response.charset or "utf-8", errors="ignore")
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeError):
+                continue
+
+            parsed = urlparse(final_url)
+            if not self.matches_name(tokens, page_head, [host, parsed.hostname or ""]):
+                return None
+
+            return f"{parsed.scheme}://{parsed.netloc}"
+
+        return None
+
+    async def get_cached_website(self, cache_key: str) -> Optional[str]:
+        """Website resolved for the same company name by any worker, or None."""
+        try:
+            cached = cast(Optional[SharedWebsite], await get_shared_cache("website", cache_key))
+        except Exception as e:
+            self.session_logger.warning(f"Failed to read cached website of {cache_key}: {e}")
+            return None
+
+        return cached["website"] if cached else None
+
+    async def cache_website(self, company_name: str, website: str) -> None:
+        """Remember the website of a company name for every worker."""
+        cache_key = " ".join(self.get_significant_tokens(company_name))
+        value: SharedWebsite = {"website": website}
+
+        try:
+            await save_shared_cache(
+                "website", cache_key, value, WEBSITE_CACHE_TTL_DAYS * 24 * 60 * 60
+            )
+        except Exception as e:
+            self.session_logger.warning(f"Failed to cache website of {cache_key}: {e}")
+
+    async def resolve(self, company_name: str, company_id: int) -> Optional[str]:
+        """Return the company website, or None if no cheap candidate verifies."""
+        tokens = self.get_significant_tokens(company_name)
+        if not tokens:
+            return None
+
+        cache_key = " ".join(tokens)
+
+        if website := await self.get_cached_website(cache_key):
+            self.session_logger.info(f"[WEBSITE] Cached website of {company_name}: {website}")
+            return website
+
+        if website := await self.db_ops.get_known_website(company_name, company_id):
+            self.session_logger.info(f"[WEBSITE] Known website of {company_name}: {website}")
+            await self.cache_website(company_name, website)
+            return website
+
+        hosts = self.get_candidate_hosts(tokens)
+        resolved = await asyncio.gather(*(self.resolves(host) for host in hosts))
+        hosts = [host for host, exists in zip(hosts, resolved) if exists]
+
+        self.session_logger.info(f"[WEBSITE] Candidates with DNS records: {hosts}")
+
+        if not hosts:
+            return None
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+
+        async def verify(host: str) -> Optional[str]:
+            async with semaphore:
+                return await self.verify_candidate(session, host, tokens)
+
+        async with create_http_session(timeout=HTTP_TIMEOUT) as session:
+            websites = await asyncio.gather(*(verify(host) for host in hosts))
+
+        # --- Candidate order decides between several verified domains
+        website = next((website for website in websites if website), None)
+
+        if website:
+            self.session_logger.info(f"[WEBSITE] Verified website of {company_name}: {website}")
+            await self.cache_website(company_name, website)
+
+        return website
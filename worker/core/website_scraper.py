@@ -4,11 +4,17 @@ import asyncio
 from typing import Optional
 from worker.base_scraper import BaseScraper
 from playwright.async_api import Browser, TimeoutError as PlaywrightTimeoutError
+from worker.core.page_processing.page_readiness import wait_for_page_ready
+from worker.core.website_resolver.website_resolver import WebsiteResolver
+from worker.dependencies import SEARCH_ERROR_SCREENSHOTS
 from urllib.parse import quote
 
 
 class WebsiteScraper(BaseScraper):
-    """Scraper that finds the company's official website via DuckDuckGo search."""
+    """
+    Scraper that finds the company's official website: domains guessed from
+    the company name first (see WebsiteResolver), DuckDuckGo search otherwise.
+    """
 
     def __init__(
         self,
@@ -18,12 +24,38 @@ class WebsiteScraper(BaseScraper):
         browser: Browser,
         language_region="ch-en",
         timeout=20000,
+        screenshots=SEARCH_ERROR_SCREENSHOTS,
     ):
         super().__init__(company_id, company_name, session_logger, browser)
         self.language_region = language_region
         self.timeout = timeout
+        self.screenshots = screenshots
+
+        self.website_resolver = WebsiteResolver(session_logger)
+
+    async def save_error_screenshot(self) -> None:
+        """Save a screenshot of the search page for debugging, if enabled."""
+        if not self.screenshots or self.page is None:
+            return
+
+        try:
+            await self.page.screenshot(path="error_search.png", full_page=True)
+        except Exception as e:
+            self.session_logger.warning(f"[{self.company_id}] Screenshot failed: {e}")
 
     async def __call__(self) -> Optional[str]:
+        """
+        Returns the company's website from the domains guessed from its name, or
+        searches DuckDuckGo and returns the first organic (non-ad) result URL.
+        """
+        website = await self.website_resolver.resolve(self.company_name, self.company_id)
+
+        if website:
+            return website
+
+        return await self.search_website()
+
+    async def search_website(self) -> Optional[str]:
         """
         Searches DuckDuckGo for the company's official website and returns the first organic (non-ad) result URL.
         """
@@ -39,7 +71,7 @@ class WebsiteScraper(BaseScraper):
 
             await self.page.goto(search_url, wait_until="load", timeout=self.timeout)
 
-            await self.page.wait_for_timeout(random.uniform(1000, 3000))
+            await wait_for_page_ready(self.page, self.session_logger)
 
             await self.page.wait_for_selector(
                 "ol.react-results--main li[data-layout='organic']", timeout=10000
@@ -64,6 +96,7 @@ class WebsiteScraper(BaseScraper):
                         self.session_logger.info(
                             f"[{self.company_id}] Found organic result: {query} -> {href}"
                         )
+                        await self.website_resolver.cache_website(self.company_name, href)
                         return href
 
             self.session_logger.warning(
@@ -77,13 +110,13 @@ class WebsiteScraper(BaseScraper):
                 f"[{self.company_id}] Timeout while searching DuckDuckGo"
             )
         
-            await self.page.screenshot(path="error_search.png", full_page=True)
+            await self.save_error_screenshot()
         
             return None
         
         except Exception as e:
             self.session_logger.error(f"[{self.company_id}] Unexpected error: {e}")
-            await self.page.screenshot(path="error_search.png", full_page=True)
+            await self.save_error_screenshot()
             return None
         
         finally:
@@ -13,6 +13,38 @@ WORKER_ID: str = os.getenv("WORKER_ID", "")
 NODE_ENV = os.getenv("NODE_ENV", "unknown")
 PREFIX_ENV = "DEV" if NODE_ENV == "development" else ""
 
+# Crawl Params
+CRAWL_MAX_TABS = int(os.getenv("CRAWL_MAX_TABS", "4"))  # Pages open at once per context
+CRAWL_MAX_TABS_PER_HOST = int(os.getenv("CRAWL_MAX_TABS_PER_HOST", "2"))
+DISCOVERY_MAX_LLM_CALLS = int(os.getenv("DISCOVERY_MAX_LLM_CALLS", "4"))  # LLM requests in flight per discovery session
+URL_VERDICT_TTL_DAYS = int(os.getenv("URL_VERDICT_TTL_DAYS", "30"))  # Discovery verdicts re-verified after
+PAGE_CACHE_MAX_MB = int(os.getenv("PAGE_CACHE_MAX_MB", "64"))  # Pages kept per discovery session
+
+# Discovery results shared by every worker (same website, same external board)
+SHARED_DISCOVERY_TTL_HOURS = int(os.getenv("SHARED_DISCOVERY_TTL_HOURS", "168"))
+SHARED_JOBS_TTL_HOURS = int(os.getenv("SHARED_JOBS_TTL_HOURS", "6"))
+
+# Website discovery
+WEBSITE_CACHE_TTL_DAYS = int(os.getenv("WEBSITE_CACHE_TTL_DAYS", "90"))  # Company name -> website
+SEARCH_ERROR_SCREENSHOTS = os.getenv("SEARCH_ERROR_SCREENSHOTS", "false").lower() == "true"
+
+# Cookies / localStorage kept per registrable domain once a consent wall is handled
+STORAGE_STATE_TTL_DAYS = int(os.getenv("STORAGE_STATE_TTL_DAYS", "14"))
+STORAGE_STATE_MAX_KB = int(os.getenv("STORAGE_STATE_MAX_KB", "256"))
+
+# Third-party scripts allowed per site, learned on a first visit
+SCRIPT_ALLOWLIST_TTL_DAYS = int(os.getenv("SCRIPT_ALLOWLIST_TTL_DAYS", "30"))
+
+# HTML parser backend of BeautifulSoup: "lxml" (default) or "html.parser" (pure Python)
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "lxml")
+
+# Processes forked at startup for HTML parsing (0: parse in threads of the worker process)
+CPU_PROCESS_WORKERS = int(os.getenv("CPU_PROCESS_WORKERS", "2"))
+
+# Random pause added once a page is ready, to keep a human-like rhythm (milliseconds)
+STEALTH_JITTER_MIN_MS = int(os.getenv("STEALTH_JITTER_MIN_MS", "300"))
+STEALTH_JITTER_MAX_MS = int(os.getenv("STEALTH_JITTER_MAX_MS", "900"))
+
 # LLM Params
 LLM_MODEL: str = os.getenv("LLM_MODEL", "")
 LLM_API_KEY: str = os.getenv("LLM_API_KEY", "")
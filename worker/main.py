@@ -16,6 +16,7 @@ from worker.session_processing import (
 )
 from worker.utils.redis_commands import get_session_status
 from worker.utils.logging_utils import get_session_logger
+from worker.core.cpu_executor.cpu_executor import cpu_executor
 from playwright_stealth import Stealth  # type: ignore
 from worker.dependencies import (
     init_postgres_pool,
@@ -228,6 +229,9 @@ async def consume_messages():
 async def main():
     """Global async entrypoint: launch stealth-enabled browser once."""
 
+    # Forked before the pools and browser start their threads
+    cpu_executor.start()
+
     await init_postgres_pool()
     logger.info("PostgreSQL pool ready")
 
@@ -250,6 +254,8 @@ async def main():
                 await worker_state.browser.close()
             
             await close_postgres_pool()
+
+            cpu_executor.shutdown()
             
             await p.stop()
 
@@ -1,4 +1,4 @@
-from typing import TypedDict, Literal, Optional, List, Dict, NotRequired, Required
+from typing import TypedDict, Literal, Optional, List, Dict, NotRequired, Required, Tuple
 from pydantic import BaseModel, Field
 
 class PayloadSession(TypedDict):
@@ -66,6 +66,95 @@ class JobListingsResult(TypedDict):
     current_job_offers: set[str]
     
 
+class SitemapCandidate(TypedDict):
+    """Represents a career page candidate found in a site's sitemaps."""
+    url: str
+    score: float
+    lastmod: Optional[str]
+
+class PageValidators(TypedDict):
+    """HTTP validators and content fingerprint of a server-rendered job listing page."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fingerprint: Optional[str]  # Hash of the structured text of the static HTML
+
+class ListingPageState(TypedDict):
+    """Represents what was extracted from a job listing page during the last run."""
+    lastmod: Optional[str]
+    jobs: List[List[str]]  # [job_title, job_url] pairs
+    validators: NotRequired[Optional[PageValidators]]
+
+class UrlVerdict(TypedDict):
+    """Represents what career page discovery concluded about a URL of a company."""
+    verdict: Literal["career_candidate", "non_career", "listing", "non_listing"]
+    source: str  # Discovery step: filter_<scope> or identify
+    checked_at: float  # Unix timestamp
+
+class SharedExternalRoot(TypedDict):
+    """Represents the shared discovery result of an external career site (keyed by root URL)."""
+    job_listing_pages: List[str]
+
+class SharedDomainDiscovery(TypedDict):
+    """Represents the shared discovery result of a company website (keyed by site)."""
+    company_id: int  # Company whose session made the discovery
+    internal_job_listing_pages: List[str]
+    external_job_listing_pages: List[str]
+    emails: List[str]
+
+class SharedListingJobs(TypedDict):
+    """Represents the jobs last extracted from an external job listing page."""
+    jobs: List[List[str]]  # [job_title, job_url] pairs
+
+class SharedWebsite(TypedDict):
+    """Represents the website resolved for a company name (keyed by normalized name)."""
+    website: str
+
+class StorageState(TypedDict):
+    """Represents cookies and localStorage of a browser context (Playwright storage_state format)."""
+    cookies: List[Dict]
+    origins: List[Dict]  # {"origin": ..., "localStorage": [{"name": ..., "value": ...}]}
+
+class ScriptAllowlistPolicy(TypedDict):
+    """Represents the third-party script origins a site's job listing pages need (keyed by site)."""
+    allowed_origins: List[str]
+    baseline_jobs: Dict[str, int]  # Jobs first extracted per job listing page, later runs are compared to it
+    learned_at: float  # Unix timestamp
+
+class CachedPage(TypedDict):
+    """Represents a page loaded during a discovery session, as cached for the later steps."""
+    final_url: str  # After redirects
+    status: Optional[int]
+    html: str
+    structured_text: Optional[str]  # Computed on first use
+
+class PageLinks(TypedDict):
+    """Represents what a crawl reads from a page, parsed in a CPU worker process."""
+    emails: List[str]
+    iframe_srcs: List[str]
+    anchors: List[Tuple[str, str, bool]]  # (href, text, inside header / footer / nav)
+
+class JobArrayKeys(TypedDict):
+    """Represents which keys of the job-like objects of a JSON array hold each Job field."""
+    title: str
+    url: str
+    location: Optional[str]
+    contract: Optional[str]
+    description: Optional[str]
+
+class ApiPagination(TypedDict):
+    """Represents the page / offset parameter of a captured job listing API request."""
+    kind: Literal["page", "offset"]
+    location: Literal["query", "body"]
+    param: str
+    value: int
+
+class AtsBoard(TypedDict):
+    """Represents a hosted ATS job board detected from a job listing page."""
+    ats: str
+    token: str  # Board / company identifier on the ATS
+    host: str
+    site: NotRequired[Optional[str]]  # Workday career site
+
 class Job(TypedDict):
     """Represents a structured job entry with metadata and embeddings."""
     job_title: str
@@ -0,0 +1,46 @@
+import random
+import aiohttp
+
+from typing import Dict, Optional, Tuple
+from worker.constants import USER_AGENTS
+
+
+def create_http_session(timeout: int = 30) -> aiohttp.ClientSession:
+    """Create an aiohttp session with a browser-like user agent and a per-request timeout (seconds)."""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers={"User-Agent": random.choice(USER_AGENTS)},
+    )
+
+
+async def fetch_conditional(
+    session: aiohttp.ClientSession,
+    url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    max_bytes: int = 5 * 1024 * 1024,
+) -> Tuple[int, Optional[str], Optional[str], Optional[str]]:
+    """
+    Conditional GET (If-None-Match / If-Modified-Since) of a URL.
+
+    Returns:
+        (status, body, etag, last_modified): body is None unless the status is 200.
+    """
+    headers: Dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    async with session.get(url, headers=headers, allow_redirects=True) as response:
+        body: Optional[str] = None
+        if response.status == 200:
+            raw = await response.content.read(max_bytes)
+            body = raw.decode(response.charset or "utf-8", errors="ignore")
+
+        return (
+            response.status,
+            body,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
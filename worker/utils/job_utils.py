@@ -0,0 +1,88 @@
+import re
+
+from html import unescape
+from typing import Optional, Tuple
+from worker.core.post_process_jobs.constants import COUNTRY_REGION_DATA
+from worker.core.page_processing.html_parser import get_html_text
+
+# First match wins: more specific contract types are checked before generic ones
+CONTRACT_TYPE_PATTERNS = [
+    ("apprenticeship", r"apprentice\w*|ausbildung|lehrstelle|alternance|apprentissage"),
+    ("internship", r"intern|internship|praktikum|stage|stagiaire|pr[aá]cticas|tirocinio"),
+    ("graduate_program", r"graduate|trainee|new grad"),
+    ("part_time", r"part ?time|parttime|teilzeit|temps partiel|werkstudent|working student"),
+    (
+        "short_term",
+        r"temporary|temp|fixed ?term|befristet|cdd|seasonal|per diem",
+    ),
+    (
+        "full_time",
+        r"full ?time|fulltime|permanent|vollzeit|festanstellung|unbefristet|cdi|temps plein|regular",
+    ),
+    ("freelance", r"freelance\w*|contractor|contract|self employed|consultant"),
+    ("remote", r"remote|telecommute|home office"),
+]
+
+COMPILED_CONTRACT_TYPE_PATTERNS = [
+    (contract_type, re.compile(rf"\b(?:{pattern})\b"))
+    for contract_type, pattern in CONTRACT_TYPE_PATTERNS
+]
+
+COUNTRY_NAMES_BY_CODE = {
+    country["countryShortCode"].lower(): country["countryName"]
+    for country in COUNTRY_REGION_DATA
+}
+
+
+def normalize_contract_type(value: Optional[str]) -> Optional[str]:
+    """Map a free-text employment type (ATS, schema.org...) to a JobLLMExtracted contract_type."""
+    if not value or not isinstance(value, str):
+        return None
+
+    normalized = re.sub(r"[_\-/]+", " ", value.lower())
+
+    for contract_type, pattern in COMPILED_CONTRACT_TYPE_PATTERNS:
+        if pattern.search(normalized):
+            return contract_type
+
+    return None
+
+
+def html_to_text(html_content: Optional[str]) -> Optional[str]:
+    """Convert an HTML fragment (possibly entity-escaped) to plain text, one block per line."""
+    if not html_content:
+        return None
+
+    if "&lt;" in html_content:
+        html_content = unescape(html_content)
+
+    text = get_html_text(html_content, separator="\n", strip=True)
+
+    return text or None
+
+
+def split_location(location: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Split a "City, Region, Country" style location into (country, region) candidates.
+    The values are raw hints, matched later against COUNTRY_REGION_DATA.
+    """
+    if not location or not isinstance(location, str):
+        return None, None
+
+    parts = [p.strip() for p in location.split(",") if p.strip()]
+
+    if not parts:
+        return None, None
+
+    country = country_name_from_code(parts[-1]) or parts[-1]
+    region = parts[-2] if len(parts) >= 3 else None
+
+    return country, region
+
+
+def country_name_from_code(code: Optional[str]) -> Optional[str]:
+    """Return the country name for an ISO 3166 alpha-2 code, or None."""
+    if not code or not isinstance(code, str) or len(code.strip()) != 2:
+        return None
+
+    return COUNTRY_NAMES_BY_CODE.get(code.strip().lower())
@@ -0,0 +1,55 @@
+import re
+
+from typing import Dict, Iterable, Optional
+
+
+class KeywordMatcher:
+    """
+    Checks whether a text contains any of a set of keywords in one scan.
+
+    The keywords are compiled once into a trie-shaped regex (shared prefixes
+    factored out, like an Aho-Corasick automaton), so the C regex engine tries
+    one branch per character instead of Python testing `kw in text` for every
+    keyword. A keyword that extends a shorter one (e.g. "pagination" and "pag")
+    is dropped from the trie: the shorter one already matches.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = [keyword for keyword in dict.fromkeys(keywords) if keyword]
+
+        trie: Dict[str, dict] = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}  # End of a keyword
+
+        pattern = self.build_pattern(trie)
+        self.pattern = re.compile(pattern) if pattern else None
+
+    @classmethod
+    def build_pattern(cls, node: Dict[str, dict]) -> Optional[str]:
+        """Regex of the keywords below a trie node, "" once a keyword ends, None for an empty trie."""
+        if "" in node:
+            return ""
+
+        chars = []
+        branches = []
+        for char in sorted(node):
+            rest = cls.build_pattern(node[char])
+            if rest:
+                branches.append(re.escape(char) + rest)
+            else:
+                chars.append(re.escape(char))
+
+        if chars:
+            branches.append(chars[0] if len(chars) == 1 else f"[{''.join(chars)}]")
+
+        if not branches:
+            return None
+
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    def matches(self, text: str) -> bool:
+        """Return True if any keyword is a substring of the text."""
+        return self.pattern is not None and self.pattern.search(text) is not None
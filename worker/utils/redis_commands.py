@@ -1,6 +1,23 @@
-from typing import cast
-from worker.dependencies import redis_client
-from worker.types.worker_types import SessionStatus
+import json
+import time
+import uuid
+
+from typing import Any, Mapping, Optional, cast
+from worker.dependencies import redis_client, URL_VERDICT_TTL_DAYS, STORAGE_STATE_TTL_DAYS
+from worker.types.worker_types import SessionStatus, ListingPageState, UrlVerdict, StorageState
+
+LISTING_PAGES_STATE_TTL = 60 * 60 * 24 * 30  # 30 days
+URL_VERDICT_TTL = 60 * 60 * 24 * URL_VERDICT_TTL_DAYS
+SHARED_LOCK_TTL = 60 * 15  # 15 minutes, released earlier by its owner
+STORAGE_STATE_TTL = 60 * 60 * 24 * STORAGE_STATE_TTL_DAYS
+
+# Deletes a lock only if it still holds the owner's token (it may have expired and been retaken)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
 async def get_session_status(session_key: str) -> SessionStatus:
     """Retrieve session status and retry count from Redis."""
@@ -15,3 +32,125 @@ async def get_session_status(session_key: str) -> SessionStatus:
 async def mark_session_status(session_key: str, status: str, retries: int = 0) -> None:
     """Update session status in Redis."""
     await redis_client.hset(session_key, mapping={"status": status, "retries": retries})
+
+
+async def get_listing_pages_state(company_id: int) -> dict[str, ListingPageState]:
+    """Retrieve, per job listing page, what was extracted during the last run."""
+    raw_state = await redis_client.hgetall(f"listing_pages:{company_id}")
+
+    state: dict[str, ListingPageState] = {}
+    for url, value in raw_state.items():
+        try:
+            state[url] = json.loads(value)
+        except json.JSONDecodeError:
+            continue
+
+    return state
+
+
+async def save_listing_pages_state(
+    company_id: int, state: dict[str, ListingPageState]
+) -> None:
+    """Replace the per job listing page state of a company in Redis."""
+    key = f"listing_pages:{company_id}"
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(key)
+        if state:
+            pipe.hset(key, mapping={url: json.dumps(value) for url, value in state.items()})
+            pipe.expire(key, LISTING_PAGES_STATE_TTL)
+        await pipe.execute()
+
+
+async def get_url_verdicts(company_id: int) -> dict[str, UrlVerdict]:
+    """Retrieve the career page discovery verdicts of a company that are not expired yet."""
+    raw_verdicts = await redis_client.hgetall(f"url_verdicts:{company_id}")
+
+    oldest = time.time() - URL_VERDICT_TTL
+
+    verdicts: dict[str, UrlVerdict] = {}
+    for url, value in raw_verdicts.items():
+        try:
+            verdict = json.loads(value)
+        except json.JSONDecodeError:
+            continue
+        if verdict.get("checked_at", 0) >= oldest:
+            verdicts[url] = verdict
+
+    return verdicts
+
+
+async def save_url_verdicts(company_id: int, verdicts: dict[str, UrlVerdict]) -> None:
+    """Merge new career page discovery verdicts of a company into Redis."""
+    if not verdicts:
+        return
+
+    key = f"url_verdicts:{company_id}"
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping={url: json.dumps(value) for url, value in verdicts.items()})
+        pipe.expire(key, URL_VERDICT_TTL)
+        await pipe.execute()
+
+
+async def get_shared_cache(namespace: str, key: str) -> Optional[Any]:
+    """Retrieve a value shared by every worker (e.g. discovery results of an external board)."""
+    value = await redis_client.get(f"shared:{namespace}:{key}")
+    if not value:
+        return None
+
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return None
+
+
+async def save_shared_cache(
+    namespace: str, key: str, value: Mapping[str, Any], ttl: int
+) -> None:
+    """Share a value with every worker for `ttl` seconds."""
+    await redis_client.set(f"shared:{namespace}:{key}", json.dumps(value), ex=ttl)
+
+
+async def delete_shared_cache(namespace: str, key: str) -> None:
+    """Remove a value shared with every worker."""
+    await redis_client.delete(f"shared:{namespace}:{key}")
+
+
+async def acquire_shared_lock(namespace: str, key: str, ttl: int = SHARED_LOCK_TTL) -> Optional[str]:
+    """Try to become the only worker computing a shared value. Returns the owner token if acquired."""
+    token = uuid.uuid4().hex
+
+    if await redis_client.set(f"lock:{namespace}:{key}", token, nx=True, ex=ttl):
+        return token
+
+    return None
+
+
+async def release_shared_lock(namespace: str, key: str, token: str) -> None:
+    """Release a lock taken with acquire_shared_lock, unless another worker holds it by now."""
+    await redis_client.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{namespace}:{key}", token)
+
+
+async def get_storage_states(domains: list[str]) -> dict[str, StorageState]:
+    """Retrieve the saved browser storage states of registrable domains (missing ones omitted)."""
+    if not domains:
+        return {}
+
+    values = await redis_client.mget([f"storage_state:{domain}" for domain in domains])
+
+    states: dict[str, StorageState] = {}
+    for domain, value in zip(domains, values):
+        if not value:
+            continue
+        try:
+            states[domain] = json.loads(value)
+        except json.JSONDecodeError:
+            continue
+
+    return states
+
+
+async def save_storage_state(domain: str, state: str) -> None:
+    """Save the serialized browser storage state of a registrable domain."""
+    await redis_client.set(f"storage_state:{domain}", state, ex=STORAGE_STATE_TTL)
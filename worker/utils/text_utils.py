@@ -3,8 +3,12 @@ import hashlib
 
 from bs4 import BeautifulSoup, Tag
 from worker.types.worker_types import Job
-from typing import List, Optional
-from worker.utils.url_utils import normalize_url
+from typing import List, Optional, Tuple
+from worker.utils.url_utils import UrlResolver
+from worker.core.page_processing.html_parser import get_html_text
+
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+LINK_CONTAINER_TAGS = HEADING_TAGS | {"p", "ul", "li", "table"}
 
 def get_emails(text: str) -> set[str]:
     """Extracts and filters valid emails from the given text."""
@@ -41,6 +45,138 @@ def get_emails(text: str) -> set[str]:
 
     return valid_emails
 
+class LinkedElement:
+    """An element read by the structured text extractors, with the URL of its first link."""
+
+    __slots__ = ("tag", "has_link", "link", "text")
+
+    def __init__(self, tag: Tag):
+        self.tag = tag
+        self.has_link = False  # True once an <a href> is found inside
+        self.link: Optional[str] = ""
+        self.text: Optional[str] = None
+
+    def get_text(self) -> str:
+        """Stripped text of the element (computed once)."""
+        if self.text is None:
+            self.text = self.tag.get_text(strip=True)
+        return self.text
+
+
+class StructuredElements:
+    """
+    Elements of a page read by the structured text extractors, collected in a
+    single DOM walk (document order): headings, paragraphs, list items of each
+    <ul>, cells of each table row, and links outside of those containers.
+    Each href is resolved once against the page URL.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.resolver = UrlResolver(url)
+
+        self.headings: List[LinkedElement] = []
+        self.paragraphs: List[LinkedElement] = []
+        self.lists: List[List[LinkedElement]] = []  # <li> of each <ul>, nested ones included
+        self.tables: List[List[List[LinkedElement]]] = []  # <td>/<th> of each <tr> of each <table>
+        self.anchors: List[Tag] = []  # <a href> outside headings, paragraphs, lists and tables
+        self.seen_links: set[Optional[str]] = set()  # Links of the elements above
+
+    @classmethod
+    def collect(cls, soup: BeautifulSoup, url: str) -> "StructuredElements":
+        """Walk the soup once, matching each element with the first link inside it."""
+        elements = cls(url)
+
+        path: List[Tuple[Tag, Optional[LinkedElement]]] = []  # Open tags, root first
+        pending: List[LinkedElement] = []  # Open elements without a link yet
+        open_lists: List[List[LinkedElement]] = []
+        open_tables: List[List[List[LinkedElement]]] = []
+        open_rows: List[List[LinkedElement]] = []
+        containers = 0  # Open headings, paragraphs, lists and tables
+
+        def close(tag: Tag, element: Optional[LinkedElement]) -> None:
+            nonlocal containers
+
+            if tag.name in LINK_CONTAINER_TAGS:
+                containers -= 1
+            if tag.name == "ul":
+                open_lists.pop()
+            elif tag.name == "table":
+                open_tables.pop()
+            elif tag.name == "tr":
+                open_rows.pop()
+
+            if element is not None and pending and pending[-1] is element:
+                pending.pop()
+
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+
+            while path and path[-1][0] is not node.parent:
+                close(*path.pop())
+
+            name = node.name
+            element = None
+
+            if name == "a" and node.has_attr("href"):
+                if pending:
+                    link = elements.resolver.resolve(str(node["href"]))
+                    for linked in pending:
+                        linked.has_link, linked.link = True, link
+                    pending.clear()
+
+                if not containers:
+                    elements.anchors.append(node)
+
+            elif name in HEADING_TAGS or name == "p":
+                element = LinkedElement(node)
+                (elements.paragraphs if name == "p" else elements.headings).append(element)
+
+            elif name == "li":
+                element = LinkedElement(node)
+                for items in open_lists:
+                    items.append(element)
+
+            elif name in ("td", "th"):
+                element = LinkedElement(node)
+                for cells in open_rows:
+                    cells.append(element)
+
+            elif name == "ul":
+                elements.lists.append([])
+                open_lists.append(elements.lists[-1])
+
+            elif name == "table":
+                elements.tables.append([])
+                open_tables.append(elements.tables[-1])
+
+            elif name == "tr":
+                open_rows.append([])
+                for rows in open_tables:
+                    rows.append(open_rows[-1])
+
+            if element is not None:
+                pending.append(element)
+            if name in LINK_CONTAINER_TAGS:
+                containers += 1
+
+            path.append((node, element))
+
+        while path:
+            close(*path.pop())
+
+        # --- Links of headings, paragraphs, list items (in a <ul>) and cells (in a table row)
+        items = [li for ul in elements.lists for li in ul]
+        cells = [td for table in elements.tables for row in table for td in row]
+
+        for linked in elements.headings + elements.paragraphs + items + cells:
+            if linked.has_link:
+                elements.seen_links.add(linked.link)
+
+        return elements
+
+
 def extract_structured_text(
     soup: BeautifulSoup,
     url: str,
@@ -61,9 +197,9 @@ def extract_structured_text(
     """
 
     structured_content = []
-    seen_links = set()
+    elements = StructuredElements.collect(soup, url)
 
-    verified_existing_jobs = [job["job_url"] for job in job_offers]
+    verified_existing_jobs = {job["job_url"] for job in job_offers}
 
     def handle_link(link: Optional[str], text: str):
         """Decide whether to include a link based on known jobs."""
@@ -73,66 +209,39 @@ def extract_structured_text(
             return None
         return text
 
-    def get_associated_link(element):
-        """Finds the nearest anchor link within or related to the element."""
-        link = element.find("a", href=True)
-        if link:
-            link = normalize_url(url, link["href"])
-            seen_links.add(link)
-            return link
-        return ""
-
-    for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-        link = get_associated_link(heading)
-        if link:
-            text = f"\n### {heading.get_text(strip=True)} ({link}) ###"
-            result = handle_link(link, text)
+    for heading in elements.headings:
+        if heading.link:
+            text = f"\n### {heading.get_text()} ({heading.link}) ###"
+            result = handle_link(heading.link, text)
             if result:
                 structured_content.append(result)
 
-    for paragraph in soup.find_all("p"):
-        link = get_associated_link(paragraph)
-        if link:
-            text = f"- {paragraph.get_text(strip=True)} ({link})"
-            result = handle_link(link, text)
+    for paragraph in elements.paragraphs:
+        if paragraph.link:
+            text = f"- {paragraph.get_text()} ({paragraph.link})"
+            result = handle_link(paragraph.link, text)
             if result:
                 structured_content.append(result)
 
-    for ul in soup.find_all("ul"):
-        if not isinstance(ul, Tag):
-            continue
+    for ul in elements.lists:
         items = []
-        for li in ul.find_all("li"):
-            if not isinstance(li, Tag):
-                continue
-            link = li.find("a", href=True)
-            if isinstance(link, Tag) and link.has_attr("href"):
-                link = normalize_url(url, str(link["href"]))
-                seen_links.add(link)
-                text = f"  • {li.get_text(strip=True)} ({link})"
-                result = handle_link(link, text)
+        for li in ul:
+            if li.has_link:
+                text = f"  • {li.get_text()} ({li.link})"
+                result = handle_link(li.link, text)
                 if result:
                     items.append(result)
         if items:
             structured_content.append("\n".join(items))
 
-    for table in soup.find_all("table"):
-        if not isinstance(table, Tag):
-            continue
+    for table in elements.tables:
         table_data = []
-        for row in table.find_all("tr"):
-            if not isinstance(row, Tag):
-                continue
+        for row in table:
             cells = []
-            for td in row.find_all(["td", "th"]):
-                if not isinstance(td, Tag):
-                    continue
-                link = td.find("a", href=True)
-                if isinstance(link, Tag) and link.has_attr("href"):
-                    link = normalize_url(url, str(link["href"]))
-                    seen_links.add(link)
-                    text = f"{td.get_text(strip=True)} ({link})"
-                    result = handle_link(link, text)
+            for td in row:
+                if td.has_link:
+                    text = f"{td.get_text()} ({td.link})"
+                    result = handle_link(td.link, text)
                     if result:
                         cells.append(result)
             if cells:
@@ -141,21 +250,14 @@ def extract_structured_text(
             structured_content.append("\n".join(table_data))
 
     links = []
-    for a in soup.find_all("a", href=True):
-        if not isinstance(a, Tag):
-            continue
+    for a in elements.anchors:
         href = a.get("href")
         if not isinstance(href, str):
             continue
         if href.startswith("mailto:"):
             continue
-        link = normalize_url(url, href)
-        if (
-            not a.find_parent(
-                ["h1", "h2", "h3", "h4", "h5", "h6", "p", "ul", "li", "table"]
-            )
-            and link not in seen_links
-        ):
+        link = elements.resolver.resolve(href)
+        if link not in elements.seen_links:
             text = f"- [{a.get_text(strip=True)}]({link})"
             result = handle_link(link, text)
             if result:
@@ -182,20 +284,11 @@ def extract_structured_text_chunks(
         """
 
         structured_content = []
-        seen_links = set()
-        verified_existing_jobs = [job["job_url"] for job in job_offers]
+        elements = StructuredElements.collect(soup, url)
+        verified_existing_jobs = {job["job_url"] for job in job_offers}
 
         MAX_ITEMS_PER_BLOCK = 15
 
-        def get_associated_link(element):
-            """Finds the nearest anchor link within or related to the element."""
-            link = element.find("a", href=True)
-            if link:
-                link = normalize_url(url, link["href"])
-                seen_links.add(link)
-                return link
-            return ""
-
         def handle_link(link: Optional[str], text: str):
             """Decide whether to include in structured_content or verified_existing_jobs."""
             if link in verified_existing_jobs:
@@ -204,11 +297,9 @@ def extract_structured_text_chunks(
 
         # --- Headings (batch individually, each heading is its own block) ---
         headings = []
-        for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-            link = get_associated_link(heading)
-            text = (
-                f"### {heading.get_text(strip=True)}{f' ({link})' if link else ''} ###"
-            )
+        for heading in elements.headings:
+            link = heading.link
+            text = f"### {heading.get_text()}{f' ({link})' if link else ''} ###"
             result = handle_link(link, text)
             if result:
                 headings.append(result)
@@ -217,9 +308,9 @@ def extract_structured_text_chunks(
 
         # --- Paragraphs ---
         paragraphs = []
-        for paragraph in soup.find_all("p"):
-            link = get_associated_link(paragraph)
-            text = f"- {paragraph.get_text(strip=True)}{f' ({link})' if link else ''}"
+        for paragraph in elements.paragraphs:
+            link = paragraph.link
+            text = f"- {paragraph.get_text()}{f' ({link})' if link else ''}"
             result = handle_link(link, text)
             if result:
                 paragraphs.append(result)
@@ -229,19 +320,12 @@ def extract_structured_text_chunks(
             )
 
         # --- Lists (UL/LI) ---
-        for ul in soup.find_all("ul"):
-            if not isinstance(ul, Tag):
-                continue
+        for ul in elements.lists:
             items = []
-            for li in ul.find_all("li"):
-                if not isinstance(li, Tag):
-                    continue
-                link_el = li.find("a", href=True)
-                if isinstance(link_el, Tag) and link_el.has_attr("href"):
-                    link = normalize_url(url, str(link_el["href"]))
-                    seen_links.add(link)
-                    text = f"  • {li.get_text(strip=True)} ({link})"
-                    result = handle_link(link, text)
+            for li in ul:
+                if li.has_link:
+                    text = f"  • {li.get_text()} ({li.link})"
+                    result = handle_link(li.link, text)
                     if result:
                         items.append(result)
             for i in range(0, len(items), MAX_ITEMS_PER_BLOCK):
@@ -249,22 +333,13 @@ def extract_structured_text_chunks(
 
         # --- Tables ---
         table_rows = []
-        for table in soup.find_all("table"):
-            if not isinstance(table, Tag):
-                continue
-            for row in table.find_all("tr"):
-                if not isinstance(row, Tag):
-                    continue
+        for table in elements.tables:
+            for row in table:
                 cells = []
-                for td in row.find_all(["td", "th"]):
-                    if not isinstance(td, Tag):
-                        continue
-                    link_el = td.find("a", href=True)
-                    if isinstance(link_el, Tag) and link_el.has_attr("href"):
-                        link = normalize_url(url, str(link_el["href"]))
-                        seen_links.add(link)
-                        text = f"{td.get_text(strip=True)} ({link})"
-                        result = handle_link(link, text)
+                for td in row:
+                    if td.has_link:
+                        text = f"{td.get_text()} ({td.link})"
+                        result = handle_link(td.link, text)
                         if result:
                             cells.append(result)
                 if cells:
@@ -276,22 +351,16 @@ def extract_structured_text_chunks(
 
         # --- Orphan links ---
         links = []
-        for a in soup.find_all("a", href=True):
-            if isinstance(a, Tag):
-                href = str(a.get("href"))
-                if href.startswith("mailto:"):
-                    continue
-                link = normalize_url(url, href)
-                if (
-                    not a.find_parent(
-                        ["h1", "h2", "h3", "h4", "h5", "h6", "p", "ul", "li", "table"]
-                    )
-                    and link not in seen_links
-                ):
-                    text = f"- [{a.get_text(strip=True)}]({link})"
-                    result = handle_link(link, text)
-                    if result:
-                        links.append(result)
+        for a in elements.anchors:
+            href = str(a.get("href"))
+            if href.startswith("mailto:"):
+                continue
+            link = elements.resolver.resolve(href)
+            if link not in elements.seen_links:
+                text = f"- [{a.get_text(strip=True)}]({link})"
+                result = handle_link(link, text)
+                if result:
+                    links.append(result)
         for i in range(0, len(links), MAX_ITEMS_PER_BLOCK):
             link_block = links[i : i + MAX_ITEMS_PER_BLOCK]
             structured_content.append("\n### Links ###\n" + "\n".join(link_block))
@@ -323,10 +392,4 @@ def hash_page_content(text_content: str) -> str:
 
 def extract_visible_text(html: str) -> str:
     
-    soup = BeautifulSoup(html, "html.parser")
-    
-    for script in soup(["script", "style", "meta", "noscript", "svg"]):
-    
-        script.decompose()
-    
-    return soup.get_text(separator=" ")
+    return get_html_text(html, ["script", "style", "meta", "noscript", "svg"], separator=" ")
@@ -0,0 +1,77 @@
+"""
+Time to resolve every href of a page with normalize_url (base URL parsed per
+href) and with a UrlResolver bound to the page URL.
+
+    python -m worker.utils.url_benchmark [page.html page_url ...]
+
+Without files, a synthetic career page (6000 links, duplicates included) is used.
+Identical results are checked by worker.utils.url_resolver_check.
+"""
+
+import sys
+import time
+
+from bs4 import Tag
+from typing import Callable, List, Optional, Tuple
+from worker.utils.url_utils import UrlResolver, normalize_url
+from worker.core.page_processing.html_parser import parse_html
+
+RUNS = 5
+
+
+def build_career_page(jobs_count: int = 2000) -> str:
+    """Synthetic job listing page: relative, absolute and repeated links per card."""
+    cards = "".join(
+        f'<li><a href="jobs/results/{i}-software-engineer">Software Engineer {i}</a>'
+        f'<a href="/careers/teams/engineering?ref=card">Engineering</a>'
+        f'<a href="https://apply.example.com/jobs/{i}#apply">Apply</a></li>'
+        for i in range(jobs_count)
+    )
+    return f"<html><body><ul>{cards}</ul></body></html>"
+
+
+def get_hrefs(html: str) -> List[str]:
+    """Raw hrefs of the links of a page."""
+    return [
+        str(link["href"])
+        for link in parse_html(html).find_all("a", href=True)
+        if isinstance(link, Tag)
+    ]
+
+
+def resolve_all(resolver: UrlResolver, hrefs: List[str]) -> List[Optional[str]]:
+    """Resolve every href of a page with one resolver."""
+    return [resolver.resolve(href) for href in hrefs]
+
+
+def time_per_run(func: Callable[[], object]) -> float:
+    """Best time of RUNS calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(args: List[str]) -> None:
+    pages: List[Tuple[str, str]] = [
+        (open(path, encoding="utf-8", errors="ignore").read(), url)
+        for path, url in zip(args[::2], args[1::2])
+    ]
+    pages = pages or [(build_career_page(), "https://example.com/jobs/results")]
+
+    for html, url in pages:
+        hrefs = get_hrefs(html)
+
+        per_href_ms = time_per_run(lambda: [normalize_url(url, href) for href in hrefs])
+        # A fresh resolver per run, so its cache starts empty like on a new page
+        resolver_ms = time_per_run(lambda: resolve_all(UrlResolver(url), hrefs))
+
+        print(f"{url}: {len(hrefs)} links ({len(set(hrefs))} unique)")
+        print(f"  normalize_url {per_href_ms:8.1f} ms")
+        print(f"  UrlResolver   {resolver_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,177 @@
+"""
+Check that UrlResolver (and normalize_url, built on it) resolves hrefs like
+the per-href algorithm it replaced, without network.
+
+    python -m worker.utils.url_resolver_check [--cases N] [--seed S]
+
+Hand-picked base/href pairs and random ones are resolved with one shared
+resolver per base (resolved twice, so cached results are checked too) and
+with normalize_url, with and without keep_query. Exits with status 1 on any
+difference.
+"""
+
+import re
+import sys
+import random
+import argparse
+
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlunparse
+from worker.utils.url_utils import UrlResolver, normalize_url
+
+DEFAULT_CASES = 50000
+DEFAULT_SEED = 0
+MAX_REPORTED = 20
+
+# Pages whose hrefs hit the edge cases: SPA prefix stripping, files, queries, ports
+KNOWN_CASES: List[Tuple[str, str]] = [
+    ("https://example.com/jobs/results", "jobs/results/123-software-engineer"),
+    ("https://example.com/jobs/results/", "results/123"),
+    ("https://example.com/jobs/results?page=2", "?page=3"),
+    ("https://example.com/careers/index.html", "job.html?id=4"),
+    ("https://example.com/careers", "../about/"),
+    ("https://example.com/careers", "./apply"),
+    ("https://example.com/careers", "//cdn.example.com/jobs/1"),
+    ("https://example.com/careers", ".//jobs/2"),
+    ("https://example.com/careers?lang=de", "jobs?id=5#apply"),
+    ("https://example.com:8443/a/b", "/c/d/"),
+    ("https://example.com", "/"),
+    ("https://example.com", "#top"),
+    ("https://example.com/a", "mailto:jobs@example.com"),
+    ("https://example.com/a", "tel:+41000000"),
+    ("https://example.com/a", "javascript:void(0)"),
+    ("https://example.com/a", "   "),
+    ("https://example.com/a", ""),
+    ("https://example.com/a", "https://other.example.org/jobs/1/"),
+    ("http://example.com/en/jobs", "en/jobs"),
+    ("http://example.com/en/jobs", "jobs/en/jobs/1"),
+]
+
+HOSTS = ["example.com", "jobs.example.ch", "careers.example.org:8080"]
+SEGMENTS = ["jobs", "results", "careers", "en", "de", "..", ".", "job.html", "123", "a b", "ä", ""]
+QUERIES = ["", "?page=2", "?lang=en&ref=x", "?q=a/b"]
+FRAGMENTS = ["", "#apply", "#/jobs/1"]
+HREF_PREFIXES = ["", "/", "./", "//", ".//", "../", "?", "#", " ", "https://", "mailto:"]
+
+
+def reference_normalize_url(base: str, href: str, keep_query: bool = False) -> Optional[str]:
+    """normalize_url as it was before UrlResolver: the base is parsed for every href."""
+    if not href:
+        return None
+
+    href = href.strip()
+    if not href:
+        return None
+
+    if href.startswith(("mailto:", "tel:", "javascript:", "data:")):
+        return href
+
+    parsed = urlparse(base)
+    path = parsed.path or "/"
+
+    if not path.endswith("/") and "." not in path.split("/")[-1]:
+        path += "/"
+
+    clean_base = urlunparse((parsed.scheme, parsed.netloc, path, "", "", ""))
+
+    if href.startswith("//"):
+        href = parsed.scheme + ":" + href
+
+    href = re.sub(r"^(\./|//)+", "", href)
+
+    base_parts = [p for p in path.strip("/").split("/") if p]
+
+    for i in range(len(base_parts)):
+        subpath = "/".join(base_parts[i:])
+        if href.startswith(subpath + "/") or href == subpath:
+            href = href[len(subpath) :].lstrip("/")
+            break
+
+    result = urljoin(clean_base, href)
+
+    if keep_query and parsed.query and result:
+        if "?" in result:
+            result += "&" + parsed.query
+        else:
+            result += "?" + parsed.query
+
+    if result and result != "/":
+        result = result.rstrip("/")
+
+    return result
+
+
+def random_path(rng: random.Random) -> str:
+    """Path of 0 to 4 random segments, with or without a trailing slash."""
+    segments = rng.choices(SEGMENTS, k=rng.randint(0, 4))
+    return "/".join(segments) + rng.choice(["", "/"])
+
+
+def build_random_cases(count: int, seed: int) -> List[Tuple[str, str]]:
+    """Random base/href pairs, the hrefs reusing base segments to hit the prefix stripping."""
+    rng = random.Random(seed)
+    cases = []
+
+    for _ in range(count):
+        base = (
+            rng.choice(["https", "http"])
+            + "://"
+            + rng.choice(HOSTS)
+            + "/"
+            + random_path(rng)
+            + rng.choice(QUERIES)
+        )
+        href = rng.choice(HREF_PREFIXES) + random_path(rng) + rng.choice(QUERIES) + rng.choice(FRAGMENTS)
+        cases.append((base, href))
+
+    return cases
+
+
+def find_mismatches(cases: List[Tuple[str, str]], keep_query: bool) -> List[str]:
+    """Describe every href resolved differently from the reference."""
+    hrefs_by_base: Dict[str, List[str]] = {}
+    for base, href in cases:
+        hrefs_by_base.setdefault(base, []).append(href)
+
+    mismatches = []
+    for base, hrefs in hrefs_by_base.items():
+        resolver = UrlResolver(base, keep_query)
+
+        # Twice over the same resolver: the second pass reads its cache
+        for href in hrefs + hrefs:
+            expected = reference_normalize_url(base, href, keep_query)
+            for name, got in (
+                ("UrlResolver", resolver.resolve(href)),
+                ("normalize_url", normalize_url(base, href, keep_query)),
+            ):
+                if got != expected:
+                    mismatches.append(
+                        f"{name} keep_query={keep_query} base={base!r} href={href!r}: "
+                        f"expected {expected!r}, got {got!r}"
+                    )
+
+    return mismatches
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cases", type=int, default=DEFAULT_CASES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    options = parser.parse_args(args)
+
+    cases = KNOWN_CASES + build_random_cases(options.cases, options.seed)
+
+    mismatches = []
+    for keep_query in (False, True):
+        mismatches += find_mismatches(cases, keep_query)
+
+    for mismatch in mismatches[:MAX_REPORTED]:
+        print(f"  MISMATCH {mismatch}")
+
+    print(f"{len(cases)} base/href pairs, {len(mismatches)} mismatches")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
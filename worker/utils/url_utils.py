@@ -1,13 +1,259 @@
 import re 
 
-from urllib.parse import urlparse, urlunparse, urljoin
-from typing import List, Optional
+from functools import lru_cache
+from urllib.parse import (
+    urlparse,
+    urlunparse,
+    urljoin,
+    urlsplit,
+    urlunsplit,
+    parse_qsl,
+    urlencode,
+    quote,
+)
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from worker.constants import (
+    TRACKING_PARAM_PREFIXES,
+    TRACKING_PARAMS,
+    SESSION_PARAMS,
+    HOST_KEEP_PARAMS,
+    AMBIGUOUS_PARAMS,
+    MULTI_PART_SUFFIXES,
+)
+
+CANONICAL_URL_CACHE_SIZE = 65536
+DEFAULT_PORTS = {"http": 80, "https": 443}
+DROPPED_PARAMS = frozenset(TRACKING_PARAMS + SESSION_PARAMS)
+JOB_DROPPED_PARAMS = frozenset(TRACKING_PARAMS) - frozenset(AMBIGUOUS_PARAMS)
+SESSION_PATH_PARAM_PATTERN = re.compile(
+    r";(?:" + "|".join(SESSION_PARAMS) + r")=[^/]*", re.IGNORECASE
+)
+PERCENT_ESCAPE_PATTERN = re.compile(r"%[0-9a-fA-F]{2}")
+PATH_SAFE_CHARS = "/%:@!$&'()*+,;=-._~"
+RELATIVE_PREFIX_PATTERN = re.compile(r"^(\./|//)+")
+
+def canonicalize_host(host: str) -> str:
+    """Lowercase a hostname, drop its trailing dot and encode IDNs as punycode."""
+    host = host.strip().rstrip(".").lower()
+
+    if not host.isascii():
+        try:
+            host = host.encode("idna").decode("ascii")
+        except UnicodeError:
+            pass
+
+    return host
+
+def get_site_host(url: str) -> str:
+    """Return the canonical host of a URL without its leading www."""
+    host = canonicalize_host(urlparse(url).hostname or "")
+    return host[4:] if host.startswith("www.") else host
+
+def get_registrable_domain(url: str) -> str:
+    """Return the registrable domain of a URL or host (jobs.example.co.uk -> example.co.uk)."""
+    host = canonicalize_host((urlparse(url).hostname or "") if "//" in url else url)
+    labels = host.split(".")
+
+    if len(labels) > 2 and ".".join(labels[-2:]) in MULTI_PART_SUFFIXES:
+        return ".".join(labels[-3:])
+
+    return ".".join(labels[-2:])
 
 def same_domain(url1: str, url2: str):
     """Compare two URLs ignoring www and case."""
-    n1 = urlparse(url1).netloc.lower().replace("www.", "")
-    n2 = urlparse(url2).netloc.lower().replace("www.", "")
-    return n1 == n2
+    return get_site_host(url1) == get_site_host(url2)
+
+def is_dropped_param(name: str, host: str, dropped_params: frozenset[str] = DROPPED_PARAMS) -> bool:
+    """Return True if a query parameter is tracking or session noise on this host."""
+    name = name.lower()
+
+    if name not in dropped_params and not name.startswith(tuple(TRACKING_PARAM_PREFIXES)):
+        return False
+
+    for domain, kept_params in HOST_KEEP_PARAMS.items():
+        if (host == domain or host.endswith("." + domain)) and name in kept_params:
+            return False
+
+    return True
+
+def canonicalize_path(path: str) -> str:
+    """Remove session path params, dot segments, empty segments and the trailing slash."""
+    path = SESSION_PATH_PARAM_PATTERN.sub("", path)
+
+    segments: List[str] = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if segments:
+                segments.pop()
+        elif segment and segment != ".":
+            segments.append(segment)
+
+    path = quote("/".join(segments), safe=PATH_SAFE_CHARS)
+    path = PERCENT_ESCAPE_PATTERN.sub(lambda m: m.group(0).upper(), path)
+
+    return "/" + path if path else ""
+
+def build_canonical_url(url: str, dropped_params: frozenset[str], keep_fragment: bool) -> str:
+    """Canonical form of an http(s) URL without `dropped_params` (see canonicalize_url)."""
+    url = url.strip()
+
+    try:
+        parsed = urlsplit(url)
+        port = parsed.port
+    except ValueError:
+        return url
+
+    scheme = parsed.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parsed.hostname:
+        return url
+
+    host = canonicalize_host(parsed.hostname)
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if not is_dropped_param(name, host, dropped_params)
+        )
+    )
+
+    if keep_fragment:
+        fragment = parsed.fragment
+    else:
+        fragment = parsed.fragment if parsed.fragment.startswith(("/", "!")) else ""
+
+    path = canonicalize_path(parsed.path) or ("/" if query or fragment else "")
+
+    return urlunsplit((scheme, netloc, path, query, fragment))
+
+@lru_cache(maxsize=CANONICAL_URL_CACHE_SIZE)
+def canonicalize_url(url: str) -> str:
+    """
+    Return the identity of an http(s) URL, used by crawl frontiers, visited sets
+    and page caches so variants of the same page are only seen once.
+
+    Lowercases the scheme and host (IDNs as punycode), drops default ports,
+    dot segments, duplicate and trailing slashes, tracking and session
+    parameters (see HOST_KEEP_PARAMS) and the fragment unless it is a
+    client-side route ("#/..." or "#!..."). Remaining parameters are sorted.
+
+    Other URLs (mailto:, relative, malformed) are returned stripped.
+    """
+    return build_canonical_url(url, DROPPED_PARAMS, keep_fragment=False)
+
+@lru_cache(maxsize=CANONICAL_URL_CACHE_SIZE)
+def canonicalize_job_url(url: str) -> str:
+    """
+    Return the stored form of a job posting URL. Like canonicalize_url, but
+    the fragment, session parameters and ambiguous ones (ref, source, src...)
+    are kept: they often tell postings of one page apart (careers#job-1) or
+    are needed to open the posting (view?ref=123). Only well-known tracking
+    parameters (utm_*, gclid...) are dropped.
+    """
+    return build_canonical_url(url, JOB_DROPPED_PARAMS, keep_fragment=True)
+
+def split_url_path(url: str) -> Tuple[str, List[str]]:
+    """
+    Split a URL without query and fragment into its "scheme://netloc" and
+    path segments, trailing slashes removed (https://a.com/jobs/ -> "https://a.com", ["", "jobs"]).
+    """
+    parsed = urlparse(url)
+    head = urlunparse((parsed.scheme, parsed.netloc, "", "", "", ""))
+    base_url = urlunparse(parsed._replace(query="", fragment="")).rstrip("/")
+
+    if not base_url.startswith(head):
+        head = ""
+
+    return head, base_url[len(head) :].split("/")
+
+def split_site_path(url: str) -> Tuple[str, List[str]]:
+    """Split a URL into its site host (without www) and non-empty path segments."""
+    return get_site_host(url), [p for p in urlparse(url).path.split("/") if p]
+
+class UrlTrieNode:
+    """Path segment of a UrlTrie, holding the URL added at this path (if any)."""
+
+    def __init__(self):
+        self.children: Dict[str, "UrlTrieNode"] = {}
+        self.url: Optional[str] = None
+
+class UrlTrie:
+    """
+    URLs indexed by host, then path segment, so root extraction, nearest
+    ancestor and scope queries walk one path instead of comparing every pair
+    of URLs. `split` gives the host and segments of a URL: split_url_path
+    (exact scheme and netloc) or split_site_path (same site, www ignored).
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str] = (),
+        split: Callable[[str], Tuple[str, List[str]]] = split_url_path,
+    ):
+        self.split = split
+        self.hosts: Dict[str, UrlTrieNode] = {}
+        self.nodes: List[UrlTrieNode] = []  # Nodes holding a URL, in insertion order
+
+        for url in urls:
+            self.add(url)
+
+    def add(self, url: str) -> UrlTrieNode:
+        """Add a URL (the first one added at a path is kept) and return the node of its path."""
+        host, segments = self.split(url)
+
+        node = self.hosts.setdefault(host, UrlTrieNode())
+        for segment in segments:
+            node = node.children.setdefault(segment, UrlTrieNode())
+
+        if node.url is None:
+            node.url = url
+            self.nodes.append(node)
+
+        return node
+
+    def find_ancestor(self, url: str) -> Tuple[Optional[str], int]:
+        """Nearest URL at or above the path of a URL, and how many segments below it the URL is."""
+        host, segments = self.split(url)
+
+        node = self.hosts.get(host)
+        ancestor: Optional[str] = None
+        ancestor_depth = depth = 0
+
+        while node is not None:
+            if node.url is not None:
+                ancestor, ancestor_depth = node.url, depth
+
+            if depth == len(segments):
+                break
+
+            node = node.children.get(segments[depth])
+            depth += 1
+
+        return ancestor, len(segments) - ancestor_depth
+
+    def nearest_ancestor(self, url: str) -> Optional[str]:
+        """Deepest URL of the trie whose path contains the URL (itself included)."""
+        return self.find_ancestor(url)[0]
+
+    def in_scope(self, url: str, max_levels: Optional[int] = None) -> bool:
+        """True if the URL is at or below a URL of the trie, at most `max_levels` segments deeper."""
+        ancestor, levels = self.find_ancestor(url)
+        return ancestor is not None and (max_levels is None or levels <= max_levels)
+
+    def roots(self) -> List[str]:
+        """URLs of the trie without an ancestor URL in it."""
+        roots = []
+        stack = list(self.hosts.values())
+
+        while stack:
+            node = stack.pop()
+            if node.url is not None:
+                roots.append(node.url)
+            else:
+                stack.extend(node.children.values())
+
+        return roots
 
 def deduplicate_by_base_url(urls: List[str]) -> List[str]:
     """
@@ -25,16 +271,15 @@ def deduplicate_by_base_url(urls: List[str]) -> List[str]:
     Returns:
         List[str]: Deduplicated URLs with clean, minimal base paths.
     """
-    seen: dict[str, str] = {}
+    trie = UrlTrie()
     for url in urls:
-        parsed = urlparse(url)
-        # --- Build a normalized base URL (remove query + fragment)
-        base_url = urlunparse(parsed._replace(query="", fragment="")).rstrip("/")
+        node = trie.add(url)
 
         # --- If we've seen this base before, keep the shortest version
-        if base_url not in seen or len(url) < len(seen[base_url]):
-            seen[base_url] = url
-    return list(seen.values())
+        if node.url is not None and len(url) < len(node.url):
+            node.url = url
+
+    return [node.url for node in trie.nodes if node.url is not None]
 
 def keep_only_roots(urls: set[str]) -> set[str]:
     """
@@ -65,99 +310,89 @@ def keep_only_roots(urls: set[str]) -> set[str]:
     Returns:
         List[str]: Deduplicated root-level URLs.
     """
-    cleaned = []
+    trie = UrlTrie()
     for url in urls:
-        parsed = urlparse(url)
-        normalized = urlunparse(parsed._replace(query="", fragment="")).rstrip("/")
-        if not normalized:  # Guard for empty or invalid URLs
-            continue
-        cleaned.append(normalized)
-
-    # --- Deduplicate and sort by domain + path length
-    cleaned = sorted(
-        set(cleaned), key=lambda u: (urlparse(u).netloc, len(urlparse(u).path))
-    )
-
-    # --- Keep only the shortest (root) URL per domain
-    roots: set[str] = set()
-    for url in cleaned:
-        parsed = urlparse(url)
-        # Check if already covered by an existing root
-        if not any(
-            parsed.netloc == urlparse(root).netloc and url.startswith(root + "/")
-            for root in roots
-        ):
-            roots.add(url)
+        host, segments = split_url_path(url)
+        normalized = host + "/".join(segments)
+        if normalized:  # Guard for empty or invalid URLs
+            trie.add(normalized)
 
-    return roots
-
-def normalize_url(base: str, href: str, keep_query=False) -> Optional[str]:
-    """Safely join href with base, correctly handling ../, mailto:, tel:, etc."""
+    return set(trie.roots())
 
-    if not href:
-        return None
+class UrlResolver:
+    """
+    Resolves the hrefs of one page against its URL, like normalize_url. The
+    base URL is parsed once and each href is resolved once, so resolving the
+    thousands of links of a listing page does not re-parse the base each time.
+    """
 
-    href = href.strip()
-    if not href:
-        return None
+    def __init__(self, base: str, keep_query: bool = False):
+        self.keep_query = keep_query
+        self.resolved: Dict[str, Optional[str]] = {}
 
-    if href.startswith(("mailto:", "tel:", "javascript:", "data:")):
-        return href
+        parsed = urlparse(base)
+        path = parsed.path or "/"
 
-    parsed = urlparse(base)
-    path = parsed.path or "/"
+        if not path.endswith("/") and "." not in path.split("/")[-1]:
+            path += "/"
 
-    if not path.endswith("/") and "." not in path.split("/")[-1]:
-        path += "/"
+        self.scheme = parsed.scheme
+        self.query = parsed.query
+        self.clean_base = urlunparse((parsed.scheme, parsed.netloc, path, "", "", ""))
 
-    clean_base = urlunparse((parsed.scheme, parsed.netloc, path, "", "", ""))
+        # for single page app like google jobs careers
+        # Example: base='/jobs/results/' + href='jobs/results/123' → remove the repeated 'jobs/results'
+        base_parts = [p for p in path.strip("/").split("/") if p]
+        self.subpaths = ["/".join(base_parts[i:]) for i in range(len(base_parts))]
 
-    if href.startswith("//"):
-        href = parsed.scheme + ":" + href
+    def resolve(self, href: str) -> Optional[str]:
+        """Safely join href with the base, correctly handling ../, mailto:, tel:, etc. (memoized)."""
+        if href not in self.resolved:
+            self.resolved[href] = self.join(href)
+        return self.resolved[href]
 
-    href = re.sub(r"^(\./|//)+", "", href)
+    def join(self, href: str) -> Optional[str]:
+        """Join an href with the base URL."""
+        if not href:
+            return None
 
-    # for single page app like google jobs careers
-    # Example: base='/jobs/results/' + href='jobs/results/123' → remove the repeated 'jobs/results'
-    base_parts = [p for p in path.strip("/").split("/") if p]
-    href_parts = [p for p in href.strip("/").split("/") if p]
+        href = href.strip()
+        if not href:
+            return None
 
-    for i in range(len(base_parts)):
-        subpath = "/".join(base_parts[i:])
-        if href.startswith(subpath + "/") or href == subpath:
-            href = href[len(subpath) :].lstrip("/")
-            break
+        if href.startswith(("mailto:", "tel:", "javascript:", "data:")):
+            return href
 
-    result = urljoin(clean_base, href)
+        if href.startswith("//"):
+            href = self.scheme + ":" + href
 
-    if keep_query and parsed.query and result:
-        if "?" in result:
-            result += "&" + parsed.query
-        else:
-            result += "?" + parsed.query
+        href = RELATIVE_PREFIX_PATTERN.sub("", href)
 
-    if result and result != "/":
-        result = result.rstrip("/")
+        for subpath in self.subpaths:
+            if href.startswith(subpath + "/") or href == subpath:
+                href = href[len(subpath) :].lstrip("/")
+                break
 
-    return result
+        result = urljoin(self.clean_base, href)
 
-def share_base_and_path_level(url1: str, url2: str) -> bool:
-        """Check if two URLs are in the same listing scope with at most one extra path level."""
-        parsed1 = urlparse(url1)
-        parsed2 = urlparse(url2)
+        if self.keep_query and self.query and result:
+            if "?" in result:
+                result += "&" + self.query
+            else:
+                result += "?" + self.query
 
-        domain1 = parsed1.netloc.lower().replace("www.", "")
-        domain2 = parsed2.netloc.lower().replace("www.", "")
-        if domain1 != domain2:
-            return False  # Different domains
+        if result and result != "/":
+            result = result.rstrip("/")
 
-        path1 = [p for p in parsed1.path.split("/") if p]
-        path2 = [p for p in parsed2.path.split("/") if p]
+        return result
 
-        if not path1[: len(path2)] == path2:
-            return False
-
-        if len(path1) > len(path2) + 1:
-            return False
+def normalize_url(base: str, href: str, keep_query=False) -> Optional[str]:
+    """
+    Safely join href with base, correctly handling ../, mailto:, tel:, etc.
+    Use a UrlResolver to resolve many hrefs of the same page.
+    """
+    return UrlResolver(base, keep_query).join(href)
 
-        return True
\ No newline at end of file
+def share_base_and_path_level(url1: str, url2: str) -> bool:
+        """Check if two URLs are in the same listing scope with at most one extra path level."""
+        return UrlTrie([url2], split=split_site_path).in_scope(url1, max_levels=1)
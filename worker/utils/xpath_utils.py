@@ -1,17 +1,19 @@
-from bs4 import BeautifulSoup
-from typing import Iterable
+from typing import Dict, Iterable, List, Tuple
 from typing import Optional
-from lxml import html
+from collections import defaultdict
+from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 def find_first_existing_xpath(
-    soup: BeautifulSoup,
+    dom: Optional[etree._Element],
     xpath_candidates: Iterable[str],
 ) -> Optional[str]:
     """
-    Given a BeautifulSoup document and candidate XPaths,
+    Given a parsed lxml document (e.g. PageSnapshot.tree) and candidate XPaths,
     return the first XPath that resolves to at least one element.
     """
-    dom = html.fromstring(str(soup))
+    if dom is None:
+        return None
 
     for xpath in xpath_candidates:
         try:
@@ -21,4 +23,75 @@ def find_first_existing_xpath(
         except Exception:
             continue
 
-    return None
\ No newline at end of file
+    return None
+
+def build_text_xpath_index(
+    soup: BeautifulSoup,
+) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Index the text of every element of a soup, in one traversal.
+
+    Returns:
+        texts: unique texts (element.get_text(" ", strip=True)), document order
+        mapping: dict {text: [XPath of every element with that text]}
+
+    Stripped strings are collected once in document order and each element
+    keeps the range of its descendants, so its text is a slice join instead of
+    a subtree walk. Sibling positions are counted while walking, XPaths are
+    built from the parent's once every sibling is known.
+    """
+    strings: List[str] = []  # Stripped main content strings, document order
+    elements: List[Tuple[Tag, int, int]] = []  # (tag, parent entry, start), preorder
+    ends: List[int] = []  # End of each element's strings
+    positions: List[int] = []  # 1-based position among same-name siblings
+    name_counts: List[Dict[str, int]] = [defaultdict(int)]  # Children names per entry (0: soup)
+
+    path: List[int] = []  # Open element entries (1-based)
+
+    for node in soup.descendants:
+        parent = node.parent
+
+        while path and elements[path[-1] - 1][0] is not parent:
+            ends[path.pop() - 1] = len(strings)
+
+        if isinstance(node, Tag):
+            parent_entry = path[-1] if path else 0
+            name_counts[parent_entry][node.name] += 1
+
+            elements.append((node, parent_entry, len(strings)))
+            ends.append(len(strings))
+            positions.append(name_counts[parent_entry][node.name])
+            name_counts.append(defaultdict(int))
+            path.append(len(elements))
+
+        elif type(node) in Tag.MAIN_CONTENT_STRING_TYPES:
+            stripped = node.strip()
+            if stripped:
+                strings.append(stripped)
+
+    while path:
+        ends[path.pop() - 1] = len(strings)
+
+    texts: List[str] = []
+    mapping: Dict[str, List[str]] = defaultdict(list)
+    xpaths = [""]  # XPath per entry (0: soup)
+
+    for i, (tag, parent_entry, start) in enumerate(elements):
+        if name_counts[parent_entry][tag.name] > 1:
+            step = f"{tag.name}[{positions[i]}]"
+        else:
+            step = tag.name
+        xpaths.append(f"{xpaths[parent_entry]}/{step}")
+
+        if tag.interesting_string_types in (None, Tag.MAIN_CONTENT_STRING_TYPES):
+            text = " ".join(strings[start : ends[i]])
+        else:
+            # <template>, <script>... read their own string type
+            text = tag.get_text(" ", strip=True)
+
+        if text:
+            if text not in mapping:
+                texts.append(text)
+            mapping[text].append(xpaths[-1])
+
+    return texts, mapping